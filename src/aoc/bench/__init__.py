@@ -0,0 +1,20 @@
+"""Benchmark AoC solutions and detect timing regressions"""
+from aoc.bench.results import (
+    Regression,
+    find_regressions,
+    git_revision,
+    load_results,
+    save_results,
+)
+from aoc.bench.timing import StageStats, benchmark_solution, summarize
+
+__all__ = [
+    "Regression",
+    "StageStats",
+    "benchmark_solution",
+    "find_regressions",
+    "git_revision",
+    "load_results",
+    "save_results",
+    "summarize",
+]
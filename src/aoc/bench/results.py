@@ -0,0 +1,96 @@
+"""Store benchmark results keyed by git revision"""
+import json
+import os
+import subprocess
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+from aoc import ROOT_DIR
+
+RESULTS_FILE = ROOT_DIR.parent.parent / "bench_results.json"
+
+# results[revision]["2023-05"]["parse"] = {"min": ..., "median": ..., ...}
+Results = dict[str, dict[str, dict[str, dict]]]
+
+
+@dataclass
+class Regression:
+    """A stage whose median time grew past the threshold."""
+
+    key: str
+    stage: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline
+
+
+def day_key(year: int, day: int) -> str:
+    return f"{year}-{day:02}"
+
+
+def git_revision() -> str:
+    """Return the short revision of HEAD, marked dirty if the tree has changes."""
+
+    def git(*args):
+        return subprocess.run(
+            ["git", *args], cwd=ROOT_DIR, capture_output=True, text=True, check=True
+        ).stdout.strip()
+
+    try:
+        revision = git("rev-parse", "--short", "HEAD")
+        if git("status", "--porcelain", "--untracked-files=no"):
+            revision += "-dirty"
+    except (OSError, subprocess.CalledProcessError):
+        revision = "unknown"
+    return revision
+
+
+def load_results(path: Path = RESULTS_FILE) -> Results:
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_results(results: Results, path: Path = RESULTS_FILE) -> None:
+    with open(path, "w") as f:
+        json.dump(results, f, indent=2)
+
+
+def previous_revision(results: Results, revision: str) -> Optional[str]:
+    """Return the most recently recorded revision other than `revision`."""
+    for other in reversed(list(results)):
+        if other != revision:
+            return other
+    return None
+
+
+def find_regressions(
+    current: dict[str, dict[str, dict]],
+    baseline: dict[str, dict[str, dict]],
+    threshold: float = 0.2,
+    min_delta: float = 0.001,
+) -> list[Regression]:
+    """Compare median times against a baseline.
+
+    A stage regresses when it is more than `threshold` (a fraction) slower than
+    the baseline and at least `min_delta` seconds slower, so sub-millisecond
+    noise doesn't get flagged.
+    """
+    regressions = []
+    for key, stages in current.items():
+        for stage, stats in stages.items():
+            old = baseline.get(key, {}).get(stage)
+            if old is None:
+                continue
+            new_median, old_median = stats["median"], old["median"]
+            if (
+                new_median > old_median * (1 + threshold)
+                and new_median - old_median >= min_delta
+            ):
+                regressions.append(Regression(key, stage, old_median, new_median))
+    return regressions
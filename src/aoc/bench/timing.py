@@ -0,0 +1,55 @@
+"""Repeated timing of solution stages"""
+import statistics
+from dataclasses import asdict, dataclass
+from types import ModuleType
+from typing import Union
+
+from aoc.registry import Solver, as_solver
+from aoc.runner import STAGES, solve, timed
+
+
+@dataclass
+class StageStats:
+    """Summary of the wall times of one stage, in seconds."""
+
+    min: float
+    median: float
+    p95: float
+    runs: int
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+def summarize(samples: list[float]) -> StageStats:
+    """Reduce timing samples to min, median and 95th percentile."""
+    if len(samples) > 1:
+        p95 = statistics.quantiles(samples, n=20, method="inclusive")[-1]
+    else:
+        p95 = samples[0]
+    return StageStats(
+        min=min(samples),
+        median=statistics.median(samples),
+        p95=p95,
+        runs=len(samples),
+    )
+
+
+def benchmark_solution(
+    solution: Union[Solver, ModuleType], input_data: str, repeat: int = 5
+) -> dict[str, StageStats]:
+    """Time parse and both parts of a solution `repeat` times.
+
+    Every part is given freshly parsed data since solvers may mutate it.
+    """
+    solver = as_solver(solution)
+    samples = {stage: [] for stage in STAGES}
+    for _ in range(repeat):
+        _, elapsed = timed(solver.parse, input_data)
+        samples["parse"].append(elapsed)
+        for stage in ("part_one", "part_two"):
+            parsed_data = solver.parse(input_data)
+            func = getattr(solver, STAGES[stage])
+            _, elapsed = timed(solve, func, parsed_data, input_data)
+            samples[stage].append(elapsed)
+    return {stage: summarize(times) for stage, times in samples.items()}
@@ -0,0 +1,109 @@
+"""Opt-in profiling hooks for solution stages.
+
+Both profilers are used as the `hook` of `aoc.runner.run_solution`, which enters
+`hook(stage)` around parse, part one and part two.
+"""
+import cProfile
+import os
+import pstats
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Union
+
+from aoc import ROOT_DIR
+
+PROFILE_DIR = ROOT_DIR.parent.parent / "profiles"
+
+
+@dataclass
+class HotFunction:
+    location: str
+    calls: int
+    total_time: float
+    cumulative_time: float
+
+
+@dataclass
+class AllocationSite:
+    location: str
+    size: int
+    count: int
+
+
+@dataclass
+class MemoryReport:
+    peak: int
+    sites: list[AllocationSite] = field(default_factory=list)
+
+
+class StageProfiler:
+    """Run each stage under cProfile and dump a `.pstats` file per stage."""
+
+    def __init__(
+        self, prefix: str, output_dir: Union[str, Path] = PROFILE_DIR, top: int = 10
+    ):
+        self.prefix = prefix
+        self.output_dir = Path(output_dir)
+        self.top = top
+        self.files: dict[str, Path] = {}
+        self.hot: dict[str, list[HotFunction]] = {}
+
+    @contextmanager
+    def __call__(self, stage: str):
+        profile = cProfile.Profile()
+        profile.enable()
+        try:
+            yield
+        finally:
+            profile.disable()
+            os.makedirs(self.output_dir, exist_ok=True)
+            path = self.output_dir / f"{self.prefix}-{stage}.pstats"
+            profile.dump_stats(path)
+            self.files[stage] = path
+            self.hot[stage] = hot_functions(pstats.Stats(profile), self.top)
+
+
+def hot_functions(stats: pstats.Stats, top: int = 10) -> list[HotFunction]:
+    """Return the functions with the most time spent in their own body."""
+    ret = []
+    for (filename, line, name), (_, calls, tt, ct, _) in stats.stats.items():
+        location = f"{os.path.basename(filename)}:{line}({name})"
+        ret.append(HotFunction(location, calls, tt, ct))
+    ret.sort(key=lambda f: f.total_time, reverse=True)
+    return ret[:top]
+
+
+class MemoryTracer:
+    """Trace allocations of each stage with tracemalloc."""
+
+    def __init__(self, top: int = 10, frames: int = 1):
+        self.top = top
+        self.frames = frames
+        self.reports: dict[str, MemoryReport] = {}
+
+    @contextmanager
+    def __call__(self, stage: str):
+        tracemalloc.start(self.frames)
+        try:
+            yield
+            _, peak = tracemalloc.get_traced_memory()
+            snapshot = tracemalloc.take_snapshot()
+        finally:
+            tracemalloc.stop()
+        snapshot = snapshot.filter_traces(
+            [
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, __file__),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+            ]
+        )
+        report = MemoryReport(peak)
+        for statistic in snapshot.statistics("lineno")[: self.top]:
+            frame = statistic.traceback[0]
+            location = f"{os.path.basename(frame.filename)}:{frame.lineno}"
+            report.sites.append(
+                AllocationSite(location, statistic.size, statistic.count)
+            )
+        self.reports[stage] = report
@@ -0,0 +1,315 @@
+"""Index of every solver in the repository, whatever layout it was written in.
+
+Solutions have moved around over the years:
+
+- `package`: `src/aoc/y{year}/d{day:02}.py` with `parse`, `solve_part_one` and
+  `solve_part_two`.
+- `aoc`: `{year}/{day:02}/aoc{year}{day:02}.py` with `parse`, `part1` and `part2`.
+- `legacy`: scripts such as `2018/{day}.py`, `2020/test_{day}.py`,
+  `2020/day_{day:02}/test_{day:02}.py` or `src/aoc/2021/{day:02}.py`. Most only have a
+  `main(args)` that reads `args.file`, so they may lack part functions.
+
+Files are found by path and their top-level functions read with `ast`, so nothing
+is imported until a `Solver` is used. The index is cached in `INDEX_FILE` and only
+files whose size or mtime changed are read again.
+"""
+import ast
+import functools
+import importlib
+import importlib.util
+import json
+import os
+import re
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, Iterable, Optional, Union
+
+from aoc import ROOT_DIR
+
+REPO_DIR = ROOT_DIR.parent.parent
+INDEX_FILE = Path(os.environ.get("AOC_SOLVER_INDEX", REPO_DIR / ".solver_index.json"))
+INDEX_VERSION = 1
+
+# (layout, pattern) in order of preference when a day has several solvers. Patterns
+# are matched against paths relative to the repository and capture year and day.
+LAYOUTS = [
+    ("package", re.compile(r"src/aoc/y(\d{4})/d(\d{2})\.py")),
+    ("aoc", re.compile(r"(\d{4})/(\d{2})/aoc\1\2\.py")),
+    ("legacy", re.compile(r"src/aoc/(\d{4})/(\d{2})\.py")),
+    ("legacy", re.compile(r"(\d{4})/(?:test_)?(\d{1,2})\.py")),
+    ("legacy", re.compile(r"(\d{4})/day_(\d{2})/(?:test_)?\d+\.py")),
+    ("legacy", re.compile(r"(\d{4})/(\d{1,2})/\d+\.py")),
+]
+
+# Solver attribute -> function names it may have in a module
+ROLES = {
+    "parse": ("parse",),
+    "part1": ("solve_part_one", "part1", "part_one"),
+    "part2": ("solve_part_two", "part2", "part_two"),
+}
+
+
+class SolverNotFoundError(LookupError):
+    """Raised when no solver is indexed for a day."""
+
+
+@dataclass(frozen=True)
+class SolverSpec:
+    """Where a solver lives and which of its functions fill each role."""
+
+    year: int
+    day: int
+    layout: str
+    path: str
+    functions: dict[str, str]
+
+    @property
+    def module_name(self) -> str:
+        if self.layout == "package":
+            return f"aoc.y{self.year}.d{self.day:02}"
+        # Legacy files aren't importable by name, give them a unique one
+        return "_aoc_" + re.sub(r"\W", "_", self.path.removesuffix(".py"))
+
+    @property
+    def runnable(self) -> bool:
+        return "part1" in self.functions and "part2" in self.functions
+
+
+def resolve_functions(names: Iterable[str]) -> dict[str, str]:
+    """Map each role to the first of its candidate names that is defined."""
+    names = set(names)
+    ret = {}
+    for role, candidates in ROLES.items():
+        for candidate in candidates:
+            if candidate in names:
+                ret[role] = candidate
+                break
+    return ret
+
+
+def top_level_functions(path: Path) -> list[str]:
+    try:
+        tree = ast.parse(path.read_bytes(), filename=str(path))
+    except (SyntaxError, ValueError):
+        return []
+    return [
+        node.name
+        for node in tree.body
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))
+    ]
+
+
+def match_layout(relative_path: str) -> Optional[tuple[str, int, int, int]]:
+    """Return (layout, year, day, priority) for a solver path, or None."""
+    for priority, (layout, pattern) in enumerate(LAYOUTS):
+        match = pattern.fullmatch(relative_path)
+        if match:
+            year, day = int(match.group(1)), int(match.group(2))
+            if 1 <= day <= 25:
+                return layout, year, day, priority
+    return None
+
+
+class Registry:
+    """Solvers found under a repository, keyed by (year, day)."""
+
+    def __init__(
+        self,
+        repo_dir: Union[str, Path] = REPO_DIR,
+        index_file: Union[str, Path, None] = None,
+    ):
+        self.repo_dir = Path(repo_dir)
+        self.index_file = Path(index_file) if index_file else INDEX_FILE
+        self._specs: Optional[list[SolverSpec]] = None
+
+    def candidate_paths(self) -> list[Path]:
+        paths = list(self.repo_dir.glob("src/aoc/y*/d*.py"))
+        paths.extend(self.repo_dir.glob("src/aoc/[0-9]*/*.py"))
+        for entry in os.scandir(self.repo_dir):
+            if entry.is_dir() and re.fullmatch(r"\d{4}", entry.name):
+                paths.extend(Path(entry.path).rglob("*.py"))
+        return paths
+
+    def _load_index(self) -> dict[str, dict[str, Any]]:
+        try:
+            with open(self.index_file) as f:
+                index = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+        if index.get("version") != INDEX_VERSION:
+            return {}
+        return index.get("files", {})
+
+    def _write_index(self, files: dict[str, dict[str, Any]]) -> None:
+        os.makedirs(self.index_file.parent, exist_ok=True)
+        tmp_path = self.index_file.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "w") as f:
+            json.dump({"version": INDEX_VERSION, "files": files}, f, sort_keys=True)
+        os.replace(tmp_path, self.index_file)
+
+    def refresh(self) -> list[SolverSpec]:
+        """Rebuild the specs, reading only files that changed since the last index."""
+        cached = self._load_index()
+        files = {}
+        found = []
+        for path in self.candidate_paths():
+            relative_path = path.relative_to(self.repo_dir).as_posix()
+            layout = match_layout(relative_path)
+            if layout is None:
+                continue
+            stat = path.stat()
+            entry = cached.get(relative_path)
+            if not (
+                entry
+                and entry["mtime_ns"] == stat.st_mtime_ns
+                and entry["size"] == stat.st_size
+            ):
+                entry = {
+                    "mtime_ns": stat.st_mtime_ns,
+                    "size": stat.st_size,
+                    "functions": resolve_functions(top_level_functions(path)),
+                }
+            files[relative_path] = entry
+            found.append((layout, relative_path, entry["functions"]))
+        if files != cached:
+            self._write_index(files)
+
+        found.sort(key=lambda f: (f[0][1], f[0][2], f[0][3], f[1]))
+        self._specs = [
+            SolverSpec(year, day, layout, relative_path, functions)
+            for (layout, year, day, _), relative_path, functions in found
+        ]
+        return self._specs
+
+    @property
+    def specs(self) -> list[SolverSpec]:
+        if self._specs is None:
+            self.refresh()
+        return self._specs
+
+    def find(self, year: int, day: int, layout: Optional[str] = None) -> SolverSpec:
+        """Return the preferred solver for a day.
+
+        The first runnable spec wins, so that every day listed by `days()` can be
+        run. Days without one fall back to their first spec.
+        """
+        specs = [
+            spec
+            for spec in self.specs
+            if (spec.year, spec.day) == (year, day) and layout in (None, spec.layout)
+        ]
+        if not specs:
+            raise SolverNotFoundError(f"No solver for {year} day {day}")
+        return next((spec for spec in specs if spec.runnable), specs[0])
+
+    def days(
+        self, years: Optional[Iterable[int]] = None, runnable: bool = True
+    ) -> list[tuple[int, int]]:
+        """Return the sorted (year, day) pairs that have a solver."""
+        years = set(years) if years else None
+        return sorted(
+            {
+                (spec.year, spec.day)
+                for spec in self.specs
+                if (years is None or spec.year in years)
+                and (spec.runnable or not runnable)
+            }
+        )
+
+
+_registry: Optional[Registry] = None
+
+
+def get_registry() -> Registry:
+    global _registry
+    if _registry is None:
+        _registry = Registry()
+    return _registry
+
+
+def import_spec(spec: SolverSpec, repo_dir: Path = REPO_DIR) -> ModuleType:
+    if spec.layout == "package":
+        return importlib.import_module(spec.module_name)
+    path = repo_dir / spec.path
+    module = sys.modules.get(spec.module_name)
+    if module is not None and module.__file__ == str(path):
+        return module
+    module_spec = importlib.util.spec_from_file_location(spec.module_name, path)
+    module = importlib.util.module_from_spec(module_spec)
+    # Register first, dataclasses look their module up while it executes
+    sys.modules[spec.module_name] = module
+    try:
+        module_spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[spec.module_name]
+        raise
+    return module
+
+
+def identity(input_data):
+    return input_data
+
+
+class Solver:
+    """Uniform `parse`/`part1`/`part2` access to a day's solution.
+
+    The module is imported on first use. Solvers without a `parse` function get
+    one that returns the input unchanged; missing parts are None.
+    """
+
+    def __init__(
+        self,
+        year: int,
+        day: int,
+        layout: Optional[str] = None,
+        registry: Optional[Registry] = None,
+    ):
+        registry = registry or get_registry()
+        self.spec = registry.find(year, day, layout)
+        self.repo_dir = registry.repo_dir
+        self.year, self.day = year, day
+
+    @classmethod
+    def from_module(cls, module: Any, year: int = 0, day: int = 0) -> "Solver":
+        """Wrap an already loaded module or namespace of solution functions."""
+        solver = cls.__new__(cls)
+        solver.year, solver.day = year, day
+        solver.spec = None
+        solver.__dict__["module"] = module
+        return solver
+
+    def __repr__(self) -> str:
+        layout = self.spec.layout if self.spec else "module"
+        return f"Solver({self.year}, {self.day}, layout={layout!r})"
+
+    @functools.cached_property
+    def module(self) -> ModuleType:
+        return import_spec(self.spec, self.repo_dir)
+
+    def _function(self, role: str) -> Optional[Callable]:
+        for name in ROLES[role]:
+            func = getattr(self.module, name, None)
+            if func is not None:
+                return func
+        return None
+
+    @property
+    def parse(self) -> Callable:
+        return self._function("parse") or identity
+
+    @property
+    def part1(self) -> Optional[Callable]:
+        return self._function("part1")
+
+    @property
+    def part2(self) -> Optional[Callable]:
+        return self._function("part2")
+
+
+def as_solver(solution: Any, year: int = 0, day: int = 0) -> Solver:
+    """Return `solution` as a Solver, wrapping modules and namespaces."""
+    if isinstance(solution, Solver):
+        return solution
+    return Solver.from_module(solution, year, day)
@@ -0,0 +1,322 @@
+"""Run AoC solutions in-process and time each stage."""
+import inspect
+import multiprocessing
+import os
+import signal
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field
+from multiprocessing.connection import Connection, wait
+from types import ModuleType
+from typing import Any, Callable, ContextManager, Iterable, Iterator, Optional, Union
+
+from aoc.registry import Solver, SolverNotFoundError, as_solver, get_registry
+from aoc.utils.inputs import get_input
+
+# Stage name -> Solver attribute
+STAGES = {
+    "parse": "parse",
+    "part_one": "part1",
+    "part_two": "part2",
+}
+
+
+@dataclass
+class DayResult:
+    """Answers and wall times for a single day."""
+
+    year: int
+    day: int
+    answers: dict[str, Any] = field(default_factory=dict)
+    timings: dict[str, float] = field(default_factory=dict)
+    error: Optional[str] = None
+    # ok, error, timeout, memory or crashed
+    status: str = "ok"
+    # The stage that was running when the day failed
+    stage: Optional[str] = None
+
+    @property
+    def total(self) -> float:
+        return sum(self.timings.values())
+
+
+def module_name(year: int, day: int) -> str:
+    """Return the module name of a solution.
+
+    Python doesn't like `import aoc.2021.01`, therefore use `import aoc.y2021.d01`
+    """
+    return f"aoc.y{year}.d{day:02}"
+
+
+def discover_days(years: Optional[Iterable[int]] = None) -> list[tuple[int, int]]:
+    """Find every day with a runnable solver, in any layout, without importing it."""
+    return get_registry().days(years)
+
+
+def load_solution(year: int, day: int) -> Solver:
+    """Look up the solver for a day, its module is imported on first use."""
+    return Solver(year, day)
+
+
+def timed(func: Callable, *args) -> tuple[Any, float]:
+    """Call a function and return its result and wall time in seconds."""
+    start = time.perf_counter()
+    ret = func(*args)
+    return ret, time.perf_counter() - start
+
+
+def solve(func: Callable, parsed_data, input_data: str):
+    """Call a solver.
+
+    Some solvers (2022 day 16) also want the raw input as a second argument.
+    """
+    required = [
+        p
+        for p in inspect.signature(func).parameters.values()
+        if p.default is inspect.Parameter.empty
+    ]
+    if len(required) > 1:
+        return func(parsed_data, input_data)
+    return func(parsed_data)
+
+
+def run_solution(
+    solution: Union[Solver, ModuleType],
+    input_data: str,
+    year: int = 0,
+    day: int = 0,
+    hook: Optional[Callable[[str], ContextManager]] = None,
+) -> DayResult:
+    """Run parse and both parts of a solver or solution module.
+
+    Solvers are free to mutate their parsed data, so part two gets a freshly
+    parsed copy just like `main()` does. Only the first parse is timed, the second
+    one runs in the `part_two` stage so that its limits and hooks cover it.
+
+    `hook(stage)` is entered around each timed stage, e.g. to profile it.
+    """
+    hook = hook or (lambda stage: nullcontext())
+    solver = as_solver(solution, year, day)
+    result = DayResult(year=year, day=day)
+    with hook("parse"):
+        parsed_data, result.timings["parse"] = timed(solver.parse, input_data)
+    for stage in ("part_one", "part_two"):
+        func = getattr(solver, STAGES[stage])
+        if func is None:
+            raise SolverNotFoundError(f"{solver!r} has no {STAGES[stage]}")
+        with hook(stage):
+            if stage == "part_two":
+                parsed_data = solver.parse(input_data)
+            answer, elapsed = timed(solve, func, parsed_data, input_data)
+        result.answers[stage] = answer
+        result.timings[stage] = elapsed
+    return result
+
+
+def run_day(
+    year: int,
+    day: int,
+    input_data: Optional[str] = None,
+    allow_fetch: Optional[bool] = None,
+    hook: Optional[Callable[[str], ContextManager]] = None,
+) -> DayResult:
+    """Run a day's solver on its puzzle input."""
+    solver = load_solution(year, day)
+    if input_data is None:
+        input_data = get_input(year, day, allow_fetch=allow_fetch)
+    return run_solution(solver, input_data, year=year, day=day, hook=hook)
+
+
+def run_day_safely(year: int, day: int) -> DayResult:
+    """Run a day, recording any exception on the result instead of raising."""
+    try:
+        return run_day(year, day)
+    except Exception:
+        return DayResult(
+            year=year, day=day, error=traceback.format_exc(), status="error"
+        )
+
+
+def run_days(
+    days: Iterable[tuple[int, int]],
+    workers: Optional[int] = None,
+    limits: Optional["Limits"] = None,
+) -> Iterator[DayResult]:
+    """Run days across a process pool, yielding results as they finish.
+
+    Defaults to one worker per core so slow days don't hold up the rest. With
+    `limits` every day gets its own worker process that is killed when it
+    overruns, see `run_days_limited`.
+    """
+    if limits is not None:
+        yield from run_days_limited(days, limits, workers=workers)
+        return
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+        futures = [executor.submit(run_day_safely, year, day) for year, day in days]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+@dataclass
+class Limits:
+    """Budgets for each stage of a day run in a worker process.
+
+    `time` is the wall-clock limit of each stage in seconds. `memory` caps the
+    worker's address space in bytes; Linux doesn't enforce RLIMIT_RSS, and the
+    address space is an upper bound of the resident set. `grace` is how long the
+    watchdog waits for a worker to report its own timeout before killing it.
+    """
+
+    time: Optional[float] = None
+    memory: Optional[int] = None
+    grace: float = 1.0
+
+
+class StageTimeout(BaseException):
+    """Raised in a worker when a stage overruns its time limit.
+
+    It derives from BaseException so that solvers catching Exception don't
+    swallow it.
+    """
+
+
+@contextmanager
+def deadline(seconds: Optional[float]):
+    """Raise StageTimeout in the main thread if the block runs too long."""
+    if seconds is None:
+        yield
+        return
+
+    def expired(signum, frame):
+        raise StageTimeout(f"Exceeded {seconds}s")
+
+    previous = signal.signal(signal.SIGALRM, expired)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+def limited_worker(year: int, day: int, limits: Limits, conn: Connection) -> None:
+    """Run a day under `limits`, reporting each stage and the result on `conn`."""
+    if limits.memory is not None:
+        import resource
+
+        resource.setrlimit(resource.RLIMIT_AS, (limits.memory, limits.memory))
+    stage = "load"
+
+    @contextmanager
+    def hook(name):
+        nonlocal stage
+        stage = name
+        conn.send(("stage", name))
+        with deadline(limits.time):
+            yield
+
+    def failed(status):
+        return DayResult(
+            year, day, error=traceback.format_exc(), status=status, stage=stage
+        )
+
+    try:
+        result = run_day(year, day, hook=hook)
+    except StageTimeout:
+        result = failed("timeout")
+    except MemoryError:
+        result = failed("memory")
+    except Exception:
+        result = failed("error")
+    conn.send(("result", result))
+    conn.close()
+
+
+class LimitedRun:
+    """A worker process running one day, and the watchdog state for it."""
+
+    def __init__(self, year: int, day: int, limits: Limits):
+        self.year, self.day, self.limits = year, day, limits
+        self.conn, sender = multiprocessing.Pipe(duplex=False)
+        self.process = multiprocessing.Process(
+            target=limited_worker, args=(year, day, limits, sender), daemon=True
+        )
+        self.process.start()
+        sender.close()
+        self.start_stage("load")
+
+    def start_stage(self, stage: str) -> None:
+        self.stage = stage
+        self.deadline = None
+        if self.limits.time is not None:
+            self.deadline = time.monotonic() + self.limits.time + self.limits.grace
+
+    def receive(self) -> Optional[DayResult]:
+        """Handle a message from the worker, returning its result once done."""
+        try:
+            kind, value = self.conn.recv()
+        except EOFError:
+            self.process.join()
+            return self.finish(
+                status="crashed",
+                error=f"Worker exited with code {self.process.exitcode}",
+            )
+        if kind == "stage":
+            self.start_stage(value)
+            return None
+        self.process.join()
+        self.conn.close()
+        return value
+
+    def kill(self) -> DayResult:
+        self.process.kill()
+        self.process.join()
+        return self.finish(
+            status="timeout",
+            error=f"{self.stage} didn't finish within {self.limits.time}s",
+        )
+
+    def finish(self, status: str, error: str) -> DayResult:
+        self.conn.close()
+        return DayResult(
+            self.year, self.day, error=error, status=status, stage=self.stage
+        )
+
+
+def run_days_limited(
+    days: Iterable[tuple[int, int]], limits: Limits, workers: Optional[int] = None
+) -> Iterator[DayResult]:
+    """Run each day in its own worker process, yielding results as they finish.
+
+    Workers stop themselves when a stage overruns or runs out of memory. The
+    watchdog kills workers that don't respond `limits.grace` seconds after their
+    deadline, e.g. while stuck in C code, and reports them as timed out.
+    """
+    pending = list(days)[::-1]
+    workers = workers or os.cpu_count()
+    running: dict[Connection, LimitedRun] = {}
+    while pending or running:
+        while pending and len(running) < workers:
+            run = LimitedRun(*pending.pop(), limits)
+            running[run.conn] = run
+
+        deadlines = [r.deadline for r in running.values() if r.deadline is not None]
+        timeout = max(0, min(deadlines) - time.monotonic()) if deadlines else None
+        for conn in wait(list(running), timeout):
+            result = running[conn].receive()
+            if result is not None:
+                del running[conn]
+                yield result
+
+        now = time.monotonic()
+        for conn, run in list(running.items()):
+            if run.deadline is not None and now >= run.deadline:
+                del running[conn]
+                yield run.kill()
+
+
+def run_day_limited(year: int, day: int, limits: Limits) -> DayResult:
+    """Run a single day in a worker process under `limits`."""
+    return next(run_days_limited([(year, day)], limits, workers=1))
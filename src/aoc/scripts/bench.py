@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+
+import argparse
+import sys
+from pathlib import Path
+
+from rich.table import Table
+
+from aoc.bench import (
+    benchmark_solution,
+    find_regressions,
+    git_revision,
+    load_results,
+    save_results,
+)
+from aoc.bench.results import RESULTS_FILE, day_key, previous_revision
+from aoc.runner import discover_days, load_solution
+from aoc.scripts.run_day import format_time
+from aoc.utils.console import console
+from aoc.utils.inputs import get_input
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark Advent of Code solutions against a stored baseline."
+    )
+    parser.add_argument(
+        "--year",
+        type=int,
+        action="append",
+        help="Specify a year, may be repeated (default is every year)",
+    )
+    parser.add_argument(
+        "--day",
+        type=int,
+        action="append",
+        help="Specify a day, may be repeated (default is every day)",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="Number of runs per stage (default 5)"
+    )
+    parser.add_argument(
+        "--baseline",
+        default=None,
+        help="Revision to compare against (default is the last recorded one)",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="Flag stages whose median is this fraction slower (default 0.2)",
+    )
+    parser.add_argument(
+        "--results",
+        type=Path,
+        default=RESULTS_FILE,
+        help=f"Results file (default {RESULTS_FILE.name})",
+    )
+
+    args = parser.parse_args()
+
+    days = [
+        (year, day)
+        for year, day in discover_days(args.year)
+        if args.day is None or day in args.day
+    ]
+    revision = git_revision()
+    results = load_results(args.results)
+    baseline_revision = args.baseline or previous_revision(results, revision)
+    current = results.setdefault(revision, {})
+
+    table = Table(title=f"Benchmarks at {revision} ({args.repeat} runs)")
+    table.add_column("Day")
+    table.add_column("Stage")
+    for column in ("Min", "Median", "p95"):
+        table.add_column(column, justify="right")
+
+    for year, day in days:
+        key = day_key(year, day)
+        try:
+            stats = benchmark_solution(
+                load_solution(year, day), get_input(year, day), repeat=args.repeat
+            )
+        except Exception as e:
+            console.log(f"[red]{key} failed: {e!r}")
+            continue
+        current[key] = {stage: s.to_dict() for stage, s in stats.items()}
+        for stage, s in stats.items():
+            table.add_row(
+                key,
+                stage,
+                format_time(s.min),
+                format_time(s.median),
+                format_time(s.p95),
+            )
+    console.print(table)
+    save_results(results, args.results)
+
+    if baseline_revision is None:
+        console.log("No baseline recorded yet")
+        return
+    regressions = find_regressions(
+        current, results.get(baseline_revision, {}), threshold=args.threshold
+    )
+    for r in regressions:
+        console.log(
+            f"[red]{r.key} {r.stage} regressed {r.ratio:.2f}x vs {baseline_revision}: "
+            f"{format_time(r.baseline)} -> {format_time(r.current)}"
+        )
+    if regressions:
+        sys.exit(1)
+    console.log(f"No regressions vs {baseline_revision}")
+
+
+if __name__ == "__main__":
+    main()
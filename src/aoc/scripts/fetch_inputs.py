@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+
+import argparse
+
+from aoc.runner import discover_days
+from aoc.utils.console import console
+from aoc.utils.inputs import InputStore, example_kind, get_store
+
+
+def fetch_day(store: InputStore, year: int, day: int) -> None:
+    """Store the puzzle input and every example for a day."""
+    from aocd.models import Puzzle
+
+    puzzle = Puzzle(year=year, day=day)
+    store.put(year, day, "input", puzzle.input_data)
+    for index, example in enumerate(puzzle.examples):
+        store.put(year, day, example_kind(index), example.input_data)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Populate the offline input store from aocd or a local file."
+    )
+    parser.add_argument(
+        "--year",
+        type=int,
+        action="append",
+        help="Specify a year, may be repeated (default is every year)",
+    )
+    parser.add_argument(
+        "--day",
+        type=int,
+        action="append",
+        help="Specify a day, may be repeated (default is every day)",
+    )
+    parser.add_argument(
+        "--file",
+        default=None,
+        help="Store this file for a single --year and --day instead of fetching",
+    )
+    parser.add_argument(
+        "--kind",
+        default="input",
+        help="Kind to store --file as, e.g. input or example-0 (default input)",
+    )
+
+    args = parser.parse_args()
+    store = get_store()
+
+    if args.file:
+        if not (args.year and args.day) or len(args.year) != 1 or len(args.day) != 1:
+            parser.error("--file needs exactly one --year and one --day")
+        with open(args.file) as f:
+            digest = store.put(args.year[0], args.day[0], args.kind, f.read())
+        console.log(f"Stored {args.file} as {digest}")
+        return
+
+    for year, day in discover_days(args.year):
+        if args.day and day not in args.day:
+            continue
+        try:
+            fetch_day(store, year, day)
+        except Exception as e:
+            console.log(f"[red]{year} day {day} failed: {e!r}")
+            continue
+        console.log(f"Stored {year} day {day}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,26 +1,114 @@
 #!/usr/bin/env python3
 
-import os
 import datetime
 import argparse
+import os
+
+from rich.table import Table
+
+from aoc import ROOT_DIR
+from aoc.profiling import MemoryTracer, StageProfiler
+from aoc.registry import SolverNotFoundError
+from aoc.runner import DayResult, run_day
+from aoc.utils import trace
+from aoc.utils.console import console
 
 
-def run_script(year, day, run_test=False):
-    # Construct the path for the script and test file
-    script_path = f"./src/aoc/y{year}/d{day}.py"
-    test_path = f"./src/aoc/tests/y{year}/test_{day}.py"
+def run_test(year, day):
+    """Run pytest for a day in this interpreter."""
+    import pytest
 
-    # Check if --test is provided and the test file exists
-    if run_test and os.path.exists(test_path):
-        # Run pytest for the test file
-        os.system(f"pytest {test_path}")
-    elif run_test:
+    test_path = ROOT_DIR / "tests" / f"y{year}" / f"test_{day:02}.py"
+    if not os.path.exists(test_path):
         print(f"Test file for year {year}, day {day} not found.")
-    elif os.path.exists(script_path):
-        # Run the script
-        os.system(f"python {script_path}")
-    else:
+        return
+    pytest.main([str(test_path)])
+
+
+def format_time(seconds: float) -> str:
+    return f"{seconds * 1000:.2f} ms"
+
+
+def print_result(result: DayResult) -> None:
+    """Print answers and timings for each stage."""
+    table = Table(title=f"{result.year} day {result.day}")
+    table.add_column("Stage")
+    table.add_column("Answer")
+    table.add_column("Time", justify="right")
+    table.add_row("parse", "", format_time(result.timings["parse"]))
+    for stage in ("part_one", "part_two"):
+        table.add_row(
+            stage,
+            str(result.answers[stage]),
+            format_time(result.timings[stage]),
+        )
+    table.add_row("total", "", format_time(result.total))
+    console.print(table)
+
+
+def format_bytes(size: int) -> str:
+    return f"{size / 1024:.1f} KiB"
+
+
+def print_profile(profiler: StageProfiler) -> None:
+    """Print the hottest functions of each stage."""
+    for stage, functions in profiler.hot.items():
+        table = Table(title=f"{stage} ({profiler.files[stage]})")
+        table.add_column("Function")
+        table.add_column("Calls", justify="right")
+        table.add_column("Own time", justify="right")
+        table.add_column("Cumulative", justify="right")
+        for f in functions:
+            table.add_row(
+                f.location,
+                str(f.calls),
+                format_time(f.total_time),
+                format_time(f.cumulative_time),
+            )
+        console.print(table)
+
+
+def print_memory(tracer: MemoryTracer) -> None:
+    """Print peak memory and the top allocation sites of each stage."""
+    for stage, report in tracer.reports.items():
+        table = Table(title=f"{stage} (peak {format_bytes(report.peak)})")
+        table.add_column("Allocated at")
+        table.add_column("Size", justify="right")
+        table.add_column("Blocks", justify="right")
+        for site in report.sites:
+            table.add_row(site.location, format_bytes(site.size), str(site.count))
+        console.print(table)
+
+
+def run_script(
+    year,
+    day,
+    run_tests=False,
+    allow_fetch=None,
+    profile=False,
+    trace_memory=False,
+    top=10,
+):
+    if run_tests:
+        run_test(year, day)
+        return
+
+    hook = None
+    if profile:
+        hook = StageProfiler(prefix=f"{year}-{day:02}", top=top)
+    elif trace_memory:
+        hook = MemoryTracer(top=top)
+
+    try:
+        result = run_day(year, day, allow_fetch=allow_fetch, hook=hook)
+    except SolverNotFoundError:
         print(f"Script for year {year}, day {day} not found.")
+        return
+    print_result(result)
+    if profile:
+        print_profile(hook)
+    elif trace_memory:
+        print_memory(hook)
 
 
 def main():
@@ -47,11 +135,51 @@ def main():
     parser.add_argument(
         "--test", action="store_true", help="Run pytest for the corresponding test file"
     )
+    parser.add_argument(
+        "--fetch",
+        action="store_true",
+        default=None,
+        help="Fetch the input with aocd if it isn't in the input store",
+    )
+    profiling = parser.add_mutually_exclusive_group()
+    profiling.add_argument(
+        "--profile",
+        action="store_true",
+        help="Profile each stage with cProfile and dump .pstats files",
+    )
+    profiling.add_argument(
+        "--trace-memory",
+        action="store_true",
+        help="Trace peak memory and allocation sites of each stage",
+    )
+    parser.add_argument(
+        "--top",
+        type=int,
+        default=10,
+        help="Number of functions or allocation sites to report (default 10)",
+    )
+    parser.add_argument(
+        "-v",
+        "--verbose",
+        action="count",
+        default=None,
+        help="Enable solution tracing, repeat for more detail (-vvv for all)",
+    )
 
     args = parser.parse_args()
+    if args.verbose is not None:
+        trace.set_level(args.verbose)
 
     # Run the script and pytest based on the provided year, day, and test flag
-    run_script(args.year, args.day, args.test)
+    run_script(
+        args.year,
+        args.day,
+        args.test,
+        args.fetch,
+        profile=args.profile,
+        trace_memory=args.trace_memory,
+        top=args.top,
+    )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+
+import argparse
+
+from rich.progress import track
+from rich.table import Table
+
+from aoc.runner import DayResult, Limits, discover_days, run_days
+from aoc.scripts.run_day import format_time
+from aoc.utils.console import console
+
+
+def print_results(results: list[DayResult]) -> None:
+    """Print answers and timings for every day in one table."""
+    table = Table(title="Advent of Code")
+    table.add_column("Year")
+    table.add_column("Day", justify="right")
+    table.add_column("Part one")
+    table.add_column("Part two")
+    for stage in ("parse", "part one", "part two", "total"):
+        table.add_column(stage.capitalize(), justify="right")
+
+    for result in sorted(results, key=lambda r: (r.year, r.day)):
+        if result.status in ("timeout", "memory"):
+            error = f"{result.status} in {result.stage}"
+            table.add_row(str(result.year), str(result.day), f"[yellow]{error}", "")
+            continue
+        if result.error:
+            error = result.error.strip().splitlines()[-1]
+            table.add_row(str(result.year), str(result.day), f"[red]{error}", "")
+            continue
+        table.add_row(
+            str(result.year),
+            str(result.day),
+            str(result.answers["part_one"]),
+            str(result.answers["part_two"]),
+            format_time(result.timings["parse"]),
+            format_time(result.timings["part_one"]),
+            format_time(result.timings["part_two"]),
+            format_time(result.total),
+        )
+    console.print(table)
+
+
+def run_batch(years=None, workers=None, limits=None) -> list[DayResult]:
+    days = discover_days(years)
+    results = list(
+        track(
+            run_days(days, workers=workers, limits=limits),
+            total=len(days),
+            description="Running days",
+            console=console,
+        )
+    )
+    print_results(results)
+    return results
+
+
+def run_all():
+    """Run every discovered day."""
+    run_batch()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Run Advent of Code solutions for whole years in parallel."
+    )
+    parser.add_argument(
+        "--year",
+        type=int,
+        action="append",
+        help="Specify a year, may be repeated (default is every year)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of worker processes (default is the number of cores)",
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=None,
+        help="Wall-clock limit of each stage in seconds",
+    )
+    parser.add_argument(
+        "--memory",
+        type=int,
+        default=None,
+        help="Memory limit of each day in MiB",
+    )
+
+    args = parser.parse_args()
+
+    limits = None
+    if args.timeout is not None or args.memory is not None:
+        memory = args.memory * 1024 * 1024 if args.memory is not None else None
+        limits = Limits(time=args.timeout, memory=memory)
+    run_batch(args.year, args.workers, limits)
+
+
+if __name__ == "__main__":
+    main()
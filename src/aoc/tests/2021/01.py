@@ -1,16 +1,14 @@
 #!/usr/bin/env python
 """Tests for AoC 1, 2021"""
 
-# Third party imports
-from aocd.models import Puzzle
+from aoc.utils.inputs import get_example
 from aoc.y2021.d01 import parse, solve_part_one, solve_part_two
 import pytest
 
 
 @pytest.fixture
 def example1():
-    puzzle = Puzzle(year=2021, day=1)
-    return puzzle.example_data
+    return get_example(2021, 1)
 
 
 @pytest.fixture
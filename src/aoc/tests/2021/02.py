@@ -1,15 +1,13 @@
 #!/usr/bin/env python
 """Tests for AoC 2, 2021"""
 
-# Third party imports
-from aocd.models import Puzzle
+from aoc.utils.inputs import get_example
 from aoc.2021.2 import parse, solve_part_one, solve_part_two
 import pytest
 
 @pytest.fixture
 def example1():
-    puzzle = Puzzle(year=2021, day=2)
-    return puzzle.example_data
+    return get_example(2021, 2)
 
 @pytest.fixture
 def example2():
@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+"""Tests for the benchmark harness"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from aoc.bench import (
+    benchmark_solution,
+    find_regressions,
+    load_results,
+    save_results,
+    summarize,
+)
+from aoc.bench.results import previous_revision
+
+
+def test_summarize():
+    stats = summarize([float(i) for i in range(1, 101)])
+    assert stats.min == 1
+    assert stats.median == 50.5
+    assert stats.p95 == pytest.approx(95.05)
+    assert stats.runs == 100
+
+
+def test_summarize_single_sample():
+    stats = summarize([0.5])
+    assert stats.min == stats.median == stats.p95 == 0.5
+
+
+def test_benchmark_solution():
+    module = SimpleNamespace(
+        parse=lambda input_data: input_data.split(),
+        solve_part_one=lambda data: data.pop(),
+        solve_part_two=lambda data: len(data),
+    )
+    stats = benchmark_solution(module, "a b c", repeat=3)
+    assert set(stats) == {"parse", "part_one", "part_two"}
+    assert all(s.runs == 3 for s in stats.values())
+
+
+@pytest.mark.parametrize(
+    "baseline, current, expected",
+    [
+        (0.100, 0.110, []),
+        (0.100, 0.150, [("2023-05", "part_one")]),
+        (0.0001, 0.0005, []),  # 5x slower but under a millisecond
+    ],
+)
+def test_find_regressions(baseline, current, expected):
+    old = {"2023-05": {"part_one": {"median": baseline}}}
+    new = {"2023-05": {"part_one": {"median": current}}}
+    ret = find_regressions(new, old, threshold=0.2)
+    assert [(r.key, r.stage) for r in ret] == expected
+
+
+def test_results_round_trip(tmp_path):
+    path = tmp_path / "results.json"
+    assert load_results(path) == {}
+    results = {"abc123": {"2023-05": {"parse": {"median": 1.0}}}, "def456": {}}
+    save_results(results, path)
+    assert load_results(path) == results
+    assert previous_revision(results, "def456") == "abc123"
+    assert previous_revision(results, "new") == "def456"
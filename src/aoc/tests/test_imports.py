@@ -0,0 +1,39 @@
+#!/usr/bin/env python
+"""Keep solution modules cheap to import"""
+
+import subprocess
+import sys
+
+MODULE = "aoc.y2023.d15"
+BUDGET_US = 100_000
+HEAVY = ("aocd", "rich", "numpy", "networkx")
+
+
+def import_times(module):
+    """Return {module: cumulative microseconds} from `python -X importtime`."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def test_no_heavy_imports():
+    times = import_times(MODULE)
+    assert MODULE in times
+    heavy = [name for name in times if name.split(".")[0] in HEAVY]
+    assert heavy == []
+
+
+def test_import_time_budget():
+    # Take the best of a few runs to ride out a noisy machine
+    best = min(import_times(MODULE)[MODULE] for _ in range(3))
+    assert best < BUDGET_US
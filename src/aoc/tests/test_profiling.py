@@ -0,0 +1,43 @@
+#!/usr/bin/env python
+"""Tests for the profiling hooks"""
+
+import pstats
+from types import SimpleNamespace
+
+from aoc.profiling import MemoryTracer, StageProfiler
+from aoc.runner import run_solution
+
+
+def busy(n):
+    return sum(i * i for i in range(n))
+
+
+solution = SimpleNamespace(
+    parse=lambda input_data: int(input_data),
+    solve_part_one=lambda n: busy(n),
+    solve_part_two=lambda n: len([[i] for i in range(n)]),
+)
+
+
+def test_stage_profiler(tmp_path):
+    profiler = StageProfiler(prefix="2023-01", output_dir=tmp_path, top=3)
+    result = run_solution(solution, "10000", hook=profiler)
+    assert result.answers["part_two"] == 10000
+    assert set(profiler.files) == {"parse", "part_one", "part_two"}
+    for path in profiler.files.values():
+        assert path.parent == tmp_path
+        pstats.Stats(str(path))  # loads
+    assert len(profiler.hot["part_one"]) <= 3
+    assert any(
+        "busy" in f.location or "genexpr" in f.location
+        for f in profiler.hot["part_one"]
+    )
+
+
+def test_memory_tracer():
+    tracer = MemoryTracer(top=5)
+    run_solution(solution, "10000", hook=tracer)
+    assert set(tracer.reports) == {"parse", "part_one", "part_two"}
+    # part two builds 10000 one-element lists
+    assert tracer.reports["part_two"].peak > tracer.reports["parse"].peak
+    assert len(tracer.reports["part_two"].sites) <= 5
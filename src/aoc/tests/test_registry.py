@@ -0,0 +1,179 @@
+#!/usr/bin/env python
+"""Tests for the solver registry"""
+
+import json
+import os
+import sys
+
+import pytest
+
+from aoc.registry import (
+    Registry,
+    Solver,
+    SolverNotFoundError,
+    as_solver,
+    match_layout,
+)
+
+PACKAGE = """
+def parse(input_data):
+    return [int(x) for x in input_data.split()]
+
+def solve_part_one(data):
+    return sum(data)
+
+def solve_part_two(data):
+    return max(data)
+"""
+
+AOC = """
+from dataclasses import dataclass
+
+@dataclass
+class Total:
+    value: int
+
+def parse(puzzle_input):
+    return [int(x) for x in puzzle_input.split()]
+
+def part1(data):
+    return Total(sum(data)).value
+
+def part2(data):
+    return min(data)
+"""
+
+SCRIPT = """
+def main(args):
+    print(args.file.read())
+"""
+
+
+@pytest.fixture
+def repo(tmp_path):
+    files = {
+        "src/aoc/y2023/d05.py": PACKAGE,
+        "2021/05/aoc202105.py": AOC,
+        "2021/05/test_aoc202105.py": "def test_nothing(): pass\n",
+        "2023/05/aoc202305.py": AOC,
+        "2018/4.py": SCRIPT,
+        "2020/day_12/test_12.py": "def part_one(x):\n    return x\n",
+    }
+    for name, content in files.items():
+        path = tmp_path / "repo" / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+    return tmp_path / "repo"
+
+
+@pytest.fixture
+def registry(repo, tmp_path):
+    return Registry(repo, index_file=tmp_path / "index.json")
+
+
+@pytest.mark.parametrize(
+    "path, expected",
+    [
+        ("src/aoc/y2023/d05.py", ("package", 2023, 5)),
+        ("2021/05/aoc202105.py", ("aoc", 2021, 5)),
+        ("src/aoc/2021/01.py", ("legacy", 2021, 1)),
+        ("2018/4.py", ("legacy", 2018, 4)),
+        ("2020/test_10.py", ("legacy", 2020, 10)),
+        ("2020/day_16/16.py", ("legacy", 2020, 16)),
+        ("2021/1/1.py", ("legacy", 2021, 1)),
+        ("2021/05/test_aoc202105.py", None),
+        ("2020/template.py", None),
+    ],
+)
+def test_match_layout(path, expected):
+    match = match_layout(path)
+    assert (match and match[:3]) == expected
+
+
+def test_specs(registry):
+    assert [(s.year, s.day, s.layout) for s in registry.specs] == [
+        (2018, 4, "legacy"),
+        (2020, 12, "legacy"),
+        (2021, 5, "aoc"),
+        (2023, 5, "package"),
+        (2023, 5, "aoc"),
+    ]
+    assert registry.days() == [(2021, 5), (2023, 5)]
+    assert registry.days([2018, 2020], runnable=False) == [(2018, 4), (2020, 12)]
+
+
+def test_find_prefers_package(registry):
+    assert registry.find(2023, 5).layout == "package"
+    assert registry.find(2023, 5, layout="aoc").path == "2023/05/aoc202305.py"
+    with pytest.raises(SolverNotFoundError):
+        registry.find(2023, 6)
+
+
+def test_find_prefers_runnable(repo, tmp_path):
+    # A package module that doesn't solve the day yet next to a working script
+    path = repo / "src/aoc/y2021/d05.py"
+    path.parent.mkdir(parents=True)
+    path.write_text(SCRIPT)
+    registry = Registry(repo, index_file=tmp_path / "index.json")
+    assert [s.layout for s in registry.specs if (s.year, s.day) == (2021, 5)] == [
+        "package",
+        "aoc",
+    ]
+    assert (2021, 5) in registry.days()
+    assert registry.find(2021, 5).layout == "aoc"
+    assert registry.find(2021, 5, layout="package").path == "src/aoc/y2021/d05.py"
+    assert Solver(2021, 5, registry=registry).spec.runnable
+    assert registry.find(2018, 4).layout == "legacy"
+
+
+def test_index_cached(registry, repo, tmp_path, monkeypatch):
+    registry.refresh()
+    index = json.loads((tmp_path / "index.json").read_text())
+    assert index["files"]["2021/05/aoc202105.py"]["functions"] == {
+        "parse": "parse",
+        "part1": "part1",
+        "part2": "part2",
+    }
+
+    # Unchanged files aren't read again
+    read = []
+    monkeypatch.setattr(
+        "aoc.registry.top_level_functions", lambda path: read.append(path) or []
+    )
+    Registry(repo, index_file=tmp_path / "index.json").refresh()
+    assert read == []
+
+    path = repo / "2018" / "4.py"
+    path.write_text(SCRIPT + "\n\ndef part_one(x):\n    return x\n")
+    os.utime(path, ns=(0, 0))
+    Registry(repo, index_file=tmp_path / "index.json").refresh()
+    assert read == [path]
+
+
+def test_solver_by_path(registry):
+    solver = Solver(2021, 5, registry=registry)
+    assert repr(solver) == "Solver(2021, 5, layout='aoc')"
+    assert solver.spec.module_name not in sys.modules
+    data = solver.parse("3 1 2")
+    assert solver.part1(data) == 6
+    assert solver.part2(data) == 1
+
+
+def test_solver_without_parts(registry):
+    solver = Solver(2018, 4, registry=registry)
+    assert solver.parse("abc") == "abc"
+    assert solver.part1 is None
+    assert solver.part2 is None
+
+
+def test_solver_in_package():
+    solver = Solver(2023, 15)
+    assert solver.spec.layout == "package"
+    assert solver.part1.__name__ == "solve_part_one"
+
+
+def test_as_solver():
+    module = sys.modules[__name__]
+    solver = as_solver(module)
+    assert solver.module is module
+    assert as_solver(solver) is solver
@@ -0,0 +1,217 @@
+#!/usr/bin/env python
+"""Tests for the in-process solution runner"""
+
+import multiprocessing
+import os
+import signal
+import time
+from contextlib import contextmanager
+from types import SimpleNamespace
+
+import pytest
+
+from aoc.runner import (
+    Limits,
+    discover_days,
+    module_name,
+    run_day_limited,
+    run_day_safely,
+    run_days,
+    run_solution,
+    solve,
+)
+
+# Workers inherit the monkeypatched fake solutions by forking
+requires_fork = pytest.mark.skipif(
+    multiprocessing.get_start_method() != "fork", reason="needs fork start method"
+)
+
+
+def fake_solution(**overrides):
+    funcs = {
+        "parse": lambda input_data: [int(x) for x in input_data.split()],
+        "solve_part_one": lambda data: sum(data),
+        "solve_part_two": lambda data: max(data),
+    }
+    funcs.update(overrides)
+    return SimpleNamespace(**funcs)
+
+
+@pytest.mark.parametrize(
+    "year, day, expected",
+    [
+        (2023, 5, "aoc.y2023.d05"),
+        (2022, 16, "aoc.y2022.d16"),
+    ],
+)
+def test_module_name(year, day, expected):
+    assert module_name(year, day) == expected
+
+
+def test_run_solution():
+    result = run_solution(fake_solution(), "1 2 3", year=2023, day=1)
+    assert result.answers == {"part_one": 6, "part_two": 3}
+    assert set(result.timings) == {"parse", "part_one", "part_two"}
+    assert result.total == sum(result.timings.values())
+
+
+def test_run_solution_reparses_for_part_two():
+    def destructive(data):
+        return data.pop()
+
+    result = run_solution(
+        fake_solution(solve_part_one=destructive, solve_part_two=destructive), "1 2 3"
+    )
+    assert result.answers == {"part_one": 3, "part_two": 3}
+
+
+def test_solve_passes_raw_input():
+    def needs_raw(parsed_data, raw_data):
+        return parsed_data, raw_data
+
+    assert solve(needs_raw, [1], "1") == ([1], "1")
+    assert solve(lambda data, extra=5: (data, extra), [1], "1") == ([1], 5)
+
+
+def test_discover_days():
+    days = discover_days([2023])
+    assert (2023, 1) in days
+    assert (2023, 5) in days
+    assert all(year == 2023 for year, _ in days)
+    assert days == sorted(days)
+
+
+def test_run_day_safely_records_errors():
+    result = run_day_safely(1999, 1)
+    assert "SolverNotFoundError" in result.error
+    assert result.answers == {}
+
+
+@pytest.fixture
+def fake_day(monkeypatch):
+    def install(**overrides):
+        solution = fake_solution(**overrides)
+        monkeypatch.setattr("aoc.runner.load_solution", lambda year, day: solution)
+        monkeypatch.setattr("aoc.runner.get_input", lambda year, day, **kw: "1 2 3")
+
+    return install
+
+
+def spin(data):
+    while True:
+        pass
+
+
+def ignore_alarm(data):
+    signal.signal(signal.SIGALRM, signal.SIG_IGN)
+    while True:
+        time.sleep(1)
+
+
+def address_space() -> int:
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[0]) * os.sysconf("SC_PAGE_SIZE")
+
+
+@requires_fork
+def test_run_day_limited(fake_day):
+    fake_day()
+    result = run_day_limited(2023, 1, Limits(time=5))
+    assert result.status == "ok"
+    assert result.answers == {"part_one": 6, "part_two": 3}
+
+
+@requires_fork
+def test_run_day_limited_timeout(fake_day):
+    fake_day(solve_part_two=spin)
+    start = time.monotonic()
+    result = run_day_limited(2023, 1, Limits(time=0.2))
+    assert time.monotonic() - start < 5
+    assert result.status == "timeout"
+    assert result.stage == "part_two"
+    assert "StageTimeout" in result.error
+
+
+def test_run_solution_reparses_inside_part_two_hook():
+    stages = []
+
+    @contextmanager
+    def hook(stage):
+        stages.append(stage)
+        yield
+        stages.append(f"/{stage}")
+
+    def parse(input_data):
+        stages.append("parse()")
+        return [int(x) for x in input_data.split()]
+
+    run_solution(fake_solution(parse=parse), "1 2 3", hook=hook)
+    assert stages == [
+        "parse",
+        "parse()",
+        "/parse",
+        "part_one",
+        "/part_one",
+        "part_two",
+        "parse()",
+        "/part_two",
+    ]
+
+
+@requires_fork
+def test_run_day_limited_reparse_timeout(fake_day):
+    calls = []
+
+    def parse_once(input_data):
+        calls.append(input_data)
+        if len(calls) > 1:
+            spin(input_data)
+        return [int(x) for x in input_data.split()]
+
+    fake_day(parse=parse_once)
+    result = run_day_limited(2023, 1, Limits(time=0.2))
+    assert result.status == "timeout"
+    assert result.stage == "part_two"
+    assert "StageTimeout" in result.error
+
+
+@requires_fork
+def test_run_day_limited_watchdog(fake_day):
+    fake_day(solve_part_one=ignore_alarm)
+    result = run_day_limited(2023, 1, Limits(time=0.2, grace=0.2))
+    assert result.status == "timeout"
+    assert result.stage == "part_one"
+
+
+@requires_fork
+@pytest.mark.skipif(not os.path.exists("/proc/self/statm"), reason="needs /proc")
+def test_run_day_limited_memory(fake_day):
+    fake_day(solve_part_one=lambda data: bytearray(1024**3))
+    result = run_day_limited(2023, 1, Limits(memory=address_space() + 64 * 1024**2))
+    assert result.status == "memory"
+    assert result.stage == "part_one"
+
+
+@requires_fork
+def test_run_day_limited_error(fake_day):
+    fake_day(parse=lambda input_data: 1 / 0)
+    result = run_day_limited(2023, 1, Limits())
+    assert result.status == "error"
+    assert result.stage == "parse"
+    assert "ZeroDivisionError" in result.error
+
+
+@requires_fork
+def test_run_day_limited_crash(fake_day):
+    fake_day(solve_part_one=lambda data: os._exit(3))
+    result = run_day_limited(2023, 1, Limits())
+    assert result.status == "crashed"
+    assert result.error == "Worker exited with code 3"
+
+
+@requires_fork
+def test_run_days_with_limits(fake_day):
+    fake_day()
+    results = list(run_days([(2023, 1), (2023, 2), (2023, 3)], 2, Limits(time=5)))
+    assert sorted(r.day for r in results) == [1, 2, 3]
+    assert all(r.status == "ok" for r in results)
@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+"""Test the parsed-input cache"""
+
+from aoc.utils.cache import cached_parse, evict
+
+
+def counting_parser(cache_dir, max_bytes=None):
+    calls = []
+
+    @cached_parse(cache_dir=cache_dir, max_bytes=max_bytes)
+    def parse(input_data):
+        calls.append(input_data)
+        return [int(x) for x in input_data.split()]
+
+    return parse, calls
+
+
+def test_cache_hit(tmp_path):
+    parse, calls = counting_parser(tmp_path)
+    first = parse("1 2 3")
+    second = parse("1 2 3")
+    assert first == second == [1, 2, 3]
+    assert first is not second  # solvers may mutate their parsed data
+    assert calls == ["1 2 3"]
+
+
+def test_cache_keyed_by_input(tmp_path):
+    parse, calls = counting_parser(tmp_path)
+    assert parse("1 2") == [1, 2]
+    assert parse("3 4") == [3, 4]
+    assert len(calls) == 2
+    assert len(list(tmp_path.glob("*.pickle"))) == 2
+
+
+def test_cache_disabled(tmp_path, monkeypatch):
+    monkeypatch.setenv("AOC_PARSE_CACHE", "0")
+    parse, calls = counting_parser(tmp_path)
+    parse("1")
+    parse("1")
+    assert len(calls) == 2
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_unpicklable_results_are_not_cached(tmp_path):
+    @cached_parse(cache_dir=tmp_path)
+    def parse(input_data):
+        for line in input_data.splitlines():
+            yield line
+
+    assert list(parse("a\nb")) == ["a", "b"]
+    assert list(tmp_path.glob("*.pickle")) == []
+
+
+def test_evict_least_recently_used(tmp_path):
+    parse, calls = counting_parser(tmp_path, max_bytes=10**6)
+    for i in range(5):
+        parse(" ".join(str(i) for _ in range(100)))
+    sizes = sorted(p.stat().st_size for p in tmp_path.glob("*.pickle"))
+    evict(tmp_path, sum(sizes[:2]))
+    assert len(list(tmp_path.glob("*.pickle"))) == 2
+    # The most recent entries survive
+    parse(" ".join("4" for _ in range(100)))
+    assert len(calls) == 5
@@ -0,0 +1,132 @@
+#!/usr/bin/env python
+"""Test the array backed grid"""
+
+import numpy as np
+import pytest
+
+from aoc.utils.grid import ArrayGrid, TiledGrid
+from aoc.utils.pathfinding import dijkstra_search
+
+MAP = """\
+#.#.
+..#.
+.##.
+"""
+
+
+@pytest.fixture
+def grid():
+    return ArrayGrid.from_text(MAP)
+
+
+def test_from_text(grid):
+    assert (grid.width, grid.height) == (4, 3)
+    assert grid.array.dtype == np.uint8
+    assert grid[0, 0] == ord("#")
+    assert grid[1, 0] == ord(".")
+    assert str(grid) == MAP.rstrip()
+
+
+def test_from_text_ragged():
+    with pytest.raises(ValueError):
+        ArrayGrid.from_text("#.#\n..\n.##\n")
+
+
+def test_from_digits():
+    grid = ArrayGrid.from_digits("123\n456")
+    assert grid.array.tolist() == [[1, 2, 3], [4, 5, 6]]
+
+
+def test_out_of_bounds(grid):
+    assert (3, 2) in grid
+    assert (4, 0) not in grid
+    with pytest.raises(IndexError):
+        grid[-1, 0]
+    with pytest.raises(IndexError):
+        grid[0, 3] = "#"
+
+
+def test_slicing(grid):
+    view = grid[1:3, 1:]
+    assert (view.x_min, view.y_min) == (1, 1)
+    assert str(view) == ".#\n##"
+    assert view[2, 2] == grid[2, 2]
+    view[1, 1] = "#"
+    assert grid[1, 1] == ord("#")
+    assert grid[1:3, 1:] == view
+    assert grid[0:2, 1:] != view
+
+
+def test_pad(grid):
+    padded = grid.pad(fill="~")
+    assert (padded.width, padded.height) == (6, 5)
+    assert padded[-1, -1] == ord("~")
+    assert padded[0, 0] == grid[0, 0]
+    assert padded.find("#") == grid.find("#")
+
+
+def test_find(grid):
+    assert grid.find("#") == [(0, 0), (2, 0), (2, 1), (1, 2), (2, 2)]
+    assert len(grid.find("#.")) == 12
+
+
+def test_neighbor_views(grid):
+    views = grid.neighbor_views(fill="~")
+    assert set(views) == {(1, 0), (-1, 0), (0, -1), (0, 1)}
+    for x, y in grid.locations():
+        for (dx, dy), view in views.items():
+            expected = grid[x + dx, y + dy] if (x + dx, y + dy) in grid else ord("~")
+            assert view[y, x] == expected
+    assert len(grid.neighbor_views(diagonal=True)) == 8
+
+
+def test_count_neighbors(grid):
+    counts = grid.count_neighbors("#")
+    assert counts[1, 1] == 5
+    assert counts[0, 3] == 2
+    assert grid.count_neighbors("#", diagonal=False)[1, 1] == 2
+
+
+def test_to_square_grid(grid):
+    square = grid.to_square_grid()
+    assert set(square.walls) == set(grid.find("#"))
+    assert sorted(square.neighbors((1, 1))) == [(0, 1), (1, 0)]
+    with pytest.raises(ValueError):
+        grid.pad().to_square_grid()
+
+
+CHITONS = """\
+1163751742
+1381373672
+2136511328
+3694931569
+7463417111
+1319128137
+1359912421
+3125421639
+1293138521
+2311944581"""
+
+
+def risk(value, tile_x, tile_y):
+    return (value - 1 + tile_x + tile_y) % 9 + 1
+
+
+def test_tiled_grid():
+    tile = ArrayGrid.from_digits(CHITONS)
+    grid = TiledGrid(tile, 5, transform=risk)
+    assert (grid.width, grid.height) == (50, 50)
+    assert grid[2, 0] == 6
+    assert grid[12, 0] == 7
+    assert grid[2, 40] == 1
+    assert grid[48, 49] == 7
+    assert grid.max_cost == 9
+    with pytest.raises(IndexError):
+        grid[50, 0]
+    assert TiledGrid(tile.array.tolist())[9, 9] == 1
+
+
+def test_tiled_grid_search():
+    grid = TiledGrid(ArrayGrid.from_digits(CHITONS), 5, transform=risk)
+    _, cost_so_far = dijkstra_search(grid, (0, 0), (49, 49))
+    assert cost_so_far[(49, 49)] == 315
@@ -0,0 +1,49 @@
+#!/usr/bin/env python
+"""Test the offline input store"""
+
+import pytest
+
+from aoc.utils.inputs import InputNotFoundError, InputStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    return InputStore(tmp_path)
+
+
+def test_put_and_read(store):
+    digest = store.put(2023, 5, "input", "seeds: 79 14 55 13\n")
+    assert store.read(2023, 5) == "seeds: 79 14 55 13\n"
+    assert store.object_path(digest).exists()
+    assert "2023/05/input" in store
+
+
+def test_content_addressed(store):
+    first = store.put(2023, 5, "example-0", "same")
+    second = store.put(2023, 6, "example-0", "same")
+    assert first == second
+    assert len(list((store.root / "objects").rglob("*"))) == 2  # one dir, one blob
+
+
+def test_index_persists(store):
+    store.put(2022, 16, "input", "Valve AA")
+    reopened = InputStore(store.root)
+    assert reopened.read(2022, 16) == "Valve AA"
+
+
+def test_empty_input(store):
+    store.put(2022, 1, "input", "")
+    assert store.read(2022, 1) == ""
+
+
+def test_missing_without_fetch(store):
+    with pytest.raises(InputNotFoundError):
+        store.get(2022, 1, allow_fetch=False)
+
+
+def test_fetch_when_allowed(store, monkeypatch):
+    monkeypatch.setattr(
+        "aoc.utils.inputs.fetch", lambda year, day, kind: f"{year} {day} {kind}"
+    )
+    assert store.get(2022, 1, "example-0", allow_fetch=True) == "2022 1 example-0"
+    assert store.read(2022, 1, "example-0") == "2022 1 example-0"
@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+"""Test the shared puzzle parsers"""
+
+import re
+
+import pytest
+
+from aoc.utils.parsers import (
+    RecordParser,
+    int_array,
+    ints,
+    parse_lists,
+    split_names,
+    tokenize_lists,
+)
+
+
+def test_tokenize_lists():
+    assert tokenize_lists("[[1,2],-3]") == ["[", "[", 1, 2, "]", -3, "]"]
+    assert tokenize_lists("[10]\n[]") == ["[", 10, "]", "[", "]"]
+    with pytest.raises(ValueError):
+        tokenize_lists("[1,a]")
+
+
+def test_parse_lists():
+    packets = parse_lists("[1,[2,[]]]\n[[4,4],4]\n\n[10, -1]\n")
+    assert packets == [[1, [2, []]], [[4, 4], 4], [10, -1]]
+    assert parse_lists("") == []
+    with pytest.raises(ValueError):
+        parse_lists("[__import__('os')]")
+    with pytest.raises(ValueError):
+        parse_lists("[1,[2]")
+
+
+def test_ints():
+    text = "Sensor at x=2, y=18: closest beacon is at x=-2, y=15\n3   4\n"
+    assert ints(text) == [2, 18, -2, 15, 3, 4]
+    assert ints(text, columns=2) == [(2, 18), (-2, 15), (3, 4)]
+    with pytest.raises(ValueError):
+        ints(text, columns=4)
+
+
+def test_int_array():
+    array = int_array("3   4\n4   3\n2   5\n", columns=2)
+    assert array.shape == (3, 2)
+    assert array[:, 1].tolist() == [4, 3, 5]
+    assert int_array("").tolist() == []
+
+
+VALVE = RecordParser(
+    r"Valve (\w+) has flow rate=(\d+); tunnels? leads? to valves? (.+)",
+    str,
+    int,
+    split_names,
+)
+
+
+def test_record_parser():
+    text = (
+        "Valve AA has flow rate=0; tunnels lead to valves DD, II, BB\n"
+        "\n"
+        "Valve HH has flow rate=22; tunnel leads to valve GG\n"
+    )
+    assert VALVE.parse(text) == [("AA", 0, ["DD", "II", "BB"]), ("HH", 22, ["GG"])]
+    assert VALVE.parse_one("Valve HH has flow rate=22; tunnel leads to valve GG") == (
+        "HH",
+        22,
+        ["GG"],
+    )
+    with pytest.raises(ValueError):
+        VALVE.parse(text + "Valve BB has flow rate=x; tunnel leads to valve AA\n")
+    with pytest.raises(ValueError):
+        RecordParser(r"(\d+)", int, int)
+
+
+def test_record_parser_defaults_to_strings():
+    parser = RecordParser(r"(\w+) -> (\w+)")
+    assert parser.parse("a -> b\nc -> d") == [("a", "b"), ("c", "d")]
+    assert RecordParser(r"(\d+)", int).parse("1\n2") == [(1,), (2,)]
+
+
+@pytest.mark.parametrize("text", ["1-3 a: 5", "x=-1, - 4", "--2 7", "é5 ü-6"])
+def test_ints_hyphens(text):
+    expected = [int(value) for value in re.findall(r"-?\d+", text)]
+    assert ints(text) == expected
+    assert int_array(text).tolist() == expected
@@ -1,19 +1,37 @@
 #!/usr/bin/env python
 """Test pathfinding library"""
 
+import io
+import random
 from typing import Optional
 
+import pytest
+
 from aoc.utils.pathfinding import (
+    BitmapOccupancy,
+    CompactGrid,
     Graph,
+    GridLocation,
+    GridRenderer,
     GridWithWeights,
     Location,
     Queue,
+    SetOccupancy,
     SimpleGraph,
     SquareGrid,
+    all_pairs_shortest_paths,
+    bidirectional_search,
+    compact_breadth_first_search,
+    contract_corridors,
+    dial_search,
     dijkstra_search,
     draw_grid,
     from_id_width,
+    heuristic,
+    multi_source_bfs,
     reconstruct_path,
+    render_grid,
+    reverse_graph,
 )
 
 # data from main article
@@ -102,6 +120,320 @@ def breadth_first_search(graph: Graph, start: Location):
     return came_from
 
 
+@pytest.mark.parametrize("dense", [False, True])
+def test_grid_walls(dense):
+    g = SquareGrid(30, 15, dense=dense)
+    for wall in DIAGRAM1_WALLS:
+        g.walls.append(wall)
+    assert len(g.walls) == len(DIAGRAM1_WALLS)
+    assert sorted(g.walls) == sorted(DIAGRAM1_WALLS)
+    assert not g.passable((21, 0))
+    assert g.passable((20, 0))
+    assert (21, 0) not in set(g.neighbors((20, 0)))
+
+
+def test_walls_assigned_as_list():
+    g = SquareGrid(30, 15)
+    g.walls = DIAGRAM1_WALLS
+    assert isinstance(g.walls, SetOccupancy)
+    assert not g.passable((21, 0))
+
+
+def test_bitmap_occupancy():
+    bitmap = BitmapOccupancy(4, 3, [(-1, 5), (2, 6)], x_min=-1, y_min=5)
+    assert list(bitmap) == [(-1, 5), (2, 6)]
+    assert (-1, 5) in bitmap
+    assert (3, 5) not in bitmap
+    assert (100, 100) not in bitmap
+    bitmap.discard((-1, 5))
+    assert len(bitmap) == 1
+    with pytest.raises(IndexError):
+        bitmap.add((3, 5))
+
+
+def test_bitmap_to_numpy():
+    np = pytest.importorskip("numpy")
+    bitmap = BitmapOccupancy(3, 2, [(1, 0), (2, 1)])
+    assert bitmap.to_numpy().tolist() == [[False, True, False], [False, False, True]]
+    assert np.count_nonzero(bitmap.to_numpy()) == 2
+
+
+@pytest.mark.parametrize("dense", [False, True])
+def test_dijkstra_with_walls(dense):
+    g = GridWithWeights(10, 10, dense=dense)
+    g.walls = BitmapOccupancy(10, 10, [(1, 0), (1, 1)]) if dense else [(1, 0), (1, 1)]
+    start, goal = (0, 0), (2, 0)
+    came_from, cost_so_far = dijkstra_search(g, start, goal)
+    assert cost_so_far[goal] == 6
+    assert reconstruct_path(came_from, start=start, goal=goal)[2] == (0, 2)
+
+
+class WeightedEdges(SimpleGraph):
+    """Graph with explicit edge costs and no `max_cost`, searched with a heap."""
+
+    def __init__(self, edges: dict[tuple[Location, Location], int]):
+        super().__init__()
+        self.costs = edges
+        for (a, b), cost in edges.items():
+            self.edges.setdefault(a, []).append(b)
+            self.edges.setdefault(b, [])
+
+    def cost(self, from_id: Location, to_id: Location) -> int:
+        return self.costs[from_id, to_id]
+
+
+def test_dial_search_matches_heap():
+    rng = random.Random(15)
+    edges = {}
+    for _ in range(400):
+        a, b = rng.randrange(60), rng.randrange(60)
+        edges[a, b] = rng.randint(0, 9)
+    graph = WeightedEdges(edges)
+    _, expected = dijkstra_search(graph, 0, None)
+    came_from, cost_so_far = dial_search(graph, 0, None, max_cost=9)
+    assert cost_so_far == expected
+    for location in cost_so_far:
+        path = reconstruct_path(came_from, start=0, goal=location)
+        assert sum(edges[a, b] for a, b in zip(path, path[1:])) == expected[location]
+
+
+def test_dijkstra_uses_buckets(monkeypatch):
+    g = GridWithWeights(5, 5)
+    g.weights = {(1, 0): 9, (1, 1): 9}
+    assert g.max_cost == 9
+    calls = []
+    monkeypatch.setattr(
+        "aoc.utils.pathfinding.dial_search",
+        lambda *args: calls.append(args) or ({}, {}),
+    )
+    dijkstra_search(g, (0, 0), (4, 4))
+    assert calls == [(g, (0, 0), (4, 4), 9)]
+
+
+def test_overridden_cost_has_no_max_cost():
+    class FlatGrid(GridWithWeights):
+        def cost(self, from_node, to_node):
+            return 500
+
+    g = FlatGrid(3, 1)
+    assert g.max_cost is None
+    _, cost_so_far = dijkstra_search(g, (0, 0), (2, 0))
+    assert cost_so_far[(2, 0)] == 1000
+
+
+def test_dial_search_rejects_large_costs():
+    graph = WeightedEdges({(0, 1): 3, (1, 2): 12})
+    with pytest.raises(ValueError):
+        dial_search(graph, 0, 2, max_cost=9)
+
+
+def test_multi_source_bfs():
+    g = SquareGrid(10, 10)
+    g.walls = [(5, y) for y in range(9)]
+    came_from, distance = multi_source_bfs(g, [(0, 0), (9, 0)])
+    assert came_from[(0, 0)] is None and came_from[(9, 0)] is None
+    assert distance[(4, 0)] == 4
+    assert distance[(6, 0)] == 3
+    # Around the wall from the nearer start
+    assert distance[(5, 9)] == 13
+    path = reconstruct_path(came_from, start=(9, 0), goal=(5, 9))
+    assert len(path) == 14
+
+
+def test_multi_source_bfs_goal():
+    g = SquareGrid(10, 10)
+    came_from, distance = multi_source_bfs(g, [(0, 0), (0, 9)], goal=(2, 9))
+    assert distance[(2, 9)] == 2
+    assert (9, 0) not in came_from
+
+
+def test_reverse_graph():
+    graph = SimpleGraph()
+    graph.edges = {"A": ["B"], "B": ["C"], "C": ["A", "D"], "D": []}
+    reversed_graph = reverse_graph(graph, graph.edges)
+    assert reversed_graph.edges == {"A": ["C"], "B": ["A"], "C": ["B"], "D": ["C"]}
+    _, distance = multi_source_bfs(reversed_graph, ["D"])
+    assert distance == {"D": 0, "C": 1, "B": 2, "A": 3}
+
+
+def test_compact_grid_neighbors():
+    g = SquareGrid(4, 3)
+    g.walls = [(1, 1)]
+    compact = CompactGrid(g)
+    assert compact.encode((2, 1)) == 6
+    assert compact.decode(6) == (2, 1)
+    for location in [(0, 0), (2, 1), (3, 2)]:
+        expected = [compact.encode(n) for n in g.neighbors(location)]
+        assert list(compact.neighbors(compact.encode(location))) == expected
+    assert list(compact.neighbors(compact.encode((1, 1)))) == []
+
+
+def test_compact_dijkstra_matches_grid():
+    rng = random.Random(15)
+    g = GridWithWeights(20, 20)
+    g.weights = {(x, y): rng.randint(1, 9) for x in range(20) for y in range(20)}
+    g.walls = [(rng.randrange(20), rng.randrange(20)) for _ in range(60)]
+    g.walls.discard((0, 0))
+    _, expected = dijkstra_search(g, (0, 0), None)
+
+    compact = CompactGrid(g)
+    start = compact.encode((0, 0))
+    came_from, cost_so_far = dijkstra_search(compact, start, None)
+    assert {compact.decode(id): cost for id, cost in cost_so_far.items()} == expected
+    assert came_from[start] is None
+    goal = max(cost_so_far, key=cost_so_far.get)
+    path = reconstruct_path(came_from, start=start, goal=goal)
+    assert sum(compact.cost(a, b) for a, b in zip(path, path[1:])) == cost_so_far[goal]
+
+
+def test_compact_breadth_first_search():
+    g = SquareGrid(10, 10)
+    g.walls = [(5, y) for y in range(9)]
+    compact = CompactGrid(g)
+    came_from = compact_breadth_first_search(compact, 0, compact.encode((9, 0)))
+    path = reconstruct_path(came_from, start=0, goal=compact.encode((9, 0)))
+    assert len(path) == 28
+    assert compact.encode((5, 0)) not in came_from
+    assert len(came_from) == len(list(came_from))
+
+
+@pytest.mark.parametrize("ratio", [0, 10**9])
+def test_all_pairs_shortest_paths(monkeypatch, ratio):
+    # Force min-plus relaxation or breadth first searches
+    monkeypatch.setattr("aoc.utils.pathfinding.MIN_PLUS_RATIO", ratio)
+    g = SquareGrid(6, 6)
+    g.walls = [(3, y) for y in range(5)] + [(0, 5), (1, 4)]
+    locations = [(x, y) for x in range(6) for y in range(6) if (x, y) not in g.walls]
+    index, distances = all_pairs_shortest_paths(g, locations)
+    assert distances.shape == (len(locations), len(locations))
+    for start in locations[::5]:
+        came_from = breadth_first_search(g, start)
+        for goal in locations:
+            expected = len(reconstruct_path(came_from, start, goal)) - 1
+            if goal not in came_from:
+                expected = float("inf")
+            assert distances[index[start], index[goal]] == expected
+
+
+def test_all_pairs_shortest_paths_weighted():
+    graph = WeightedEdges({("A", "B"): 5, ("A", "C"): 1, ("C", "B"): 2, ("B", "A"): 1})
+    index, distances = all_pairs_shortest_paths(graph, "ABC", weighted=True)
+    assert distances[index["A"], index["B"]] == 3
+    assert distances[index["B"], index["C"]] == 2
+    assert distances[index["C"], index["A"]] == 3
+
+
+MAZE = """\
+#########
+#S....#.#
+#.###.#.#
+#.#.....#
+#.#.###.#
+#...#..G#
+#########"""
+
+
+def parse_maze(maze: str) -> tuple[SquareGrid, list[GridLocation]]:
+    lines = maze.splitlines()
+    g = SquareGrid(len(lines[0]), len(lines))
+    cells = []
+    for y, line in enumerate(lines):
+        for x, char in enumerate(line):
+            if char == "#":
+                g.walls.add((x, y))
+            else:
+                cells.append((x, y))
+    return g, cells
+
+
+def test_contract_corridors():
+    g, cells = parse_maze(MAZE)
+    start, goal = (1, 1), (7, 5)
+    contracted = contract_corridors(g, cells, keep=[start, goal])
+    assert len(contracted.edges) < len(cells)
+    assert set(contracted.edges) >= {start, goal}
+
+    came_from, cost_so_far = dijkstra_search(contracted, start, goal)
+    assert cost_so_far[goal] == 10
+    path = contracted.expand_path(reconstruct_path(came_from, start, goal))
+    assert len(path) == 11
+    assert all(abs(a[0] - b[0]) + abs(a[1] - b[1]) == 1 for a, b in zip(path, path[1:]))
+    expanded = contracted.expand_came_from(came_from)
+    assert reconstruct_path(expanded, start, goal) == path
+
+
+def test_contract_corridors_loop():
+    g, cells = parse_maze("#####\n#...#\n#.#.#\n#...#\n#####")
+    contracted = contract_corridors(g, cells)
+    (junction,) = contracted.edges
+    assert contracted.cost(junction, junction) == 8
+
+
+@pytest.mark.parametrize("guide", [None, heuristic])
+def test_bidirectional_search(guide):
+    rng = random.Random(18)
+    g = GridWithWeights(15, 15)
+    g.weights = {(x, y): rng.randint(1, 9) for x in range(15) for y in range(15)}
+    g.walls = [(7, y) for y in range(14)]
+    start, goal = (0, 0), (14, 0)
+    _, expected = dijkstra_search(g, start, goal)
+    came_from, cost_so_far = bidirectional_search(g, start, goal, heuristic=guide)
+    assert cost_so_far[goal] == expected[goal]
+    path = reconstruct_path(came_from, start, goal)
+    assert path[0] == start and path[-1] == goal
+    assert sum(g.cost(a, b) for a, b in zip(path, path[1:])) == expected[goal]
+
+
+def test_bidirectional_search_directed():
+    graph = WeightedEdges({("A", "B"): 1, ("B", "C"): 1, ("C", "A"): 1, ("A", "C"): 5})
+    reversed_graph = reverse_graph(graph, "ABC")
+    came_from, cost_so_far = bidirectional_search(
+        graph, "A", "C", reverse=reversed_graph
+    )
+    assert cost_so_far["C"] == 2
+    assert reconstruct_path(came_from, "A", "C") == ["A", "B", "C"]
+    came_from, cost_so_far = bidirectional_search(
+        graph, "C", "B", reverse=reversed_graph
+    )
+    assert reconstruct_path(came_from, "C", "B") == ["C", "A", "B"]
+
+
+def test_bidirectional_search_no_path():
+    g = SquareGrid(5, 5)
+    g.walls = [(2, y) for y in range(5)]
+    came_from, _ = bidirectional_search(g, (0, 0), (4, 4))
+    assert reconstruct_path(came_from, (0, 0), (4, 4)) == []
+    came_from, cost_so_far = bidirectional_search(g, (0, 0), (0, 0))
+    assert cost_so_far[(0, 0)] == 0
+
+
+def test_render_grid():
+    g = SquareGrid(4, 3)
+    g.walls = [(1, 1)]
+    came_from = {(1, 0): (0, 0), (2, 1): (2, 0), (3, 1): (3, 2)}
+    frame = render_grid(g, point_to=came_from, start=(0, 0), sand={(3, 0)}, trim=True)
+    assert frame == "____\nA<.o\n.#^v\n....\n~~~~\n"
+    frame = render_grid(g, path=[(0, 2), (9, 9)], blank=True, draw_axis=True)
+    assert frame.splitlines()[1:5] == [
+        "  0123",
+        "0             ",
+        "1    ###      ",
+        "2  @          ",
+    ]
+
+
+def test_grid_renderer_diff():
+    g = SquareGrid(3, 2)
+    stream = io.StringIO()
+    renderer = GridRenderer(stream, diff=True)
+    renderer.draw(g, trim=True)
+    assert stream.getvalue() == "___\n...\n...\n~~~\n"
+    stream.seek(0)
+    stream.truncate()
+    renderer.draw(g, trim=True, sand=[(1, 1)])
+    assert stream.getvalue() == "\x1b[4F\x1b[1E\x1b[1E\x1b[2K.o.\n\x1b[1E"
+
+
 if __name__ == "__main__":
     example_graph = SimpleGraph()
     example_graph.edges = {
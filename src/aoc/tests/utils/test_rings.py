@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+"""Test the circular sequences in aoc.utils"""
+
+import random
+
+import pytest
+
+from aoc.utils import IndexedRing, MyNode, SuccessorRing
+
+
+def test_indexed_ring():
+    ring = IndexedRing("abcde")
+    assert len(ring) == 5
+    assert ring.at(1) == "b"
+    assert ring[7] == "c"
+    assert ring.at(-1) == "e"
+    assert ring.index_of("d") == 3
+    assert str(ring) == "[a, b, c, d, e]"
+    with pytest.raises(ValueError):
+        IndexedRing("aa")
+
+
+def test_indexed_ring_move():
+    ring = IndexedRing([4, -2, 5, 6, 7, 8, 9])
+    assert ring.move(-2, -2) == 5
+    assert list(ring) == [4, 5, 6, 7, 8, -2, 9]
+    # A full turn puts an item back where it was
+    ring.move(6, 6)
+    assert list(ring) == [4, 5, 6, 7, 8, -2, 9]
+    ring.remove(4)
+    ring.insert(6, 4)
+    assert list(ring) == [5, 6, 7, 8, -2, 9, 4]
+
+
+def test_indexed_ring_matches_list():
+    rng = random.Random(21)
+    items = list(range(500))
+    ring = IndexedRing(items)
+    for _ in range(2000):
+        item = rng.choice(items)
+        offset = rng.randint(-(10**6), 10**6)
+        position = items.index(item)
+        items.remove(item)
+        items.insert((position + offset) % len(items), item)
+        ring.move(item, offset)
+    assert list(ring) == items
+    assert all(ring.index_of(item) == i for i, item in enumerate(items))
+    assert len(ring.blocks) > 1
+
+
+def test_successor_ring():
+    ring = SuccessorRing([3, 8, 9, 1], capacity=12)
+    assert list(ring.iterate(9)) == [9, 1, 3, 8]
+    assert ring.next[1] == 3 and ring.previous[3] == 1
+    assert 2 not in ring
+    ring.insert_after(1, 11)
+    assert list(ring.iterate(3)) == [3, 8, 9, 1, 11]
+    assert ring.cut(9, 2) == [1, 11]
+    assert list(ring.iterate(3)) == [3, 8, 9]
+    assert 11 not in ring
+    ring.splice(3, [1, 11])
+    assert list(ring.iterate(3)) == [3, 1, 11, 8, 9]
+    ring.remove(3)
+    assert list(ring.iterate(1)) == [1, 11, 8, 9]
+    assert len(ring) == 4
+    with pytest.raises(ValueError):
+        ring.cut(1, 4)
+
+
+def play_crab_cups(cups: str, moves: int) -> str:
+    labels = [int(cup) for cup in cups]
+    ring = SuccessorRing(labels)
+    highest = max(labels)
+    current = labels[0]
+    for _ in range(moves):
+        picked = ring.peek(current, 3)
+        destination = current - 1 or highest
+        while destination in picked:
+            destination = destination - 1 or highest
+        ring.move_run(current, 3, destination)
+        current = ring.next[current]
+    return "".join(map(str, ring.iterate(1)))[1:]
+
+
+def test_crab_cups():
+    assert play_crab_cups("389125467", 10) == "92658374"
+    assert play_crab_cups("389125467", 100) == "67384529"
+
+
+def test_move_run_keeps_predecessors():
+    ring = SuccessorRing(range(8))
+    ring.move_run(1, 3, 6)
+    assert list(ring.iterate(0)) == [0, 1, 5, 6, 2, 3, 4, 7]
+    assert [ring.previous[item] for item in ring.iterate(1)] == [0, 1, 5, 6, 2, 3, 4, 7]
+
+
+def test_move_run_bounds():
+    ring = SuccessorRing(range(4))
+    for k in (0, -1, 4):
+        with pytest.raises(ValueError):
+            ring.move_run(0, k, 2)
+    assert list(ring.iterate(0)) == [0, 1, 2, 3]
+    # Every other item is a run that can only go back after `item`
+    ring.move_run(0, 3, 0)
+    assert list(ring.iterate(0)) == [0, 1, 2, 3]
+    ring.move_run(0, 1, 3)
+    assert list(ring.iterate(0)) == [0, 2, 3, 1]
+
+
+def test_my_node_slots():
+    node = MyNode(1)
+    node.next = node.previous = node
+    assert node + 5 is node
+    with pytest.raises(AttributeError):
+        node.other = 1
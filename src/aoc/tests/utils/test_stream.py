@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+"""Test the streaming input helpers"""
+
+import mmap
+
+import pytest
+
+from aoc.utils import inputs
+from aoc.utils.inputs import InputNotFoundError, InputStore
+from aoc.utils.stream import Records, open_input, restartable
+from aoc.y2022.communications import Message
+from aoc.y2023 import d15
+from aoc.y2024 import d03
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    store = InputStore(tmp_path)
+    monkeypatch.setattr(inputs, "_store", store)
+    return store
+
+
+def test_records():
+    records = Records(" a b \n\nc\r\nd", sep=b"\n")
+    assert [bytes(record) for record in records] == [b"a b", b"c", b"d"]
+    # Iterating again starts over
+    assert [bytes(record) for record in records] == [b"a b", b"c", b"d"]
+    assert list(Records(b"")) == []
+    unstripped = Records(b"1, 2,,3", sep=b",", strip=False)
+    assert [bytes(record) for record in unstripped] == [b"1", b" 2", b"3"]
+
+
+def test_records_share_memory():
+    buffer = bytearray(b"ab\ncd\n")
+    first, second = Records(buffer)
+    buffer[3] = ord("x")
+    assert bytes(second) == b"xd"
+    assert bytes(first) == b"ab"
+
+
+def test_records_map():
+    numbers = Records(b"1\n2\n3\n").map(int)
+    assert list(numbers) == [1, 2, 3]
+    assert sum(numbers) == 6
+
+
+def test_restartable():
+    @restartable
+    def lines(text):
+        yield from text.splitlines()
+
+    parsed = lines("a\nb")
+    assert list(parsed) == ["a", "b"]
+    assert list(parsed) == ["a", "b"]
+    assert lines.__name__ == "lines"
+
+
+def test_open_input(store):
+    store.put(
+        2023, 15, "input", "rn=1,cm-,qp=3,cm=2,qp-,pc=4,ot=9,ab=5,pc-,pc=6,ot=7\n"
+    )
+    buffer = open_input(2023, 15)
+    assert isinstance(buffer, mmap.mmap)
+    steps = d15.parse(buffer)
+    assert d15.solve_part_one(steps) == 1320
+    assert d15.solve_part_two(steps) == 145
+    with pytest.raises(InputNotFoundError):
+        open_input(2023, 16)
+
+
+def test_large_buffers(store):
+    program = (
+        b"xmul(2,4)&mul[3,7]!^don't()_mul(5,5)+mul(32,64](mul(11,8)undo()?mul(8,5))"
+    )
+    store.put(2024, 3, "input", (program * 20_000).decode())
+    buffer = open_input(2024, 3)
+    assert d03.solve_part_one(buffer) == 20_000 * 161
+    assert d03.solve_part_two(buffer) == 8 + 40 + 19_999 * 48
+
+    store.put(2022, 6, "input", "m" * 1_000_000 + "mjqjpqmgbljsphdztnvjfqwrcgsmlb")
+    message = Message(open_input(2022, 6))
+    assert message.start_packet == 1_000_000 + 7
+    assert message.start_message == 1_000_000 + 19
@@ -0,0 +1,47 @@
+#!/usr/bin/env python
+"""Test verbosity-gated tracing"""
+
+import pytest
+
+from aoc.utils import trace
+
+
+@pytest.fixture
+def level():
+    previous = trace.level
+    yield trace.set_level
+    trace.set_level(previous)
+
+
+def test_disabled_skips_formatting(level, capsys):
+    level(trace.OFF)
+
+    def expensive():
+        raise AssertionError("formatted while disabled")
+
+    trace.trace(expensive)
+    trace.debug("%s", object())
+    assert capsys.readouterr().err == ""
+
+
+def test_enabled_levels(level, capsys):
+    level(trace.DEBUG)
+    trace.info("info %d", 1)
+    trace.debug("debug %s", "two")
+    trace.trace("trace %d", 3)
+    trace.debug(lambda: "lazy")
+    assert capsys.readouterr().err == "info 1\ndebug two\nlazy\n"
+
+
+def test_level_from_env(monkeypatch):
+    monkeypatch.setenv("AOC_TRACE", "info")
+    assert trace.level_from_env() == trace.INFO
+    monkeypatch.setenv("AOC_TRACE", "verbose")
+    with pytest.warns(UserWarning, match="AOC_TRACE='verbose'"):
+        assert trace.level_from_env() == trace.OFF
+
+
+def test_parse_level():
+    assert trace.parse_level("") == trace.OFF
+    assert trace.parse_level("Debug") == trace.DEBUG
+    assert trace.parse_level("3") == trace.TRACE
@@ -1,22 +1,19 @@
 #!/usr/bin/env python
 """Tests for AoC 3, 2021"""
 
-# Third party imports
-from aocd.models import Puzzle
+from aoc.utils.inputs import get_example
 from aoc.y2021.d03 import parse, solve_part_one, solve_part_two
 import pytest
 
 
 @pytest.fixture
 def example1():
-    puzzle = Puzzle(year=2021, day=3)
-    return puzzle.example_data.splitlines()
+    return get_example(2021, 3).splitlines()
 
 
 @pytest.fixture
 def example2():
-    puzzle = Puzzle(year=2021, day=3)
-    return puzzle.example_data.splitlines()
+    return get_example(2021, 3).splitlines()
 
 
 @pytest.mark.skip(reason="Not implemented")
@@ -1,23 +1,19 @@
 #!/usr/bin/env python
 """Tests for AoC 1, 2022"""
 
-# Third party imports
-from aocd.models import Puzzle
-
+from aoc.utils.inputs import get_example
 from aoc.y2022.d01 import parse, solve_part_one, solve_part_two
 import pytest
 
 
 @pytest.fixture
 def example1():
-    puzzle = Puzzle(year=2022, day=1)
-    return parse(puzzle.example_data)
+    return parse(get_example(2022, 1))
 
 
 @pytest.fixture
 def example2():
-    puzzle = Puzzle(year=2022, day=1)
-    puzzle_input = puzzle.example_data
+    puzzle_input = get_example(2022, 1)
     return parse(puzzle_input)
 
 
@@ -3,22 +3,18 @@
 
 import pytest
 
-# Third party imports
-from aocd.models import Puzzle
-
+from aoc.utils.inputs import get_example
 from aoc.y2022.d02 import parse, score_round, solve_part_one, solve_part_two
 
 
 @pytest.fixture
 def example1():
-    puzzle = Puzzle(year=2022, day=2)
-    return puzzle.example_data
+    return get_example(2022, 2)
 
 
 @pytest.fixture
 def example2():
-    puzzle = Puzzle(year=2022, day=2)
-    return parse(puzzle.example_data)
+    return parse(get_example(2022, 2))
 
 
 @pytest.mark.skip(reason="Not implemented")
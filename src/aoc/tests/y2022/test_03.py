@@ -3,22 +3,18 @@
 
 import pytest
 
-# Third party imports
-from aocd.models import Puzzle
-
+from aoc.utils.inputs import get_example
 from aoc.y2022.d03 import parse, solve_part_one, solve_part_two
 
 
 @pytest.fixture
 def example1():
-    puzzle = Puzzle(year=2022, day=3)
-    return puzzle.example_data
+    return get_example(2022, 3)
 
 
 @pytest.fixture
 def example2():
-    puzzle = Puzzle(year=2022, day=3)
-    return puzzle.example_data
+    return get_example(2022, 3)
 
 
 @pytest.mark.skip(reason="Not implemented")
@@ -3,9 +3,7 @@
 
 import pytest
 
-# Third party imports
-from aocd.models import Puzzle
-
+from aoc.utils.inputs import get_example, get_input
 from aoc.y2022.d05 import (
     parse,
     parse_initialization,
@@ -17,8 +15,7 @@ from aoc.y2022.d05 import (
 
 @pytest.fixture
 def example_data():
-    puzzle = Puzzle(year=2022, day=5)
-    return puzzle.example_data
+    return get_example(2022, 5)
 
 
 def test_parse_initial_data():
@@ -39,8 +36,7 @@ def test_parse_initial_data():
         ["D", "L", "V", "Z", "R", "H", "Q"],
         ["B", "H", "G", "N", "F", "Z", "L", "D"],
     ]
-    puzzle = Puzzle(year=2022, day=5)
-    input_data = puzzle.input_data
+    input_data = get_input(2022, 5)
     assert parse_initialization(input_data) == expected
 
 
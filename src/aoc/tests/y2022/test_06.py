@@ -3,17 +3,14 @@
 
 import pytest
 
-# Third party imports
-from aocd.models import Puzzle
-
+from aoc.utils.inputs import get_example
 from aoc.y2022.communications import Message
 from aoc.y2022.d06 import parse, solve_part_one, solve_part_two
 
 
 @pytest.fixture
 def example_data():
-    puzzle = Puzzle(year=2022, day=6)
-    return puzzle.example_data
+    return get_example(2022, 6)
 
 
 @pytest.mark.skip(reason="Not implemented")
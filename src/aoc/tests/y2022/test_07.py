@@ -5,16 +5,12 @@ from pathlib import PurePath
 
 import pytest
 
-# Third party imports
-from aocd.models import Puzzle
-
 from aoc.y2022.communications import Directory, File, get_size, walk_commands
 from aoc.y2022.d07 import parse, solve_part_one, solve_part_two
 
 
 @pytest.fixture
 def example_data():
-    puzzle = Puzzle(year=2022, day=7)
     example_data = """$ cd /
 $ ls
 dir a
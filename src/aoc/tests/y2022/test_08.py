@@ -3,9 +3,7 @@
 
 import pytest
 
-# Third party imports
-from aocd.models import Puzzle
-
+from aoc.utils.inputs import get_example
 from aoc.y2022.d08 import (
     expand_grid,
     parse,
@@ -18,8 +16,7 @@ from aoc.y2022.d08 import (
 
 @pytest.fixture
 def example_data():
-    puzzle = Puzzle(year=2022, day=8)
-    return puzzle.example_data
+    return get_example(2022, 8)
 
 
 def test_expand_grid():
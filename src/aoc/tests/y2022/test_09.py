@@ -3,9 +3,6 @@
 
 import pytest
 
-# Third party imports
-from aocd.models import Puzzle
-
 from aoc.y2022.d09 import (
     calculate_tail_position,
     calculate_visited_positions,
@@ -17,7 +14,6 @@ from aoc.y2022.d09 import (
 
 @pytest.fixture
 def example_data():
-    puzzle = Puzzle(year=2022, day=9)
     example_data = """R 4
 U 4
 L 3
@@ -3,9 +3,6 @@
 
 import pytest
 
-# Third party imports
-from aocd.models import Puzzle
-
 from aoc.y2022.d10 import (
     get_signal_strength,
     parse,
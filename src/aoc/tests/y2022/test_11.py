@@ -5,16 +5,13 @@ import operator
 
 import pytest
 
-# Third party imports
-from aocd.models import Puzzle
-
+from aoc.utils.inputs import get_example
 from aoc.y2022.d11 import Monkey, parse, run_rounds, solve_part_one, solve_part_two
 
 
 @pytest.fixture
 def example_data():
-    puzzle = Puzzle(year=2022, day=11)
-    return puzzle.example_data
+    return get_example(2022, 11)
 
 
 def test_monkey_line_parse():
@@ -3,16 +3,13 @@
 
 import pytest
 
-# Third party imports
-from aocd.models import Puzzle
-
+from aoc.utils.inputs import get_example
 from aoc.y2022.d12 import parse, solve_part_one, solve_part_two
 
 
 @pytest.fixture
 def example_data():
-    puzzle = Puzzle(year=2022, day=12)
-    return puzzle.example_data
+    return get_example(2022, 12)
 
 
 @pytest.mark.skip(reason="Not implemented")
@@ -40,6 +37,15 @@ acdefghi"""
     assert solve_part_two(hill) == expected
 
 
+def test_part2_unreachable():
+    input_data = """Sabqponm
+abcrzzzz
+accszExz
+acctzzzz
+abdefghi"""
+    assert solve_part_two(parse(input_data)) == float("inf")
+
+
 def test_part2_example2(example_data):
     """Test part 2 on example input"""
     # expected = 29
@@ -3,16 +3,13 @@
 
 import pytest
 
-# Third party imports
-from aocd.models import Puzzle
-
+from aoc.utils.inputs import get_example
 from aoc.y2022.d13 import is_ordered, parse, solve_part_one, solve_part_two
 
 
 @pytest.fixture
 def example_data():
-    puzzle = Puzzle(year=2022, day=13)
-    return puzzle.example_data
+    return get_example(2022, 13)
 
 
 @pytest.mark.parametrize(
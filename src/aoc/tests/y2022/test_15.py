@@ -3,16 +3,18 @@
 
 import pytest
 
-# Third party imports
-from aocd.models import Puzzle
-
-from aoc.y2022.d15 import parse, solve_part_one, solve_part_two
+from aoc.utils.inputs import get_example
+from aoc.y2022.d15 import TunnelSystem, parse, solve_part_one, solve_part_two
 
 
 @pytest.fixture
 def example_data():
-    puzzle = Puzzle(year=2022, day=15)
-    return puzzle.example_data
+    return get_example(2022, 15)
+
+
+def test_parse_sensor_beacon():
+    line = "Sensor at x=2, y=18: closest beacon is at x=-2, y=15".split(" ")
+    assert TunnelSystem.parse_sensor_beacon(line) == ((2, 18), (-2, 15), 7)
 
 
 def test_parse(example_data):
@@ -3,16 +3,13 @@
 
 import pytest
 
-# Third party imports
-from aocd.models import Puzzle
-
+from aoc.utils.inputs import get_example
 from aoc.y2022.d16 import calculate_distances, parse, solve_part_one, solve_part_two
 
 
 @pytest.fixture
 def example_data():
-    puzzle = Puzzle(year=2022, day=16)
-    return puzzle.example_data
+    return get_example(2022, 16)
 
 
 def test_parse(example_data):
@@ -33,7 +30,26 @@ Valve JJ has flow rate=21; tunnel leads to valve II"""
 
 def test_distances(example_data):
     graph = parse(example_data)
-    assert calculate_distances(graph) == graph.calculate_distances()
+    distances = calculate_distances(graph)
+    assert distances["AA"]["AA"] == 0
+    assert distances["AA"]["JJ"] == 2
+    assert distances["AA"]["HH"] == 5
+    assert distances["JJ"]["HH"] == 7
+    assert graph.calculate_distances()["JJ"]["HH"] == 7
+
+
+def test_distances_unreachable():
+    graph = parse(
+        """Valve AA has flow rate=0; tunnel leads to valve BB
+Valve BB has flow rate=3; tunnel leads to valve AA
+Valve CC has flow rate=5; tunnel leads to valve DD
+Valve DD has flow rate=0; tunnel leads to valve CC"""
+    )
+    distances = calculate_distances(graph)
+    assert distances["AA"]["BB"] == 1
+    assert distances["AA"]["CC"] == float("inf")
+    assert distances["AA"]["ZZ"] == float("inf")
+    assert graph.calculate_distances()["AA"]["CC"] == -1
 
 
 def test_part1(example_data):
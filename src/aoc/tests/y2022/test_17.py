@@ -3,9 +3,6 @@
 
 import pytest
 
-# Third party imports
-from aocd.models import Puzzle
-
 from aoc.y2022.d17 import parse, solve_part_one, solve_part_two
 
 
@@ -3,8 +3,7 @@
 
 import pytest
 
-# Third party imports
-from aocd.models import Puzzle
+from aoc.utils.inputs import get_example
 from aoc.y2023.d03 import (
     parse,
     solve_part_one,
@@ -16,8 +15,7 @@ from aoc.y2023.d03 import (
 
 @pytest.fixture
 def example_data():
-    puzzle = Puzzle(year=2023, day=3)
-    return puzzle.examples[0].input_data
+    return get_example(2023, 3)
 
 
 def test_parse(example_data):
@@ -3,15 +3,13 @@
 
 import pytest
 
-# Third party imports
-from aocd.models import Puzzle
+from aoc.utils.inputs import get_example
 from aoc.y2023.d04 import parse, solve_part_one, solve_part_two
 
 
 @pytest.fixture
 def example_data():
-    puzzle = Puzzle(year=2023, day=4)
-    return puzzle.examples[0].input_data
+    return get_example(2023, 4)
 
 
 def test_parse(example_data):
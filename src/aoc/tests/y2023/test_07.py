@@ -3,8 +3,7 @@
 
 import pytest
 
-# Third party imports
-from aocd.models import Puzzle
+from aoc.utils.inputs import get_example
 from aoc.y2023.d07 import (
     parse,
     solve_part_one,
@@ -18,8 +17,7 @@ from aoc.y2023.d07 import (
 
 @pytest.fixture
 def example_data():
-    puzzle = Puzzle(year=2023, day=7)
-    return puzzle.examples[0].input_data
+    return get_example(2023, 7)
 
 
 @pytest.mark.parametrize(
@@ -3,8 +3,7 @@
 
 import pytest
 
-# Third party imports
-from aocd.models import Puzzle
+from aoc.utils.inputs import get_example
 from aoc.y2023.d14 import (
     hash_graph,
     parse,
@@ -18,8 +17,7 @@ from aoc.y2023.d14 import (
 
 @pytest.fixture
 def example_data():
-    puzzle = Puzzle(year=2023, day=14)
-    return puzzle.examples[0].input_data
+    return get_example(2023, 14)
 
 
 def test_parse(example_data):
@@ -3,15 +3,13 @@
 
 import pytest
 
-# Third party imports
-from aocd.models import Puzzle
+from aoc.utils.inputs import get_example
 from aoc.y2023.d15 import parse, solve_part_one, solve_part_two, hash_string
 
 
 @pytest.fixture
 def example_data():
-    puzzle = Puzzle(year=2023, day=15)
-    return puzzle.examples[0].input_data
+    return get_example(2023, 15)
 
 
 @pytest.mark.parametrize(
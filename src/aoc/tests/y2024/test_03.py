@@ -3,15 +3,13 @@
 
 import pytest
 
-# Third party imports
-from aocd.models import Puzzle
+from aoc.utils.inputs import get_example
 from aoc.y2024.d03 import parse, solve_part_one, solve_part_two
 
 
 @pytest.fixture
 def example_data():
-    puzzle = Puzzle(year=2024, day=3)
-    return puzzle.examples[0].input_data
+    return get_example(2024, 3)
 
 
 def test_parse(example_data):
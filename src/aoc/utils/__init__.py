@@ -1,9 +1,15 @@
 """Utilities for aoc"""
 
+from array import array
+from math import isqrt
+from typing import Hashable, Iterable, Iterator, Optional
+
 # From https://realpython.com/linked-lists-python/
 
 
 class MyNode:
+    __slots__ = ("data", "next", "previous")
+
     def __init__(self, data):
         self.data = data
         self.next = None
@@ -78,3 +84,208 @@ class CircularLinkedList:
             yield node
             node = node.next
         yield node
+
+
+class IndexedRing:
+    """A circular sequence of distinct items with positional access.
+
+    Items are kept in blocks of about sqrt(n) items, so `at`, `index_of`,
+    `insert`, `remove` and `move` take O(sqrt(n)) instead of walking the ring one
+    node at a time. Positions wrap around like the ring does.
+    """
+
+    def __init__(self, items: Iterable[Hashable] = ()):
+        items = list(items)
+        self.size = len(items)
+        self.block_size = max(16, isqrt(self.size))
+        self.blocks: list[list] = [
+            items[i : i + self.block_size]
+            for i in range(0, len(items), self.block_size)
+        ] or [[]]
+        # Block holding each item
+        self.block_of: dict[Hashable, list] = {
+            item: block for block in self.blocks for item in block
+        }
+        if len(self.block_of) != self.size:
+            raise ValueError("Items of a ring must be distinct")
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __iter__(self) -> Iterator[Hashable]:
+        for block in self.blocks:
+            yield from block
+
+    def __contains__(self, item: Hashable) -> bool:
+        return item in self.block_of
+
+    def __getitem__(self, index: int) -> Hashable:
+        return self.at(index)
+
+    def __str__(self):
+        return f"[{', '.join(map(str, self))}]"
+
+    def at(self, index: int) -> Hashable:
+        """Return the item at `index`, modulo the length of the ring."""
+        if not self.size:
+            raise IndexError("Ring is empty")
+        index %= self.size
+        for block in self.blocks:
+            if index < len(block):
+                return block[index]
+            index -= len(block)
+
+    def index_of(self, item: Hashable) -> int:
+        """Return the position of `item`."""
+        block = self.block_of[item]
+        position = 0
+        for other in self.blocks:
+            if other is block:
+                return position + block.index(item)
+            position += len(other)
+
+    def insert(self, index: int, item: Hashable) -> None:
+        """Insert `item` before the item at `index`, at the end for `len(ring)`."""
+        if item in self.block_of:
+            raise ValueError(f"{item!r} is already in the ring")
+        for block_index, block in enumerate(self.blocks):
+            if index <= len(block):
+                break
+            index -= len(block)
+        block.insert(index, item)
+        self.block_of[item] = block
+        self.size += 1
+        if len(block) > 2 * self.block_size:
+            # Split the block in two so that it stays cheap to scan
+            tail = block[self.block_size :]
+            del block[self.block_size :]
+            self.blocks.insert(block_index + 1, tail)
+            for moved in tail:
+                self.block_of[moved] = tail
+
+    def remove(self, item: Hashable) -> None:
+        block = self.block_of.pop(item)
+        block.remove(item)
+        self.size -= 1
+        if not block and len(self.blocks) > 1:
+            self.blocks = [other for other in self.blocks if other is not block]
+
+    def move(self, item: Hashable, offset: int) -> int:
+        """Move `item` `offset` places forward, or backward when negative.
+
+        The ring without `item` has one item less, so moving by `len(ring) - 1`
+        puts it back where it was. Returns the new position of `item`.
+        """
+        if self.size <= 1:
+            return 0
+        position = self.index_of(item)
+        self.remove(item)
+        position = (position + offset) % self.size
+        self.insert(position, item)
+        return position
+
+
+class SuccessorRing:
+    """A circular list of ints stored as successor and predecessor arrays.
+
+    `next[item]` and `previous[item]` are the items after and before `item`, -1 for
+    ints that aren't in the ring. There are no node objects and every operation
+    costs O(1) per item it touches, which suits rings of millions of items such as
+    the crab cups.
+    """
+
+    def __init__(self, items: Iterable[int], capacity: Optional[int] = None):
+        """Link `items` in order. `capacity` bounds the ints that can be added."""
+        items = list(items)
+        if capacity is None:
+            capacity = max(items, default=-1) + 1
+        if len(set(items)) != len(items):
+            raise ValueError("Items of a ring must be distinct")
+        self.next = array("l", [-1]) * capacity
+        self.previous = array("l", [-1]) * capacity
+        self.length = len(items)
+        for item, following in zip(items, items[1:] + items[:1]):
+            self.next[item] = following
+            self.previous[following] = item
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __contains__(self, item: int) -> bool:
+        return 0 <= item < len(self.next) and self.next[item] != -1
+
+    def iterate(self, start: int) -> Iterator[int]:
+        """Yield every item once, going forward from `start`."""
+        item = start
+        for _ in range(self.length):
+            yield item
+            item = self.next[item]
+
+    def insert_after(self, item: int, new: int) -> None:
+        """Insert `new`, which mustn't be in the ring, right after `item`."""
+        following = self.next[item]
+        self.next[item] = new
+        self.previous[new] = item
+        self.next[new] = following
+        self.previous[following] = new
+        self.length += 1
+
+    def remove(self, item: int) -> None:
+        before, after = self.previous[item], self.next[item]
+        self.next[before] = after
+        self.previous[after] = before
+        self.next[item] = self.previous[item] = -1
+        self.length -= 1
+
+    def cut(self, item: int, k: int = 1) -> list[int]:
+        """Remove the `k` items after `item` and return them in order."""
+        if not 0 <= k < self.length:
+            raise ValueError(f"Can't cut {k} items after {item!r}")
+        run = []
+        current = item
+        for _ in range(k):
+            current = self.next[current]
+            run.append(current)
+        if run:
+            after = self.next[current]
+            self.next[item] = after
+            self.previous[after] = item
+            for removed in run:
+                self.next[removed] = self.previous[removed] = -1
+            self.length -= k
+        return run
+
+    def peek(self, item: int, k: int = 1) -> list[int]:
+        """Return the `k` items after `item` without removing them."""
+        run = []
+        for _ in range(k):
+            item = self.next[item]
+            run.append(item)
+        return run
+
+    def move_run(self, item: int, k: int, destination: int) -> None:
+        """Move the `k` items after `item` right after `destination`, in order.
+
+        Only the ends of the run are relinked, so this is a cut and splice without
+        touching the items in between. `destination` mustn't be in the run.
+        """
+        if not 1 <= k < self.length:
+            raise ValueError(f"Can't move {k} items after {item!r}")
+        next, previous = self.next, self.previous
+        first = last = next[item]
+        for _ in range(k - 1):
+            last = next[last]
+        after = next[last]
+        next[item] = after
+        previous[after] = item
+        following = next[destination]
+        next[destination] = first
+        previous[first] = destination
+        next[last] = following
+        previous[following] = last
+
+    def splice(self, item: int, run: Iterable[int]) -> None:
+        """Insert the items of `run`, e.g. a cut, in order right after `item`."""
+        for new in run:
+            self.insert_after(item, new)
+            item = new
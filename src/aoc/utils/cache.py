@@ -0,0 +1,144 @@
+#!/usr/bin/env python
+"""On-disk cache for expensive parse() results.
+
+Results are pickled to `CACHE_DIR/<key>.pickle` where the key is a SHA-256 of the
+parser's module version, its name and its arguments. The module version covers the
+source of the parser's module and every `aoc` module it references, so editing a
+solution or a helper it relies on invalidates its cached results.
+
+Set `AOC_PARSE_CACHE=0` to disable the cache and `AOC_PARSE_CACHE_SIZE` to bound
+its size in bytes; the least recently used entries are evicted first.
+"""
+import functools
+import hashlib
+import inspect
+import os
+import pickle
+import sys
+from pathlib import Path
+from types import ModuleType
+from typing import Callable, Optional, Union
+
+from aoc import ROOT_DIR
+
+CACHE_DIR = Path(
+    os.environ.get("AOC_PARSE_CACHE_DIR", ROOT_DIR.parent.parent / ".parse_cache")
+)
+MAX_CACHE_BYTES = int(os.environ.get("AOC_PARSE_CACHE_SIZE", 256 * 1024 * 1024))
+
+_module_versions: dict[str, str] = {}
+
+
+def cache_enabled() -> bool:
+    return os.environ.get("AOC_PARSE_CACHE", "1") != "0"
+
+
+def module_version(module: ModuleType) -> str:
+    """Hash the source of a module and the `aoc` modules it references."""
+    if module.__name__ in _module_versions:
+        return _module_versions[module.__name__]
+
+    files = {module.__file__}
+    for value in vars(module).values():
+        if isinstance(value, ModuleType):
+            dependency = value
+        else:
+            dependency = sys.modules.get(getattr(value, "__module__", None) or "")
+        name = getattr(dependency, "__name__", "")
+        if name.startswith("aoc") and getattr(dependency, "__file__", None):
+            files.add(dependency.__file__)
+
+    digest = hashlib.sha256()
+    for file in sorted(files):
+        with open(file, "rb") as f:
+            digest.update(f.read())
+    _module_versions[module.__name__] = digest.hexdigest()
+    return _module_versions[module.__name__]
+
+
+def cache_key(func: Callable, args: tuple, kwargs: dict) -> Optional[str]:
+    """Return the cache key for a call, or None if the arguments can't be hashed."""
+    digest = hashlib.sha256()
+    digest.update(module_version(inspect.getmodule(func)).encode())
+    digest.update(func.__qualname__.encode())
+    for arg in args:
+        if isinstance(arg, str):
+            digest.update(hashlib.sha256(arg.encode()).digest())
+        elif isinstance(arg, bytes):
+            digest.update(hashlib.sha256(arg).digest())
+        else:
+            return None
+    try:
+        digest.update(pickle.dumps(sorted(kwargs.items())))
+    except (pickle.PicklingError, TypeError, AttributeError):
+        return None
+    return digest.hexdigest()
+
+
+def evict(cache_dir: Path, max_bytes: int) -> None:
+    """Remove the least recently used entries until the cache fits."""
+    entries = []
+    for path in cache_dir.glob("*.pickle"):
+        stat = path.stat()
+        entries.append((stat.st_mtime, stat.st_size, path))
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        total -= size
+
+
+def cached_parse(
+    func: Optional[Callable] = None,
+    *,
+    cache_dir: Union[str, Path, None] = None,
+    max_bytes: Optional[int] = None,
+):
+    """Cache the result of a parse function on disk.
+
+    Every call returns a freshly unpickled object, so solvers can keep mutating
+    their parsed data. Results that can't be pickled (e.g. generators) are
+    returned uncached.
+    """
+    if func is None:
+        return functools.partial(cached_parse, cache_dir=cache_dir, max_bytes=max_bytes)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if not cache_enabled():
+            return func(*args, **kwargs)
+        key = cache_key(func, args, kwargs)
+        if key is None:
+            return func(*args, **kwargs)
+
+        directory = Path(cache_dir or CACHE_DIR)
+        path = directory / f"{key}.pickle"
+        try:
+            with open(path, "rb") as f:
+                ret = pickle.load(f)
+            os.utime(path)  # mark as recently used
+            return ret
+        except FileNotFoundError:
+            pass
+        except (pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            # Corrupt or stale entry, parse again and overwrite it
+            pass
+
+        ret = func(*args, **kwargs)
+        try:
+            data = pickle.dumps(ret, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return ret
+        os.makedirs(directory, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+        evict(directory, max_bytes if max_bytes is not None else MAX_CACHE_BYTES)
+        return ret
+
+    return wrapper
@@ -1,4 +1,33 @@
-"""Rich console wrapper"""
-from rich.console import Console
+"""Rich console wrapper
 
-console = Console(color_system="truecolor")
+rich is only imported on first use, so solutions can print and track progress
+without paying for the import when they are driven by tests or benchmarks.
+"""
+import functools
+
+
+@functools.cache
+def get_console():
+    from rich.console import Console
+
+    return Console(color_system="truecolor")
+
+
+def __getattr__(name):
+    if name == "console":
+        return get_console()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def print(*objects, **kwargs):
+    """`rich.print`, imported on first call."""
+    from rich import print as rich_print
+
+    rich_print(*objects, **kwargs)
+
+
+def track(sequence, *args, **kwargs):
+    """`rich.progress.track`, imported on first call."""
+    from rich.progress import track as rich_track
+
+    return rich_track(sequence, *args, **kwargs)
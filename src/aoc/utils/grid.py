@@ -0,0 +1,242 @@
+#!/usr/bin/env python
+"""Dense character grids backed by a 2-D `uint8` NumPy array.
+
+Puzzle maps are parsed in one shot with `np.frombuffer`, one byte per cell instead of
+a dict entry per `(x, y)`. Locations are `(x, y)` like everywhere in
+`aoc.utils.pathfinding`, the array itself is indexed `[y, x]`.
+
+`TiledGrid` repeats a base tile without storing the copies.
+"""
+from functools import cached_property
+from typing import Callable, Iterable, Iterator, Optional, Sequence, Union
+
+import numpy as np
+
+from aoc.utils.pathfinding import BitmapOccupancy, GridLocation, SquareGrid
+
+Cell = Union[int, str]
+
+# (dx, dy) of the neighbors of a cell
+ORTHOGONAL = [(1, 0), (-1, 0), (0, -1), (0, 1)]  # E W N S
+DIAGONAL = [(1, -1), (-1, -1), (1, 1), (-1, 1)]  # NE NW SE SW
+
+
+def cell_value(value: Cell) -> int:
+    return ord(value) if isinstance(value, str) else value
+
+
+class ArrayGrid:
+    """A rectangular grid with one byte per cell.
+
+    `x_min` and `y_min` are the location of the top left cell, they only differ from 0
+    for padded grids so that padding doesn't shift existing locations.
+    """
+
+    def __init__(self, array: np.ndarray, x_min: int = 0, y_min: int = 0):
+        self.array = array
+        self.x_min = x_min
+        self.y_min = y_min
+
+    @classmethod
+    def from_text(cls, text: Union[str, bytes]) -> "ArrayGrid":
+        """Parse lines of equal length into a grid of their character codes."""
+        data = text.encode() if isinstance(text, str) else bytes(text)
+        data = data.replace(b"\r\n", b"\n").rstrip(b"\n") + b"\n"
+        width = data.index(b"\n")
+        height, remainder = divmod(len(data), width + 1)
+        rows = np.frombuffer(data, dtype=np.uint8)
+        if remainder or (rows[width :: width + 1] != ord("\n")).any():
+            raise ValueError("Lines have different lengths")
+        # Copy to drop the newlines and get a writable array
+        return cls(rows.reshape(height, width + 1)[:, :width].copy())
+
+    @classmethod
+    def from_digits(cls, text: Union[str, bytes]) -> "ArrayGrid":
+        """Parse a map of digits into a grid of their values."""
+        grid = cls.from_text(text)
+        grid.array -= ord("0")
+        return grid
+
+    @property
+    def width(self) -> int:
+        return self.array.shape[1]
+
+    @property
+    def height(self) -> int:
+        return self.array.shape[0]
+
+    def in_bounds(self, location: GridLocation) -> bool:
+        x, y = location
+        return 0 <= x - self.x_min < self.width and 0 <= y - self.y_min < self.height
+
+    __contains__ = in_bounds
+
+    def __getitem__(self, key):
+        """Return the value of a cell, or a view for `grid[x0:x1, y0:y1]`."""
+        x, y = key
+        if isinstance(x, slice) or isinstance(y, slice):
+            x, y = self._slice(x, self.x_min), self._slice(y, self.y_min)
+            return ArrayGrid(
+                self.array[y, x],
+                self.x_min + x.indices(self.width)[0],
+                self.y_min + y.indices(self.height)[0],
+            )
+        if not self.in_bounds(key):
+            raise IndexError(f"{key} is outside of the grid")
+        return int(self.array[y - self.y_min, x - self.x_min])
+
+    def __setitem__(self, location: GridLocation, value: Cell) -> None:
+        if not self.in_bounds(location):
+            raise IndexError(f"{location} is outside of the grid")
+        x, y = location
+        self.array[y - self.y_min, x - self.x_min] = cell_value(value)
+
+    @staticmethod
+    def _slice(key: Union[int, slice], offset: int) -> slice:
+        """Translate a slice of locations to a slice of array indices."""
+        if not isinstance(key, slice):
+            return slice(key - offset, key - offset + 1)
+        if key.step not in (None, 1):
+            raise ValueError("Grid slices can't have a step")
+        start = None if key.start is None else max(key.start - offset, 0)
+        stop = None if key.stop is None else max(key.stop - offset, 0)
+        return slice(start, stop)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, ArrayGrid):
+            return NotImplemented
+        same_origin = (self.x_min, self.y_min) == (other.x_min, other.y_min)
+        return same_origin and np.array_equal(self.array, other.array)
+
+    __hash__ = None
+
+    def __str__(self) -> str:
+        return "\n".join(row.tobytes().decode() for row in self.array)
+
+    def __repr__(self) -> str:
+        return f"ArrayGrid({self.width}x{self.height} at ({self.x_min}, {self.y_min}))"
+
+    def copy(self) -> "ArrayGrid":
+        return ArrayGrid(self.array.copy(), self.x_min, self.y_min)
+
+    def mask(self, values: Iterable[Cell]) -> np.ndarray:
+        """Return a boolean array of the cells holding any of `values`."""
+        if isinstance(values, int):
+            values = [values]
+        return np.isin(self.array, [cell_value(v) for v in values])
+
+    def find(self, values: Iterable[Cell]) -> list[GridLocation]:
+        """Return the locations of the cells holding any of `values`."""
+        ys, xs = np.nonzero(self.mask(values))
+        return [(int(x) + self.x_min, int(y) + self.y_min) for x, y in zip(xs, ys)]
+
+    def locations(self) -> Iterator[GridLocation]:
+        for y in range(self.y_min, self.y_min + self.height):
+            for x in range(self.x_min, self.x_min + self.width):
+                yield (x, y)
+
+    def pad(self, size: int = 1, fill: Cell = ".") -> "ArrayGrid":
+        """Return a copy surrounded by `size` cells of `fill`.
+
+        Neighbors of the original border cells are then in bounds, so they can be
+        read without bounds checks. Existing cells keep their locations.
+        """
+        array = np.pad(self.array, size, constant_values=cell_value(fill))
+        return ArrayGrid(array, self.x_min - size, self.y_min - size)
+
+    def neighbor_views(
+        self, diagonal: bool = False, fill: Cell = 0
+    ) -> dict[tuple[int, int], np.ndarray]:
+        """Return a view per direction of the neighbor of every cell.
+
+        `views[(dx, dy)][y, x]` is the value at `(x + dx, y + dy)`, or `fill` outside
+        of the grid. The views share one padded copy of the grid.
+        """
+        padded = np.pad(self.array, 1, constant_values=cell_value(fill))
+        directions = ORTHOGONAL + DIAGONAL if diagonal else ORTHOGONAL
+        return {
+            (dx, dy): padded[
+                1 + dy : 1 + dy + self.height, 1 + dx : 1 + dx + self.width
+            ]
+            for dx, dy in directions
+        }
+
+    def count_neighbors(
+        self, values: Iterable[Cell], diagonal: bool = True
+    ) -> np.ndarray:
+        """Return how many neighbors of each cell hold any of `values`."""
+        counts = np.zeros(self.array.shape, dtype=np.uint8)
+        neighbors = ArrayGrid(self.mask(values).view(np.uint8))
+        for view in neighbors.neighbor_views(diagonal=diagonal).values():
+            counts += view
+        return counts
+
+    def to_square_grid(self, walls: Iterable[Cell] = "#") -> SquareGrid:
+        """Return a SquareGrid whose walls are the cells holding any of `walls`.
+
+        The walls are copied into a bitmap in one go rather than cell by cell.
+        """
+        if (self.x_min, self.y_min) != (0, 0):
+            raise ValueError("SquareGrid locations start at (0, 0)")
+        grid = SquareGrid(self.width, self.height)
+        occupancy = BitmapOccupancy(self.width, self.height)
+        occupancy.cells[:] = self.mask(walls).tobytes()
+        grid.walls = occupancy
+        return grid
+
+
+def same_value(value: int, tile_x: int, tile_y: int) -> int:
+    return value
+
+
+class TiledGrid(SquareGrid):
+    """A grid made of `tiles_x` by `tiles_y` copies of a base tile.
+
+    Cells aren't stored. The value at `(x, y)` is `transform(value, tile_x, tile_y)`
+    of the value at the same position in the base tile, so expanding a map costs no
+    memory. Like GridWithWeights, moving to a cell costs its value.
+    """
+
+    def __init__(
+        self,
+        tile: Union[ArrayGrid, Sequence[Sequence[int]]],
+        tiles_x: int = 1,
+        tiles_y: Optional[int] = None,
+        transform: Callable[[int, int, int], int] = same_value,
+    ):
+        if isinstance(tile, ArrayGrid):
+            tile = tile.array.tolist()
+        self.tile = tile
+        self.tile_width = len(tile[0])
+        self.tile_height = len(tile)
+        self.tiles_x = tiles_x
+        self.tiles_y = tiles_x if tiles_y is None else tiles_y
+        self.transform = transform
+        super().__init__(self.tile_width * tiles_x, self.tile_height * self.tiles_y)
+
+    def value(self, location: GridLocation) -> int:
+        tile_x, x = divmod(location[0], self.tile_width)
+        tile_y, y = divmod(location[1], self.tile_height)
+        return self.transform(self.tile[y][x], tile_x, tile_y)
+
+    def __getitem__(self, location: GridLocation) -> int:
+        if not self.in_bounds(location):
+            raise IndexError(f"{location} is outside of the grid")
+        return self.value(location)
+
+    def cost(self, from_node: GridLocation, to_node: GridLocation) -> int:
+        return self.value(to_node)
+
+    @cached_property
+    def max_cost(self) -> Optional[int]:
+        """Largest cell value, found from the distinct values of the base tile."""
+        values = {value for row in self.tile for value in row}
+        costs = {
+            self.transform(value, tile_x, tile_y)
+            for value in values
+            for tile_x in range(self.tiles_x)
+            for tile_y in range(self.tiles_y)
+        }
+        if all(isinstance(cost, int) and cost >= 0 for cost in costs):
+            return max(costs)
+        return None
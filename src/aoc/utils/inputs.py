@@ -0,0 +1,158 @@
+#!/usr/bin/env python
+"""Offline store for puzzle inputs and example data.
+
+Inputs are stored content-addressed under `objects/` with an `index.json` mapping
+`{year}/{day:02}/{kind}` to the SHA-256 of the content. `kind` is `input` for the
+puzzle input or `example-{n}` for the n-th example.
+
+aocd is only used to fill in missing entries when fetching is allowed, either
+explicitly or by setting `AOC_ALLOW_FETCH=1`.
+"""
+import hashlib
+import json
+import mmap
+import os
+from pathlib import Path
+from typing import Optional, Union
+
+from aoc import ROOT_DIR
+
+STORE_DIR = Path(os.environ.get("AOC_INPUT_STORE", ROOT_DIR.parent.parent / "inputs"))
+
+
+class InputNotFoundError(LookupError):
+    """Raised when an input isn't stored and fetching isn't allowed."""
+
+
+def example_kind(index: int = 0) -> str:
+    return f"example-{index}"
+
+
+def fetch_allowed() -> bool:
+    return os.environ.get("AOC_ALLOW_FETCH", "") not in ("", "0")
+
+
+class InputStore:
+    """Content-addressed directory of puzzle inputs."""
+
+    def __init__(self, root: Union[str, Path] = STORE_DIR):
+        self.root = Path(root)
+        self.index_file = self.root / "index.json"
+        self._index: Optional[dict[str, str]] = None
+
+    @staticmethod
+    def key(year: int, day: int, kind: str = "input") -> str:
+        return f"{year}/{day:02}/{kind}"
+
+    @property
+    def index(self) -> dict[str, str]:
+        if self._index is None:
+            if os.path.exists(self.index_file):
+                with open(self.index_file) as f:
+                    self._index = json.load(f)
+            else:
+                self._index = {}
+        return self._index
+
+    def object_path(self, digest: str) -> Path:
+        return self.root / "objects" / digest[:2] / digest
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.index
+
+    def put(self, year: int, day: int, kind: str, data: str) -> str:
+        """Store data and return its digest."""
+        content = data.encode()
+        digest = hashlib.sha256(content).hexdigest()
+        path = self.object_path(digest)
+        if not os.path.exists(path):
+            os.makedirs(path.parent, exist_ok=True)
+            tmp_path = path.with_suffix(".tmp")
+            with open(tmp_path, "wb") as f:
+                f.write(content)
+            os.replace(tmp_path, path)
+        self.index[self.key(year, day, kind)] = digest
+        self._write_index()
+        return digest
+
+    def _write_index(self) -> None:
+        os.makedirs(self.root, exist_ok=True)
+        tmp_path = self.index_file.with_suffix(".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(self.index, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.index_file)
+
+    def read_bytes(
+        self, year: int, day: int, kind: str = "input"
+    ) -> Union[bytes, mmap.mmap]:
+        """Return the stored content as a read-only memory map."""
+        key = self.key(year, day, kind)
+        try:
+            digest = self.index[key]
+        except KeyError:
+            raise InputNotFoundError(
+                f"{key} is not in {self.root}, "
+                "run `fetch_inputs` or set AOC_ALLOW_FETCH=1"
+            ) from None
+        with open(self.object_path(digest), "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                # Empty files can't be mapped
+                return b""
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def read(self, year: int, day: int, kind: str = "input") -> str:
+        buffer = self.read_bytes(year, day, kind)
+        try:
+            return buffer[:].decode()
+        finally:
+            if isinstance(buffer, mmap.mmap):
+                buffer.close()
+
+    def get(
+        self,
+        year: int,
+        day: int,
+        kind: str = "input",
+        allow_fetch: Optional[bool] = None,
+    ) -> str:
+        """Read an input, fetching and storing it with aocd if allowed."""
+        if allow_fetch is None:
+            allow_fetch = fetch_allowed()
+        if self.key(year, day, kind) in self or not allow_fetch:
+            return self.read(year, day, kind)
+        data = fetch(year, day, kind)
+        self.put(year, day, kind, data)
+        return data
+
+
+def fetch(year: int, day: int, kind: str = "input") -> str:
+    """Retrieve an input or example from aocd."""
+    from aocd.models import Puzzle
+
+    puzzle = Puzzle(year=year, day=day)
+    if kind == "input":
+        return puzzle.input_data
+    index = int(kind.split("-")[1])
+    return puzzle.examples[index].input_data
+
+
+_store: Optional[InputStore] = None
+
+
+def get_store() -> InputStore:
+    global _store
+    if _store is None:
+        _store = InputStore()
+    return _store
+
+
+def get_input(year: int, day: int, allow_fetch: Optional[bool] = None) -> str:
+    """Return the puzzle input for a day."""
+    return get_store().get(year, day, "input", allow_fetch=allow_fetch)
+
+
+def get_example(
+    year: int, day: int, index: int = 0, allow_fetch: Optional[bool] = None
+) -> str:
+    """Return the example data for a day."""
+    return get_store().get(year, day, example_kind(index), allow_fetch=allow_fetch)
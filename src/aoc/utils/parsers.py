@@ -1,48 +1,133 @@
 #!/usr/bin/env python
 """Parsers for various AoC problems"""
 
+import json
+import re
+from typing import Callable, Optional
 
-def str_to_list(num: str) -> list:
-    """Convert an encoded list to a list.
+INT = re.compile(r"-?\d+")
+# Maps every byte but digits and "-" to a space
+INT_BYTES = bytes(c if chr(c) in "-0123456789" else ord(" ") for c in range(256))
+LOOSE_HYPHEN = re.compile(rb"-(?:(?<=\d-)|(?!\d))")
+NOT_BLANK = re.compile(r"^[ \t]*\S", re.MULTILINE)
+# Numbers, brackets and anything else that isn't a separator
+LIST_TOKEN = re.compile(r"-?\d+|[\[\]]|[^\s,]")
+NOT_LIST = re.compile(r"[^\d\[\],\s-]")
 
-    From 2021 day 18
+
+def tokenize_lists(text: str) -> list:
+    """Convert encoded lists to a flat list of tokens.
+
+    `[1,[2,3]]` becomes `["[", 1, "[", 2, 3, "]", "]"]`, the brackets mark the
+    depth. Every list in `text` is tokenized in one pass, e.g. 2021 day 18
+    snailfish numbers.
     """
-    ret = []
-    current_number = ""
-    for char in num:
-        if char == "[":
-            ret.append(char)
-        elif char in ",]":
-            if current_number != "":
-                ret.append(int(current_number))
-                current_number = ""
-            if char == "]":
-                ret.append(char)
-        elif char in "0123456789":
-            current_number += char
+    tokens = []
+    for token in LIST_TOKEN.findall(text):
+        if token == "[" or token == "]":
+            tokens.append(token)
+        elif token[-1].isdigit():
+            tokens.append(int(token))
         else:
-            raise ValueError("Unknown character")
-    return ret
+            raise ValueError(f"Unknown character {token!r}")
+    return tokens
 
 
-def str_to_list_2022_13(num: str) -> list:
-    """Convert an encoded list to a list.
+def parse_lists(text: str) -> list:
+    """Convert encoded lists, one per line, to nested lists.
 
-    From 2022 day 13
+    Blank lines are skipped, so 2022 day 13 packets come out as one list of every
+    packet. The whole text is decoded in a single call to the C JSON decoder.
     """
-    ret = []
-    current_number = ""
-    for char in num:
-        if char == "[":
-            ret.append(char)
-        elif char in ",]":
-            if current_number != "":
-                ret.append(int(current_number))
-                current_number = ""
-            if char == "]":
-                ret.append(char)
-        elif char in "0123456789":
-            current_number += char
-        else:
-            raise ValueError("Unknown character")
-    return ret
+    invalid = NOT_LIST.search(text)
+    if invalid:
+        raise ValueError(f"Unknown character {invalid.group()!r}")
+    lines = [line for line in text.splitlines() if line.strip()]
+    return json.loads(f"[{','.join(lines)}]")
+
+
+def int_bytes(text: str) -> Optional[bytes]:
+    """Blank out everything but digits and minus signs in one C-level pass.
+
+    Return None when a `-` isn't a sign, e.g. in `1-3`, as splitting the result on
+    whitespace wouldn't give the integers then.
+    """
+    data = text.encode().translate(INT_BYTES)
+    return None if LOOSE_HYPHEN.search(data) else data
+
+
+def ints(text: str, columns: Optional[int] = None) -> list:
+    """Return every integer in `text`, found in one pass over the whole buffer.
+
+    With `columns` the integers are grouped into tuples of that size, e.g. one
+    tuple per `Sensor at x=2, y=18: closest beacon is at x=-2, y=15` line.
+    """
+    data = int_bytes(text)
+    values = list(map(int, INT.findall(text) if data is None else data.split()))
+    if columns is None:
+        return values
+    if len(values) % columns:
+        raise ValueError(f"{len(values)} integers don't fit in {columns} columns")
+    return list(zip(*[iter(values)] * columns))
+
+
+def int_array(text: str, columns: Optional[int] = None):
+    """Return every integer in `text` as a NumPy array, `columns` wide if given."""
+    import numpy as np
+
+    data = int_bytes(text)
+    if data is None:
+        values = np.array(INT.findall(text), dtype=np.int64)
+    else:
+        values = np.array(data.split(), dtype=np.int64)
+    if columns is None:
+        return values
+    if len(values) % columns:
+        raise ValueError(f"{len(values)} integers don't fit in {columns} columns")
+    return values.reshape(-1, columns)
+
+
+def split_names(text: str) -> list[str]:
+    """Convert `DD, II, BB` to `["DD", "II", "BB"]`."""
+    return text.split(", ")
+
+
+class RecordParser:
+    """Parse lines of a fixed shape into tuples.
+
+    The pattern must match a whole line. It is compiled once and matched against
+    the whole text rather than line by line. Each group is converted by the
+    matching entry of `converters`, groups without one are kept as strings.
+
+    >>> valve = RecordParser(r"Valve ([A-Z]+) has flow rate=([0-9]+)", str, int)
+    >>> valve.parse("Valve AA has flow rate=0")
+    [('AA', 0)]
+    """
+
+    def __init__(self, pattern: str, *converters: Callable[[str], object]):
+        self.pattern = re.compile(f"^(?:{pattern})$", re.MULTILINE)
+        if len(converters) > self.pattern.groups:
+            raise ValueError("More converters than groups in the pattern")
+        self.converters = converters + (str,) * (self.pattern.groups - len(converters))
+
+    def convert(self, groups: tuple) -> tuple:
+        return tuple(convert(group) for convert, group in zip(self.converters, groups))
+
+    def parse(self, text: str) -> list[tuple]:
+        """Return a tuple per line of `text`, blank lines are skipped.
+
+        Raise ValueError if any other line doesn't match the pattern.
+        """
+        matches = self.pattern.findall(text)
+        if self.pattern.groups == 1:
+            matches = [(group,) for group in matches]
+        lines = len(NOT_BLANK.findall(text))
+        if len(matches) != lines:
+            raise ValueError(f"Only {len(matches)} of {lines} lines match")
+        return [self.convert(groups) for groups in matches]
+
+    def parse_one(self, line: str) -> tuple:
+        match = self.pattern.fullmatch(line.strip())
+        if match is None:
+            raise ValueError(f"{line!r} doesn't match")
+        return self.convert(match.groups())
@@ -3,7 +3,21 @@
 
 import collections
 import heapq
-from typing import Iterator, Optional, Protocol, T, Tuple, TypeVar
+import sys
+from array import array
+from collections.abc import Mapping
+from typing import (
+    Callable,
+    Iterable,
+    Iterator,
+    Optional,
+    Protocol,
+    T,
+    Tuple,
+    TypeVar,
+)
+
+from aoc.utils import trace
 
 Location = TypeVar("Location")
 
@@ -41,18 +55,116 @@ class Queue:
 GridLocation = Tuple[int, int]
 
 
+class Occupancy:
+    """Set of occupied grid locations, e.g. the walls of a grid.
+
+    `append` is an alias of `add` so code written against lists keeps working.
+    """
+
+
+class SetOccupancy(Occupancy, set):
+    """Occupied locations in a hash set, for sparse or unbounded grids."""
+
+    append = set.add
+
+
+class BitmapOccupancy(Occupancy):
+    """Occupied locations of a bounded grid, one byte per cell.
+
+    Locations outside of the bitmap are never occupied and can't be added.
+    """
+
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        locations: Iterable[GridLocation] = (),
+        x_min: int = 0,
+        y_min: int = 0,
+    ):
+        self.width = width
+        self.height = height
+        self.x_min = x_min
+        self.y_min = y_min
+        self.cells = bytearray(width * height)
+        for location in locations:
+            self.add(location)
+
+    def _index(self, location: GridLocation) -> int:
+        x, y = location
+        x -= self.x_min
+        y -= self.y_min
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return y * self.width + x
+        return -1
+
+    def __contains__(self, location: GridLocation) -> bool:
+        index = self._index(location)
+        return index >= 0 and self.cells[index] == 1
+
+    def add(self, location: GridLocation) -> None:
+        index = self._index(location)
+        if index < 0:
+            raise IndexError(f"{location} is outside of the bitmap")
+        self.cells[index] = 1
+
+    append = add
+
+    def discard(self, location: GridLocation) -> None:
+        index = self._index(location)
+        if index >= 0:
+            self.cells[index] = 0
+
+    def __iter__(self) -> Iterator[GridLocation]:
+        index = self.cells.find(1)
+        while index >= 0:
+            y, x = divmod(index, self.width)
+            yield (x + self.x_min, y + self.y_min)
+            index = self.cells.find(1, index + 1)
+
+    def __len__(self) -> int:
+        return self.cells.count(1)
+
+    def to_numpy(self):
+        """Return a (height, width) boolean NumPy view of the cells."""
+        import numpy as np
+
+        return np.frombuffer(self.cells, dtype=np.bool_).reshape(
+            self.height, self.width
+        )
+
+
 class SquareGrid:
-    def __init__(self, width: int, height: int):
+    """A grid whose walls are kept in an `Occupancy`.
+
+    Walls default to a hash set, pass `dense=True` to keep them in a bitmap
+    instead. Assigning any iterable of locations to `walls` stores it in a set.
+    """
+
+    def __init__(self, width: int, height: int, dense: bool = False):
         self.width = width
         self.height = height
-        self.walls: list[GridLocation] = []
+        if dense:
+            self.walls = BitmapOccupancy(width, height)
+        else:
+            self.walls = SetOccupancy()
+
+    @property
+    def walls(self) -> Occupancy:
+        return self._walls
+
+    @walls.setter
+    def walls(self, locations: Iterable[GridLocation]) -> None:
+        if not isinstance(locations, Occupancy):
+            locations = SetOccupancy(locations)
+        self._walls = locations
 
     def in_bounds(self, id: GridLocation) -> bool:
         (x, y) = id
         return 0 <= x < self.width and 0 <= y < self.height
 
     def passable(self, id: GridLocation) -> bool:
-        return id not in self.walls
+        return id not in self._walls
 
     def neighbors(self, id: GridLocation) -> Iterator[GridLocation]:
         (x, y) = id
@@ -80,15 +192,29 @@ class PriorityQueue:
 
 
 class WeightedGraph(Graph):
+    # Largest value returned by `cost` when every cost is a non-negative int, lets
+    # `dijkstra_search` use a bucket queue. None when costs are arbitrary.
+    max_cost: Optional[int] = None
+
     def cost(self, from_id: Location, to_id: Location) -> float:
         pass
 
 
 class GridWithWeights(SquareGrid):
-    def __init__(self, width: int, height: int):
-        super().__init__(width, height)
+    def __init__(self, width: int, height: int, dense: bool = False):
+        super().__init__(width, height, dense)
         self.weights: dict[GridLocation, int] = {}
 
+    @property
+    def max_cost(self) -> Optional[int]:
+        """Largest weight, only known when `cost` is read from `weights`."""
+        if type(self).cost is not GridWithWeights.cost:
+            return None
+        weights = self.weights.values()
+        if all(isinstance(weight, int) and weight >= 0 for weight in weights):
+            return max([1, *weights])
+        return None
+
     def cost(self, from_node: GridLocation, to_node: GridLocation) -> int:
         return self.weights.get(to_node, 1)
 
@@ -103,7 +229,98 @@ class GridWithWeights(SquareGrid):
         return results
 
 
+class CompactGrid:
+    """A grid whose locations are encoded as ints, `y * width + x`.
+
+    The neighbors of every location are computed once from `grid` and stored in
+    compressed sparse rows: the neighbors of `id` are
+    `targets[offsets[id]:offsets[id + 1]]` and `costs` holds the matching edge costs
+    when `grid` is weighted. Searches on a compact grid keep their results in
+    preallocated arrays instead of dicts.
+    """
+
+    def __init__(self, grid: SquareGrid):
+        self.width = grid.width
+        self.height = grid.height
+        self.size = grid.width * grid.height
+        weighted = hasattr(grid, "cost")
+        self.offsets = array("i", [0])
+        self.targets = array("i")
+        self.costs = array("i") if weighted else None
+        for id in range(self.size):
+            location = from_id_width(id, self.width)
+            if grid.passable(location):
+                for next in grid.neighbors(location):
+                    self.targets.append(self.encode(next))
+                    if weighted:
+                        self.costs.append(grid.cost(location, next))
+            self.offsets.append(len(self.targets))
+
+    def encode(self, location: GridLocation) -> int:
+        (x, y) = location
+        return y * self.width + x
+
+    def decode(self, id: int) -> GridLocation:
+        return from_id_width(id, self.width)
+
+    def neighbors(self, id: int) -> array:
+        return self.targets[self.offsets[id] : self.offsets[id + 1]]
+
+    def cost(self, from_id: int, to_id: int) -> int:
+        for index in range(self.offsets[from_id], self.offsets[from_id + 1]):
+            if self.targets[index] == to_id:
+                return self.costs[index] if self.costs is not None else 1
+        raise KeyError(f"{to_id} isn't a neighbor of {from_id}")
+
+
+class DenseMap(Mapping):
+    """Read-only dict view of a preallocated array indexed by compact location.
+
+    Entries equal to `missing` are absent and entries equal to `none` read as None.
+    """
+
+    def __init__(self, values: array, missing: int = -1, none: Optional[int] = None):
+        self.values = values
+        self.missing = missing
+        self.none = none
+
+    def __contains__(self, key) -> bool:
+        return (
+            isinstance(key, int)
+            and 0 <= key < len(self.values)
+            and self.values[key] != self.missing
+        )
+
+    def __getitem__(self, key: int) -> Optional[int]:
+        if key not in self:
+            raise KeyError(key)
+        value = self.values[key]
+        return None if value == self.none else value
+
+    def __iter__(self) -> Iterator[int]:
+        missing = self.missing
+        return (key for key, value in enumerate(self.values) if value != missing)
+
+    def __len__(self) -> int:
+        return len(self.values) - self.values.count(self.missing)
+
+
+# Markers in the preallocated arrays of compact searches
+UNSEEN = -1
+NO_PARENT = -2
+NO_COST = -(2**63)
+
+# Largest edge cost for which `dijkstra_search` switches to `dial_search`
+DIAL_MAX_COST = 100
+
+
 def dijkstra_search(graph: WeightedGraph, start: Location, goal: Location):
+    if isinstance(graph, CompactGrid):
+        return compact_dijkstra_search(graph, start, goal)
+    max_cost = getattr(graph, "max_cost", None)
+    if max_cost is not None and max_cost <= DIAL_MAX_COST:
+        return dial_search(graph, start, goal, max_cost)
+
     frontier = PriorityQueue()
     frontier.put(start, 0)
     came_from: dict[Location, Optional[Location]] = {}
@@ -128,6 +345,96 @@ def dijkstra_search(graph: WeightedGraph, start: Location, goal: Location):
     return came_from, cost_so_far
 
 
+def dial_search(
+    graph: WeightedGraph,
+    start: Location,
+    goal: Location,
+    max_cost: Optional[int] = None,
+):
+    """Dijkstra's search with a bucket queue, for small non-negative int costs.
+
+    Pending locations are kept in `max_cost + 1` buckets indexed by their cost
+    modulo the number of buckets, so every push and pop is O(1). Locations whose
+    cost improved after they were queued are skipped when their stale entry comes
+    up. Returns `(came_from, cost_so_far)` like `dijkstra_search`.
+    """
+    if max_cost is None:
+        max_cost = graph.max_cost
+    buckets: list[list[Location]] = [[] for _ in range(max_cost + 1)]
+    buckets[0].append(start)
+    pending = 1
+    came_from: dict[Location, Optional[Location]] = {}
+    cost_so_far: dict[Location, int] = {}
+    came_from[start] = None
+    cost_so_far[start] = 0
+
+    distance = 0
+    while pending:
+        # Zero cost edges append to the bucket while it is being emptied
+        bucket = buckets[distance % len(buckets)]
+        while bucket:
+            current: Location = bucket.pop()
+            pending -= 1
+            if cost_so_far[current] != distance:
+                continue
+
+            if current == goal:
+                return came_from, cost_so_far
+
+            for next in graph.neighbors(current):
+                cost = graph.cost(current, next)
+                if not (isinstance(cost, int) and 0 <= cost <= max_cost):
+                    raise ValueError(f"Cost {cost!r} isn't an int from 0 to {max_cost}")
+                new_cost = distance + cost
+                if next not in cost_so_far or new_cost < cost_so_far[next]:
+                    cost_so_far[next] = new_cost
+                    buckets[new_cost % len(buckets)].append(next)
+                    pending += 1
+                    came_from[next] = current
+        distance += 1
+
+    return came_from, cost_so_far
+
+
+def compact_dijkstra_search(graph: CompactGrid, start: int, goal: int):
+    """Dijkstra's search over the neighbor tables of a compact grid.
+
+    Returns `(came_from, cost_so_far)` as `DenseMap` views of arrays, so they can be
+    used like the dicts returned by `dijkstra_search`.
+    """
+    offsets, targets, costs = graph.offsets, graph.targets, graph.costs
+    if costs is None:
+        costs = array("i", [1]) * len(targets)
+    came_from = array("i", [UNSEEN]) * graph.size
+    cost_so_far = array("q", [NO_COST]) * graph.size
+    came_from[start] = NO_PARENT
+    cost_so_far[start] = 0
+    frontier = [(0, start)]
+
+    while frontier:
+        cost, current = heapq.heappop(frontier)
+        if cost != cost_so_far[current]:
+            # Superseded by a cheaper entry
+            continue
+
+        if current == goal:
+            break
+
+        for index in range(offsets[current], offsets[current + 1]):
+            next = targets[index]
+            new_cost = cost + costs[index]
+            old_cost = cost_so_far[next]
+            if old_cost == NO_COST or new_cost < old_cost:
+                cost_so_far[next] = new_cost
+                came_from[next] = current
+                heapq.heappush(frontier, (new_cost, next))
+
+    return (
+        DenseMap(came_from, missing=UNSEEN, none=NO_PARENT),
+        DenseMap(cost_so_far, missing=NO_COST),
+    )
+
+
 def reconstruct_path(
     came_from: dict[Location, Location],
     start: Location,
@@ -135,7 +442,6 @@ def reconstruct_path(
     reverse: bool = True,
     add_start: bool = True,
 ) -> list[Location]:
-
     current: Location = goal
     path: list[Location] = []
     if goal not in came_from:  # no path was found
@@ -150,26 +456,112 @@ def reconstruct_path(
     return path
 
 
+def render_grid(graph, y_min=0, x_min=0, **style) -> str:
+    """Return the frame `draw_grid` draws as one string.
+
+    The cells are preallocated with the empty tile, then each style is painted over
+    them in order of precedence. Only the locations a style holds are visited, so
+    no per-cell lookups in every style are needed.
+    """
+    return "".join(line + "\n" for line in _render_lines(graph, y_min, x_min, style))
+
+
+def _render_lines(graph, y_min: int, x_min: int, style: dict) -> list[str]:
+    trim = style.get("trim", False)
+    width = max(graph.width - x_min, 0)
+    height = max(graph.height - y_min, 0)
+    cells = [("." if trim else " . ")] * (width * height)
+
+    def paint(locations: Iterable[GridLocation], tile) -> None:
+        """Set the cells of `locations`, `tile` is a string or a function of them."""
+        for location in locations:
+            x = location[0] - x_min
+            y = location[1] - y_min
+            if 0 <= x < width and 0 <= y < height:
+                text = tile if isinstance(tile, str) else tile(location)
+                if text is not None:
+                    cells[y * width + x] = text.strip() if trim else text
+
+    if "number" in style:
+        paint(style["number"], lambda id: " %-2d" % style["number"][id])
+    if "letter" in style:
+        paint(style["letter"], lambda id: " %s " % style["letter"][id])
+    if "point_to" in style:
+        paint(style["point_to"], lambda id: _arrow(id, style["point_to"][id]))
+    if "path" in style:
+        paint(style["path"], " @ ")
+    if "start" in style:
+        paint([style["start"]], " A ")
+    if "goal" in style:
+        paint([style["goal"]], " Z ")
+    paint(graph.walls, "#" if trim else "###")
+    if "sand" in style:
+        paint(style["sand"], "o" if trim else "ooo")
+
+    draw_axis = style.get("draw_axis", False)
+    lines = ["_" * graph.width if trim else "___" * graph.width]
+    if draw_axis:
+        lines.append("  " + "".join("%d" % x for x in range(x_min, graph.width)))
+    for row in range(height):
+        line = "".join(cells[row * width : (row + 1) * width])
+        if style.get("blank", False):
+            line = line.replace(".", " ")
+        if draw_axis:
+            line = "%d " % (row + y_min) + line
+        lines.append(line)
+    lines.append("~" * graph.width if trim else "~~~" * graph.width)
+    return lines
+
+
+def _arrow(id: GridLocation, to: Optional[GridLocation]) -> Optional[str]:
+    """Return the tile pointing from `id` to `to`, None if it doesn't."""
+    if to is None:
+        return None
+    (x1, y1) = id
+    (x2, y2) = to
+    r = None
+    if x2 == x1 + 1:
+        r = " > "
+    if x2 == x1 - 1:
+        r = " < "
+    if y2 == y1 + 1:
+        r = " v "
+    if y2 == y1 - 1:
+        r = " ^ "
+    return r
+
+
 def draw_grid(graph, y_min=0, x_min=0, **style):
-    if "trim" in style and style["trim"]:
-        print("_" * graph.width)
-    else:
-        print("___" * graph.width)
-    if style.get("draw_axis", False):
-        print("  ", end="")
-        for x in range(x_min, graph.width):
-            print("%d" % x, end="")
-        print()
-    for y in range(y_min, graph.height):
-        if style.get("draw_axis", False):
-            print("%d " % y, end="")
-        for x in range(x_min, graph.width):
-            print("%s" % draw_tile(graph, (x, y), style), end="")
-        print()
-    if "trim" in style and style["trim"]:
-        print("~" * graph.width)
-    else:
-        print("~~~" * graph.width)
+    sys.stdout.write(render_grid(graph, y_min, x_min, **style))
+
+
+class GridRenderer:
+    """Draws successive frames of a grid, e.g. to animate falling sand.
+
+    With `diff` only the lines that changed since the previous frame are rewritten,
+    moving the cursor back up over the previous frame with ANSI escape codes.
+    """
+
+    def __init__(self, stream=None, diff: bool = False):
+        self.stream = stream
+        self.diff = diff
+        self.previous: list[str] = []
+
+    def draw(self, graph, y_min=0, x_min=0, **style) -> None:
+        lines = _render_lines(graph, y_min, x_min, style)
+        if self.diff and len(lines) == len(self.previous):
+            # Back to the first line of the previous frame
+            parts = ["\x1b[%dF" % len(lines)]
+            for old, new in zip(self.previous, lines):
+                # Rewrite a changed line or move down to the next one
+                parts.append("\x1b[2K" + new + "\n" if new != old else "\x1b[1E")
+            frame = "".join(parts)
+        else:
+            frame = "".join(line + "\n" for line in lines)
+        stream = self.stream or sys.stdout
+        stream.write(frame)
+        stream.flush()
+        self.previous = lines
 
 
 # utility functions for dealing with square grids
@@ -223,7 +615,12 @@ def heuristic(a: GridLocation, b: GridLocation) -> float:
     return abs(x1 - x2) + abs(y1 - y2)
 
 
-def a_star_search(graph: WeightedGraph, start: Location, goal: Location):
+def a_star_search(
+    graph: WeightedGraph,
+    start: Location,
+    goal: Location,
+    heuristic: Callable[[Location, Location], float] = heuristic,
+):
     frontier = PriorityQueue()
     frontier.put(start, 0)
     came_from: dict[Location, Optional[Location]] = {}
@@ -235,7 +632,7 @@ def a_star_search(graph: WeightedGraph, start: Location, goal: Location):
         current: Location = frontier.get()
 
         if current == goal:
-            print("Made it")
+            trace.debug("Made it")
             break
 
         neighbors = graph.neighbors(current)
@@ -252,7 +649,122 @@ def a_star_search(graph: WeightedGraph, start: Location, goal: Location):
     return came_from, cost_so_far
 
 
+def bidirectional_search(
+    graph: WeightedGraph,
+    start: Location,
+    goal: Location,
+    heuristic: Optional[Callable[[Location, Location], float]] = None,
+    reverse: Optional[Graph] = None,
+):
+    """Search from `start` and `goal` at once until the two searches meet.
+
+    Each step expands the side with the smaller frontier. Graphs without `cost` have
+    edges of cost 1, so this is a bidirectional breadth first search on them. For
+    directed graphs pass `reverse`, e.g. from `reverse_graph`, whose neighbors are
+    the locations with an edge to a location. Costs are always `graph.cost` of the
+    edge in its original direction.
+
+    With a consistent `heuristic` both searches are guided by the average of the
+    estimates to the goal and from the start, which keeps the usual stopping rule
+    valid.
+
+    Returns `(came_from, cost_so_far)`. `came_from` is joined at the meeting point
+    so that `reconstruct_path(came_from, start, goal)` gives the whole path.
+    """
+    cost = getattr(graph, "cost", lambda from_id, to_id: 1)
+    reverse = graph if reverse is None else reverse
+    if heuristic is None:
+
+        def potential(location: Location) -> float:
+            return 0
+
+    else:
+
+        def potential(location: Location) -> float:
+            return (heuristic(location, goal) - heuristic(start, location)) / 2
+
+    came_from: dict[Location, Optional[Location]] = {start: None}
+    came_to: dict[Location, Optional[Location]] = {goal: None}
+    forward_cost: dict[Location, float] = {start: 0}
+    backward_cost: dict[Location, float] = {goal: 0}
+    # Heap entries are (priority, counter, location), the counter breaks ties so
+    # that locations themselves are never compared
+    forward = [(potential(start), 0, start)]
+    backward = [(-potential(goal), 0, goal)]
+    counter = 1
+
+    def backward_edge_cost(to_id: Location, from_id: Location) -> float:
+        return cost(from_id, to_id)
+
+    # The backward potential is minus the forward one
+    sides = {
+        True: (forward, forward_cost, backward_cost, came_from, 1, graph, cost),
+        False: (
+            backward,
+            backward_cost,
+            forward_cost,
+            came_to,
+            -1,
+            reverse,
+            backward_edge_cost,
+        ),
+    }
+
+    best = 0 if start == goal else float("inf")
+    meeting = start if start == goal else None
+    while forward and backward and forward[0][0] + backward[0][0] < best:
+        side = sides[len(forward) <= len(backward)]
+        frontier, costs, other_costs, parents, sign, edges, edge_cost = side
+        priority, _, current = heapq.heappop(frontier)
+        if priority != costs[current] + sign * potential(current):
+            # Superseded by a cheaper entry
+            continue
+
+        for next in edges.neighbors(current):
+            new_cost = costs[current] + edge_cost(current, next)
+            if next not in costs or new_cost < costs[next]:
+                costs[next] = new_cost
+                parents[next] = current
+                heapq.heappush(
+                    frontier, (new_cost + sign * potential(next), counter, next)
+                )
+                counter += 1
+                if next in other_costs and new_cost + other_costs[next] < best:
+                    best = new_cost + other_costs[next]
+                    meeting = next
+
+    if meeting is None:
+        return came_from, forward_cost
+    return join_searches(came_from, forward_cost, came_to, backward_cost, meeting)
+
+
+def join_searches(
+    came_from: dict[Location, Optional[Location]],
+    cost_so_far: dict[Location, float],
+    came_to: dict[Location, Optional[Location]],
+    cost_to_goal: dict[Location, float],
+    meeting: Location,
+):
+    """Extend a forward search with the backward path from `meeting` to the goal.
+
+    Returns copies of `came_from` and `cost_so_far` that also cover the locations
+    from `meeting` to the goal of the backward search, in `dijkstra_search` form.
+    """
+    came_from = dict(came_from)
+    cost_so_far = dict(cost_so_far)
+    total = cost_so_far[meeting] + cost_to_goal[meeting]
+    current = meeting
+    while came_to[current] is not None:
+        next = came_to[current]
+        came_from[next] = current
+        cost_so_far[next] = total - cost_to_goal[next]
+        current = next
+    return came_from, cost_so_far
+
+
 def breadth_first_search(graph: Graph, start: Location, goal: Location):
+    if isinstance(graph, CompactGrid):
+        return compact_breadth_first_search(graph, start, goal)
     frontier = Queue()
     frontier.put(start)
     came_from: dict[Location, Optional[Location]] = {}
@@ -270,3 +782,239 @@ def breadth_first_search(graph: Graph, start: Location, goal: Location):
                 came_from[next] = current
 
     return came_from
+
+
+def compact_breadth_first_search(graph: CompactGrid, start: int, goal: int):
+    """Breadth first search over the neighbor tables of a compact grid."""
+    offsets, targets = graph.offsets, graph.targets
+    came_from = array("i", [UNSEEN]) * graph.size
+    came_from[start] = NO_PARENT
+    frontier = collections.deque([start])
+
+    while frontier:
+        current = frontier.popleft()
+
+        if current == goal:
+            break
+
+        for index in range(offsets[current], offsets[current + 1]):
+            next = targets[index]
+            if came_from[next] == UNSEEN:
+                came_from[next] = current
+                frontier.append(next)
+
+    return DenseMap(came_from, missing=UNSEEN, none=NO_PARENT)
+
+
+def multi_source_bfs(
+    graph: Graph, sources: Iterable[Location], goal: Optional[Location] = None
+):
+    """Breadth first search from every location in `sources` at once.
+
+    `distance[location]` is the number of steps from the nearest source and
+    `came_from` leads back to that source, whose entry is None. The search stops
+    early once `goal` is reached.
+    """
+    frontier = Queue()
+    came_from: dict[Location, Optional[Location]] = {}
+    distance: dict[Location, int] = {}
+    for source in sources:
+        if source not in came_from:
+            frontier.put(source)
+            came_from[source] = None
+            distance[source] = 0
+
+    while not frontier.empty():
+        current: Location = frontier.get()
+
+        if current == goal:
+            break
+
+        for next in graph.neighbors(current):
+            if next not in came_from:
+                frontier.put(next)
+                came_from[next] = current
+                distance[next] = distance[current] + 1
+
+    return came_from, distance
+
+
+def reverse_graph(graph: Graph, locations: Iterable[Location]) -> SimpleGraph:
+    """Return a graph with the edges of `graph` from `locations` flipped.
+
+    For directed graphs, e.g. climbs that can't go back up, searching the reversed
+    graph from a goal gives the distance from every location to that goal.
+    """
+    reversed_graph = SimpleGraph()
+    edges = reversed_graph.edges
+    locations = list(locations)
+    for location in locations:
+        edges.setdefault(location, [])
+    for location in locations:
+        for next in graph.neighbors(location):
+            edges.setdefault(next, []).append(location)
+    return reversed_graph
+
+
+# Min-plus relaxation does about n**3 cheap vectorized operations, breadth first
+# searches about n * (n + edges) slow Python ones. This is roughly how much slower
+# the latter are per operation.
+MIN_PLUS_RATIO = 100
+
+
+def all_pairs_shortest_paths(
+    graph: Graph, locations: Iterable[Location], weighted: bool = False
+):
+    """Return the shortest distance between every pair of `locations`.
+
+    Returns `(index, distances)`: `index` maps each location to its row and column,
+    `distances[index[a], index[b]]` is the distance from `a` to `b` as a float, inf
+    when `b` can't be reached. Edges cost `graph.cost(a, b)` when `weighted`, 1
+    otherwise, and edges to locations outside of `locations` are ignored.
+
+    Weighted and dense graphs are solved with Floyd-Warshall as NumPy min-plus
+    relaxations, sparse unweighted graphs with a breadth first search per location.
+    """
+    import numpy as np
+
+    locations = list(dict.fromkeys(locations))
+    index = {location: i for i, location in enumerate(locations)}
+    size = len(locations)
+    adjacency = [
+        [index[next] for next in graph.neighbors(location) if next in index]
+        for location in locations
+    ]
+    edges = sum(map(len, adjacency))
+
+    if not weighted and size * size > MIN_PLUS_RATIO * (size + edges):
+        distances = np.empty((size, size))
+        for source in range(size):
+            row = [np.inf] * size
+            row[source] = 0
+            frontier = [source]
+            steps = 0
+            while frontier:
+                steps += 1
+                next_frontier = []
+                for current in frontier:
+                    for next in adjacency[current]:
+                        if row[next] == np.inf:
+                            row[next] = steps
+                            next_frontier.append(next)
+                frontier = next_frontier
+            distances[source] = row
+        return index, distances
+
+    distances = np.full((size, size), np.inf)
+    for i, location in enumerate(locations):
+        for j in adjacency[i]:
+            cost = graph.cost(location, locations[j]) if weighted else 1
+            distances[i, j] = min(distances[i, j], cost)
+    np.fill_diagonal(distances, 0)
+    for k in range(size):
+        # Path through k: column k broadcast against row k
+        np.minimum(distances, distances[:, k, None] + distances[None, k, :], distances)
+    return index, distances
+
+
+class ContractedGraph(WeightedGraph):
+    """An undirected graph with its corridors collapsed into weighted edges.
+
+    Locations with exactly two neighbors are corridor cells. Every chain of them
+    between two junctions becomes one edge whose cost is the length of the chain,
+    and `corridors[a, b]` keeps its cells in order from `a` to `b`.
+    """
+
+    def __init__(self):
+        self.edges: dict[Location, list[Location]] = {}
+        self.costs: dict[tuple[Location, Location], float] = {}
+        self.corridors: dict[tuple[Location, Location], list[Location]] = {}
+
+    def neighbors(self, id: Location) -> list[Location]:
+        return self.edges[id]
+
+    def cost(self, from_id: Location, to_id: Location) -> float:
+        return self.costs[from_id, to_id]
+
+    def add_corridor(
+        self, a: Location, b: Location, cost: float, cells: list[Location]
+    ) -> None:
+        """Add an edge from `a` to `b` through `cells`, unless a cheaper one exists."""
+        if (a, b) in self.costs:
+            if cost >= self.costs[a, b]:
+                return
+        else:
+            self.edges[a].append(b)
+        self.costs[a, b] = cost
+        self.corridors[a, b] = cells
+
+    def expand_path(self, path: list[Location]) -> list[Location]:
+        """Return `path` through the junctions with the corridor cells put back."""
+        expanded = path[:1]
+        for a, b in zip(path, path[1:]):
+            expanded.extend(self.corridors[a, b])
+            expanded.append(b)
+        return expanded
+
+    def expand_came_from(
+        self, came_from: dict[Location, Optional[Location]]
+    ) -> dict[Location, Optional[Location]]:
+        """Return `came_from` of a search on this graph over the original graph.
+
+        The result can be passed to `reconstruct_path` with the original start and
+        goal, provided both of them were kept as junctions.
+        """
+        expanded = {}
+        for b, a in came_from.items():
+            previous = a
+            if a is not None:
+                for cell in self.corridors[a, b]:
+                    expanded[cell] = previous
+                    previous = cell
+            expanded[b] = previous
+        return expanded
+
+
+def contract_corridors(
+    graph: Graph,
+    locations: Iterable[Location],
+    keep: Iterable[Location] = (),
+    weighted: bool = False,
+) -> ContractedGraph:
+    """Collapse the corridors of an undirected graph into weighted edges.
+
+    `locations` must include the neighbors of all of its locations. Locations in
+    `keep`, e.g. the start and goal of a search, are never collapsed. Edges cost
+    `graph.cost(a, b)` when `weighted`, 1 otherwise.
+    """
+    neighbors = {location: list(graph.neighbors(location)) for location in locations}
+    junctions = {location for location, n in neighbors.items() if len(n) != 2}
+    junctions.update(keep)
+
+    contracted = ContractedGraph()
+    walked = set()
+
+    def walk(junction: Location) -> None:
+        for next in neighbors[junction]:
+            previous, current = junction, next
+            cost = graph.cost(previous, current) if weighted else 1
+            cells = []
+            while current not in junctions:
+                walked.add(current)
+                cells.append(current)
+                a, b = neighbors[current]
+                previous, current = current, b if a == previous else a
+                cost += graph.cost(previous, current) if weighted else 1
+            contracted.add_corridor(junction, current, cost, cells)
+
+    for junction in list(junctions):
+        contracted.edges.setdefault(junction, [])
+        walk(junction)
+
+    # Loops without any junction keep one of their cells as a junction
+    for location in neighbors:
+        if location not in junctions and location not in walked:
+            junctions.add(location)
+            contracted.edges[location] = []
+            walk(location)
+    return contracted
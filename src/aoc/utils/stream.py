@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+"""Constant memory access to large puzzle inputs.
+
+`open_input` returns the stored input as a read-only memory map instead of a `str`,
+so the file isn't read into memory and no copy is split into lines. `Records`
+iterates over the lines, or any other separated records, of such a buffer as
+`memoryview` slices that share its memory. Like `parse` results they can be
+iterated over again, e.g. once per part.
+
+`restartable` does the same for generator based parsers.
+"""
+import functools
+import mmap
+from typing import Callable, Iterable, Iterator, Optional, Union
+
+from aoc.utils.inputs import get_store
+
+Buffer = Union[bytes, bytearray, mmap.mmap]
+
+WHITESPACE = b" \t\r\n"
+
+
+def as_bytes(data: Union[str, Buffer]) -> Buffer:
+    """Return `data` as a bytes-like object, buffers aren't copied."""
+    return data.encode() if isinstance(data, str) else data
+
+
+def open_input(
+    year: int,
+    day: int,
+    kind: str = "input",
+    allow_fetch: Optional[bool] = None,
+) -> Buffer:
+    """Return an input as a read-only memory map, fetching it first if allowed."""
+    store = get_store()
+    if store.key(year, day, kind) not in store:
+        # Stores the input or raises InputNotFoundError
+        store.get(year, day, kind, allow_fetch=allow_fetch)
+    return store.read_bytes(year, day, kind)
+
+
+class Records:
+    """Restartable iterator over the `sep` separated records of a buffer.
+
+    Records are `memoryview` slices of the buffer, so only the current record is
+    looked at and nothing is copied. Surrounding whitespace is dropped with `strip`
+    and empty records are skipped, e.g. the one after a trailing newline.
+
+    >>> [bytes(line) for line in Records(b"rn=1,cm-\\n", sep=b",")]
+    [b'rn=1', b'cm-']
+    """
+
+    def __init__(self, data: Union[str, Buffer], sep: bytes = b"\n", strip=True):
+        self.buffer = as_bytes(data)
+        self.sep = sep
+        self.strip = strip
+
+    def spans(self) -> Iterator[tuple[int, int]]:
+        """Yield the `(start, end)` offsets of every record."""
+        buffer, sep, size = self.buffer, self.sep, len(self.buffer)
+        start = 0
+        while start < size:
+            end = buffer.find(sep, start)
+            if end == -1:
+                end = size
+            first, last = start, end
+            if self.strip:
+                while first < last and buffer[first] in WHITESPACE:
+                    first += 1
+                while last > first and buffer[last - 1] in WHITESPACE:
+                    last -= 1
+            if first < last:
+                yield first, last
+            start = end + len(sep)
+
+    def __iter__(self) -> Iterator[memoryview]:
+        view = memoryview(self.buffer)
+        for start, end in self.spans():
+            yield view[start:end]
+
+    def map(self, function: Callable[[memoryview], object]) -> "Iterable":
+        """Return a restartable iterator of `function` applied to every record."""
+        return RestartableIterator(lambda: map(function, self))
+
+
+class RestartableIterator:
+    """Calls `factory` for a new iterator every time it is iterated over."""
+
+    def __init__(self, factory: Callable[[], Iterable]):
+        self.factory = factory
+
+    def __iter__(self) -> Iterator:
+        return iter(self.factory())
+
+
+def restartable(generator: Callable[..., Iterator]) -> Callable[..., Iterable]:
+    """Decorate a generator function so its results can be iterated over again.
+
+    The generator is run again, with the same arguments, by every iteration. Nothing
+    is kept in between so memory use stays that of a single pass.
+    """
+
+    @functools.wraps(generator)
+    def wrapper(*args, **kwargs) -> RestartableIterator:
+        return RestartableIterator(lambda: generator(*args, **kwargs))
+
+    return wrapper
@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+"""Verbosity-gated tracing for solutions.
+
+Messages are only formatted when their level is enabled, so calls left in hot loops
+cost a comparison when tracing is off:
+
+    from aoc.utils import trace
+
+    trace.debug("Comparing %s %s", left, right)
+
+The level comes from `AOC_TRACE` (a number or level name) and defaults to off, an
+invalid value only warns so that it can't break importing the solutions.
+"""
+import os
+import sys
+import warnings
+
+OFF = 0
+INFO = 1
+DEBUG = 2
+TRACE = 3
+
+LEVELS = {"off": OFF, "info": INFO, "debug": DEBUG, "trace": TRACE}
+
+
+def parse_level(value: str) -> int:
+    value = value.strip().lower()
+    if value in LEVELS:
+        return LEVELS[value]
+    return int(value or OFF)
+
+
+def level_from_env() -> int:
+    """Return the level set by `AOC_TRACE`, OFF with a warning if it's invalid."""
+    value = os.environ.get("AOC_TRACE", "")
+    try:
+        return parse_level(value)
+    except ValueError:
+        warnings.warn(f"Ignoring invalid AOC_TRACE={value!r}, tracing is off")
+        return OFF
+
+
+level = level_from_env()
+
+
+def set_level(new_level: int) -> None:
+    global level
+    level = new_level
+
+
+def enabled(at: int) -> bool:
+    return at <= level
+
+
+def log(at: int, message, *args) -> None:
+    """Emit a message if `at` is enabled.
+
+    `message` is %-formatted with `args`, or called if it is callable, only
+    once the level check passes.
+    """
+    if at > level:
+        return
+    if callable(message):
+        message = message()
+    elif args:
+        message = message % args
+    print(message, file=sys.stderr)
+
+
+def info(message, *args) -> None:
+    if INFO <= level:
+        log(INFO, message, *args)
+
+
+def debug(message, *args) -> None:
+    if DEBUG <= level:
+        log(DEBUG, message, *args)
+
+
+def trace(message, *args) -> None:
+    if TRACE <= level:
+        log(TRACE, message, *args)
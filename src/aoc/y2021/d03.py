@@ -50,8 +50,7 @@ gamma rate and epsilon rate, then multiply them together. *What is the
 answer in decimal, not binary.)
 """
 
-# Standard library imports
-from aocd.models import Puzzle
+from aoc.utils.inputs import get_input
 
 
 def parse(input_data):
@@ -173,8 +172,11 @@ def solve_part_two(input_data):
 
 
 def main():
+    from aocd.models import Puzzle
+
     puzzle = Puzzle(year=2021, day=3)
-    parsed_data = parse(puzzle.input_data)
+    input_data = get_input(2021, 3, allow_fetch=True)
+    parsed_data = parse(input_data)
     answer_a = solve_part_one(parsed_data)
     if answer_a:
         puzzle.answer_a = answer_a
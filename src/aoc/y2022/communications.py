@@ -32,13 +32,20 @@ class Message:
         marker.
         For example, suppose you receive the following datastream buffer:
         `mjqjpqmgbljsphdztnvjfqwrcgsmlb`
+
+        `message` can be a str or a bytes-like buffer. It is read once, keeping the
+        last position of each character rather than slicing every window.
         """
-        for i in range(length, len(message), 1):
-            unique_chars = set(message[i - length : i])
-            if len(unique_chars) == length:
-                return i
-        else:
-            return -1
+        last_seen = {}
+        start = 0
+        for position, char in enumerate(message):
+            if last_seen.get(char, -1) >= start:
+                start = last_seen[char] + 1
+            last_seen[char] = position
+            if position + 1 - start == length:
+                end = position + 1
+                return end if end < len(message) else -1
+        return -1
 
 
 def parse_line(line):
@@ -55,8 +55,7 @@ Find the Elf carrying the most Calories. *How many total Calories is
 that Elf carrying?*
 """
 
-# Standard library imports
-from aocd.models import Puzzle
+from aoc.utils.inputs import get_input
 
 
 def parse(input_data):
@@ -106,8 +105,11 @@ def solve_part_two(input_data):
 
 
 def main():
+    from aocd.models import Puzzle
+
     puzzle = Puzzle(year=2022, day=1)
-    parsed_data = parse(puzzle.input_data)
+    input_data = get_input(2022, 1, allow_fetch=True)
+    parsed_data = parse(input_data)
     answer_a = solve_part_one(parsed_data)
     if answer_a:
         puzzle.answer_a = answer_a
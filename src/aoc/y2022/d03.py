@@ -56,8 +56,7 @@ Find the item type that appears in both compartments of each rucksack.
 
 import string
 
-# Standard library imports
-from aocd.models import Puzzle
+from aoc.utils.inputs import get_input
 
 
 def parse(input_data):
@@ -131,8 +130,11 @@ def solve_part_two(input_data):
 
 
 def main():
+    from aocd.models import Puzzle
+
     puzzle = Puzzle(year=2022, day=3)
-    parsed_data = parse(puzzle.input_data)
+    input_data = get_input(2022, 3, allow_fetch=True)
+    parsed_data = parse(input_data)
     answer_a = solve_part_one(parsed_data)
     if answer_a:
         puzzle.answer_a = answer_a
@@ -56,8 +56,7 @@ such pairs.
 *In how many assignment pairs does one range fully contain the other?*
 """
 
-# Standard library imports
-from aocd.models import Puzzle
+from aoc.utils.inputs import get_input
 
 
 def parse(input_data):
@@ -110,8 +109,11 @@ In how many assignment pairs do the ranges overlap?
 
 
 def main():
+    from aocd.models import Puzzle
+
     puzzle = Puzzle(year=2022, day=4)
-    parsed_data = parse(puzzle.input_data)
+    input_data = get_input(2022, 4, allow_fetch=True)
+    parsed_data = parse(input_data)
     answer_a = solve_part_one(parsed_data)
     if answer_a:
         puzzle.answer_a = answer_a
@@ -4,8 +4,7 @@
 
 from collections import deque
 
-# Standard library imports
-from aocd.models import Puzzle
+from aoc.utils.inputs import get_input
 
 
 def parse_initialization(input_data):
@@ -294,12 +293,15 @@ def solve_part_two(input_data):
 
 
 def main():
+    from aocd.models import Puzzle
+
     puzzle = Puzzle(year=2022, day=5)
-    parsed_data = parse(puzzle.input_data)
+    input_data = get_input(2022, 5, allow_fetch=True)
+    parsed_data = parse(input_data)
     answer_a = solve_part_one(parsed_data)
     if answer_a:
         puzzle.answer_a = answer_a
-    parsed_data = parse(puzzle.input_data)
+    parsed_data = parse(input_data)
     answer_b = solve_part_two(parsed_data)
     if answer_b:
         puzzle.answer_b = answer_b
@@ -2,9 +2,7 @@
 """Solutions for AoC 6, 2022."""
 # Created: 2022-12-06 08:32:40.386813
 
-# Standard library imports
-from aocd.models import Puzzle
-
+from aoc.utils.stream import open_input
 from aoc.y2022.communications import Message
 
 
@@ -91,12 +89,15 @@ def solve_part_two(input_data):
 
 
 def main():
+    from aocd.models import Puzzle
+
     puzzle = Puzzle(year=2022, day=6)
-    parsed_data = parse(puzzle.input_data)
+    input_data = open_input(2022, 6, allow_fetch=True)
+    parsed_data = parse(input_data)
     answer_a = solve_part_one(parsed_data)
     if answer_a:
         puzzle.answer_a = answer_a
-    parsed_data = parse(puzzle.input_data)
+    parsed_data = parse(input_data)
     answer_b = solve_part_two(parsed_data)
     if answer_b:
         puzzle.answer_b = answer_b
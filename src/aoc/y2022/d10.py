@@ -2,8 +2,7 @@
 """Solutions for AoC 10, 2022."""
 # Created: 2022-12-10 00:00:05.546194
 
-# Standard library imports
-from aocd.models import Puzzle
+from aoc.utils.inputs import get_input
 
 
 def schedule_instruction(instruction_counter, instruction):
@@ -460,12 +459,15 @@ def solve_part_two(input_data):
 
 
 def main():
+    from aocd.models import Puzzle
+
     puzzle = Puzzle(year=2022, day=10)
-    parsed_data = parse(puzzle.input_data)
+    input_data = get_input(2022, 10, allow_fetch=True)
+    parsed_data = parse(input_data)
     answer_a = solve_part_one(parsed_data)
     if answer_a:
         puzzle.answer_a = answer_a
-    parsed_data = parse(puzzle.input_data)
+    parsed_data = parse(input_data)
     answer_b = solve_part_two(parsed_data)
     if answer_b:
         puzzle.answer_b = answer_b
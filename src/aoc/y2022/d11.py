@@ -5,8 +5,8 @@
 import math
 import operator
 
-# Standard library imports
-from aocd.models import Puzzle
+from aoc.utils import trace
+from aoc.utils.inputs import get_input
 
 total_modulus = 1
 
@@ -23,7 +23,7 @@ class Item(object):
 
     def relax(self):
         if self.nervous:
-            print("Dividing by 3")
+            trace.trace("Dividing by 3")
             self.worry_level = math.floor(self.worry_level / 3)
 
     def worry(self, operand, value):
@@ -39,8 +39,11 @@ class Item(object):
 
     def __eq__(self, o):
         if isinstance(o, Item):
-            print(
-                f"{self.worry_level} == {o.worry_level} {self.worry_level == o.worry_level}"
+            trace.trace(
+                "%s == %s %s",
+                self.worry_level,
+                o.worry_level,
+                self.worry_level == o.worry_level,
             )
             return self.worry_level == o.worry_level
         return NotImplemented
@@ -138,13 +141,9 @@ class Monkey(object):
 
     def __eq__(self, o):
         if isinstance(o, Monkey):
-            print(f"{self.moduli} == {o.moduli} {self.moduli == o.moduli}")
-            print(f"{self.value} == {o.value} {self.value == o.value}")
-            print(f"{self.action} == {o.action} {self.action == o.action}")
-            print(
-                f"{self.true_monkey} == {o.true_monkey} {self.true_monkey == o.true_monkey}"
-            )
-            print(f"{self.false_monkey} == {o.false_monkey}")
+            for name in ("moduli", "value", "action", "true_monkey", "false_monkey"):
+                mine, theirs = getattr(self, name), getattr(o, name)
+                trace.trace("%s == %s %s", mine, theirs, mine == theirs)
             return (
                 self.moduli == o.moduli
                 and self.value == o.value
@@ -423,7 +422,7 @@ def solve_part_one(input_data):
     """
     monkeys = run_rounds(input_data)
     items_touched = sorted([monkey.total_items_touched for monkey in monkeys])
-    print(items_touched)
+    trace.debug("Items touched: %s", items_touched)
 
     answer = items_touched[-2] * items_touched[-1]
     return answer
@@ -531,22 +530,25 @@ def solve_part_two(input_data):
     global total_modulus
     total_modulus = math.lcm(*[m.moduli for m in input_data])
     # total_modulus = 9699690
-    print(total_modulus)
+    trace.debug("Total modulus: %s", total_modulus)
     monkeys = run_rounds(input_data, rounds=10000)
     items_touched = sorted([monkey.total_items_touched for monkey in monkeys])
-    print(items_touched)
+    trace.debug("Items touched: %s", items_touched)
 
     answer = items_touched[-2] * items_touched[-1]
     return answer
 
 
 def main():
+    from aocd.models import Puzzle
+
     puzzle = Puzzle(year=2022, day=11)
-    parsed_data = parse(puzzle.input_data)
+    input_data = get_input(2022, 11, allow_fetch=True)
+    parsed_data = parse(input_data)
     answer_a = solve_part_one(parsed_data)
     if answer_a:
         puzzle.answer_a = answer_a
-    parsed_data = parse(puzzle.input_data, nervous=False)
+    parsed_data = parse(input_data, nervous=False)
     answer_b = solve_part_two(parsed_data)
     if answer_b:
         puzzle.answer_b = answer_b
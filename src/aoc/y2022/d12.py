@@ -4,17 +4,17 @@
 
 import string
 from collections import defaultdict
+from math import inf as INFINITY
 from typing import Iterator
 
-# Standard library imports
-from aocd.models import Puzzle
-
 from aoc.utils import pathfinding
+from aoc.utils.inputs import get_input
 from aoc.utils.pathfinding import (
     GridLocation,
     a_star_search,
     dijkstra_search,
     draw_grid,
+    multi_source_bfs,
     reconstruct_path,
 )
 
@@ -183,51 +183,25 @@ def solve_part_two(input_data):
     What is the fewest steps required to move starting from any square with elevation a to the location that should get the best signal?
     """
     hill = input_data
-    hill.draw(trim=True)
-    r = "c"
-
-    start_options = []
-    for node, char in hill.nodes.items():
-        if char == "a":
-            start_options.append(node)
-    min_len = float("inf")
+    start_options = [node for node, char in hill.nodes.items() if char == "a"]
     assert hill.start in start_options
-    for pos in start_options:
-        if r != "c":
-            r = input("Continue? ")
-
-        start = pos
-        goal = hill.goal
-        path, costs = a_star_search(hill, start, goal)
-        path_cost = len(
-            reconstruct_path(
-                path,
-                goal=goal,
-                start=start,
-                add_start=False,
-            )
-        )
-        if path_cost == 0:
-            continue
-        draw_grid(
-            hill,
-            path=reconstruct_path(path, start=start, goal=goal, reverse=True),
-            start=hill.start,
-            goal=hill.goal,
-            trim=True,
-        )
-        min_len = min(path_cost, min_len)
-    answer = min_len
+    # One search from every start at once instead of one search per start
+    _, distance = multi_source_bfs(hill, start_options, goal=hill.goal)
+    # No trail when none of the starts can reach the goal
+    answer = distance.get(hill.goal, INFINITY)
     return answer
 
 
 def main():
+    from aocd.models import Puzzle
+
     puzzle = Puzzle(year=2022, day=12)
-    parsed_data = parse(puzzle.input_data)
+    input_data = get_input(2022, 12, allow_fetch=True)
+    parsed_data = parse(input_data)
     answer_a = solve_part_one(parsed_data)
     if answer_a:
         puzzle.answer_a = answer_a
-    parsed_data = parse(puzzle.input_data)
+    parsed_data = parse(input_data)
     answer_b = solve_part_two(parsed_data)
     if answer_b:
         puzzle.answer_b = answer_b
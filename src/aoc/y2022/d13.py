@@ -4,10 +4,9 @@
 
 import functools
 
-# Standard library imports
-from aocd.models import Puzzle
-
-from aoc.utils.parsers import str_to_list
+from aoc.utils import trace
+from aoc.utils.inputs import get_input
+from aoc.utils.parsers import parse_lists
 
 
 def parse(input_data: str):
@@ -24,14 +23,8 @@ def parse(input_data: str):
         ([[1],[2,3,4]], [[1],4])
     ]
     """
-    ret = []
-    lines = input_data.splitlines()
-    for i in range(0, len(lines), 3):
-        left = eval(lines[i])
-        right = eval(lines[i + 1])
-        ret.append((left, right))
-
-    return ret
+    packets = parse_lists(input_data)
+    return list(zip(packets[::2], packets[1::2]))
 
 
 def is_ordered(left, right):
@@ -65,7 +58,7 @@ def is_ordered(left, right):
       - Compare 3 vs 5
         - Left side is smaller, so inputs are in the right order
     """
-    print(f"Comparing {left} {right}")
+    trace.trace("Comparing %s %s", left, right)
     if len(left) > 0 and len(right) == 0:
         return False
     elif len(left) == 0 and len(right) > 0:
@@ -78,7 +71,7 @@ def is_ordered(left, right):
         try:
             left_val, right_val = left[i], right[i]
         except IndexError:
-            print(f"Too far: {i} {left} {right} {i >= len(right)}")
+            trace.debug("Too far: %s %s %s", i, left, right)
             raise
         left_type, right_type = type(left_val), type(right_val)
         if left_type == right_type == int:
@@ -90,13 +83,13 @@ def is_ordered(left, right):
                 return False
         elif left_type == right_type == list:
             ret = is_ordered(left_val, right_val)
-            print(f"Compared {left_val} {right_val} => {ret}")
+            trace.trace("Compared %s %s => %s", left_val, right_val, ret)
             if ret is not None:
                 return ret
             else:
                 continue
         elif left_type == list and right_type == int:
-            print("Type mismatch")
+            trace.trace("Type mismatch")
             new_right = [v if j != i else [right_val] for j, v in enumerate(right)]
             ret = is_ordered(left, new_right)
             if ret is not None:
@@ -104,7 +97,7 @@ def is_ordered(left, right):
             else:
                 continue
         elif left_type == int and right_type == list:
-            print("Type mismatch")
+            trace.trace("Type mismatch")
             new_left = [v if j != i else [left_val] for j, v in enumerate(left)]
             ret = is_ordered(new_left, right)
             if ret is not None:
@@ -248,10 +241,10 @@ def solve_part_one(input_data):
     answer = 0
     for i, entry in enumerate(input_data):
         pair = i + 1
-        print(f"Testing pair {pair}")
+        trace.trace("Testing pair %s", pair)
         left, right = entry
         if is_ordered(left, right):
-            print(f"{pair} {left} {right}: True")
+            trace.trace("%s %s %s: True", pair, left, right)
             answer += pair
     return answer
 
@@ -324,12 +317,15 @@ def solve_part_two(input_data):
 
 
 def main():
+    from aocd.models import Puzzle
+
     puzzle = Puzzle(year=2022, day=13)
-    parsed_data = parse(puzzle.input_data)
+    input_data = get_input(2022, 13, allow_fetch=True)
+    parsed_data = parse(input_data)
     answer_a = solve_part_one(parsed_data)
     if answer_a:
         puzzle.answer_a = answer_a
-    parsed_data = parse(puzzle.input_data)
+    parsed_data = parse(input_data)
     answer_b = solve_part_two(parsed_data)
     if answer_b:
         puzzle.answer_b = answer_b
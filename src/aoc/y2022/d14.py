@@ -4,19 +4,16 @@
 
 from typing import Iterable, Iterator, Optional
 
-# Standard library imports
-from aocd.models import Puzzle
-from rich import inspect
-from rich.progress import track
-
 from aoc.utils import pathfinding
+from aoc.utils.cache import cached_parse
+from aoc.utils.inputs import get_input
 
 
 class Cave(pathfinding.SquareGrid):
     def __init__(self, paths, bottomless: bool = True):
         self.sand_start = (500, 0)
-        self.walls: list[pathfinding.GridLocation] = []
-        self.sand: list[pathfinding.GridLocation] = []
+        self.walls = pathfinding.SetOccupancy()
+        self.sand = pathfinding.SetOccupancy()
         self.bottom = None
 
         walls = []
@@ -179,6 +176,7 @@ class Cave(pathfinding.SquareGrid):
         return len(came_from)
 
 
+@cached_parse
 def parse(input_data):
     """Transform the data"""
     lines = input_data.splitlines()
@@ -414,12 +412,15 @@ def solve_part_two(input_data):
 
 
 def main():
+    from aocd.models import Puzzle
+
     puzzle = Puzzle(year=2022, day=14)
-    # parsed_data = parse(puzzle.input_data)
+    input_data = get_input(2022, 14, allow_fetch=True)
+    # parsed_data = parse(input_data)
     # answer_a = solve_part_one(parsed_data)
     # if answer_a:
     #     puzzle.answer_a = answer_a
-    parsed_data = parse(puzzle.input_data)
+    parsed_data = parse(input_data)
     answer_b = solve_part_two(parsed_data)
     if answer_b:
         puzzle.answer_b = answer_b
@@ -6,11 +6,9 @@ from functools import cache
 from itertools import product
 from typing import Tuple
 
-# Standard library imports
-from aocd.models import Puzzle, default_user
-from rich import inspect, print
-from rich.progress import track
-
+from aoc.utils.console import print, track
+from aoc.utils.inputs import get_input
+from aoc.utils.parsers import ints
 from aoc.utils.pathfinding import GridLocation, SquareGrid, draw_grid
 
 
@@ -48,16 +46,18 @@ class TunnelSystem(SquareGrid):
         return inside_sensor(sensor, (sensor_x, row), radius)
 
     @staticmethod
-    def parse_sensor_beacon(line: str) -> list[GridLocation]:
-        """Parse a sensor beacon pair string.
+    def parse_sensor_beacon(line: list[str]) -> list[GridLocation]:
+        """Parse a sensor beacon pair string split on spaces.
 
         Sensor at x=2, y=18: closest beacon is at x=-2, y=15
           0     1  2    3       4       5    6  7   8     9
         """
-        sensor_x = int(line[2].split("=")[1].split(",")[0])
-        sensor_y = int(line[3].split("=")[1].split(":")[0])
-        beacon_x = int(line[8].split("=")[1].split(",")[0])
-        beacon_y = int(line[9].split("=")[1])
+        sensor_x, sensor_y, beacon_x, beacon_y = ints(" ".join(line))
+        return TunnelSystem.sensor_beacon(sensor_x, sensor_y, beacon_x, beacon_y)
+
+    @staticmethod
+    def sensor_beacon(sensor_x, sensor_y, beacon_x, beacon_y) -> list[GridLocation]:
+        """Return the sensor, its closest beacon and the distance between them."""
         distance = abs(beacon_x - sensor_x) + abs(beacon_y - sensor_y)
         return (sensor_x, sensor_y), (beacon_x, beacon_y), distance
 
@@ -118,9 +118,8 @@ def parse(input_data):
     sensor_distances: dict[GridLocation] = {}
     min_x = min_y = float("inf")
     max_x = max_y = 0
-    for line in input_data.splitlines():
-        line = line.strip().split(" ")
-        sensor, beacon, distance = TunnelSystem.parse_sensor_beacon(line)
+    for numbers in ints(input_data, columns=4):
+        sensor, beacon, distance = TunnelSystem.sensor_beacon(*numbers)
         sensor_x, sensor_y = sensor
         beacon_x, beacon_y = beacon
         sensors.append(sensor)
@@ -182,6 +181,7 @@ def calculate_range(sensor, y, reach):
 
 LineSegment = Tuple[GridLocation, GridLocation]
 
+
 # From https://stackoverflow.com/a/20677983
 def line_intersection(line1, line2):
     xdiff = (line1[0][0] - line1[1][0], line2[0][0] - line2[1][0])
@@ -516,8 +516,11 @@ def solve_part_two(input_data, search_area=4000000):
 
 
 def main():
+    from aocd.models import Puzzle, default_user
+
     puzzle = Puzzle(year=2022, day=15)
-    parsed_data = parse(puzzle.input_data)
+    input_data = get_input(2022, 15, allow_fetch=True)
+    parsed_data = parse(input_data)
     u = default_user()
     stats = u.get_stats(2022).get((2022, 15), {})
     if stats.get("a", None) is None:
@@ -525,7 +528,7 @@ def main():
         if answer_a:
             puzzle.answer_a = answer_a
     if stats.get("b", None) is None:
-        parsed_data = parse(puzzle.input_data)
+        parsed_data = parse(input_data)
         answer_b = solve_part_two(parsed_data)
         if answer_b:
             puzzle.answer_b = answer_b
@@ -4,22 +4,20 @@
 
 from collections import defaultdict
 from functools import partial
-from itertools import combinations, product
+from itertools import combinations
 from math import inf as INFINITY
 from typing import Optional, Tuple
 
-# Standard library imports
-from aocd.models import Puzzle, default_user
-from rich import inspect, print
-from rich.progress import track
-
+from aoc.utils.cache import cached_parse
+from aoc.utils.console import track
+from aoc.utils.inputs import get_input
+from aoc.utils.parsers import RecordParser, split_names
 from aoc.utils.pathfinding import (
     Location,
     PriorityQueue,
     Queue,
     WeightedGraph,
-    breadth_first_search,
-    reconstruct_path,
+    all_pairs_shortest_paths,
 )
 
 
@@ -69,20 +67,11 @@ class Volcano(WeightedGraph):
         return total
 
     def calculate_distances(self):
+        """Steps between every pair of valves, -1 when one can't reach the other."""
         distances: dict[str] = defaultdict(dict)
-        for start, goal in track(
-            product(self.nodes, self.nodes),
-            description="Calculating distances between nodes",
-        ):
-            distance = (
-                len(
-                    reconstruct_path(
-                        breadth_first_search(self, start, goal), start, goal
-                    )
-                )
-                - 1
-            )
-            distances[start][goal] = distance
+        for start, goals in calculate_distances(self).items():
+            for goal, distance in goals.items():
+                distances[start][goal] = -1 if distance == INFINITY else distance
         return distances
 
     def __str__(self):
@@ -103,6 +92,14 @@ class Volcano(WeightedGraph):
         return ret
 
 
+VALVE = RecordParser(
+    r"Valve (\w+) has flow rate=(\d+); tunnels? leads? to valves? (.+)",
+    str,
+    int,
+    split_names,
+)
+
+
 def parse_line(line: str) -> Tuple[str, int, list]:
     """Parse valve line
 
@@ -113,11 +110,7 @@ def parse_line(line: str) -> Tuple[str, int, list]:
     0
     (DD, II, BB)
     """
-    line = line.split(" ", maxsplit=9)
-    name = line[1]
-    rate = int(line[4].split("=")[1].strip(";"))
-    neighbors = [n.strip() for n in line[9].split(",")]
-    return name, rate, neighbors
+    return VALVE.parse_one(line)
 
 
 def walk_volcano(
@@ -177,42 +170,26 @@ def solutions(distance, valves, time=30, cur="AA", chosen={}):
     yield chosen
 
 
-# from https://www.geeksforgeeks.org/floyd-warshall-algorithm-dp-16/
 def calculate_distances(graph):
-    """Calculate all distances between nodes."""
-    # Uses the floyd warshall algorithm
-    distances = defaultdict(lambda: defaultdict(lambda: INFINITY))
+    """Calculate all distances between nodes.
 
-    # initialize some items correctly
-    for name, node in graph.nodes.items():
-        distances[name][name] = 0
-
-        for neighbor in node.neighbors:
-            distances[name][neighbor] = 1
-            distances[neighbor][neighbor] = 0
-
-    # for every node
-    for k in graph.nodes:
-        # for every node
-        for i in graph.nodes:
-            # for every node
-            for j in graph.nodes:
-                # the distance between i and j is the minimum of
-                distances[i][j] = min(
-                    # the distance between them directly
-                    # and the distance between them and another intermediate node
-                    distances[i][j],
-                    distances[i][k] + distances[k][j],
-                )
+    Pairs that can't reach each other, or that aren't nodes, are INFINITY apart.
+    """
+    index, matrix = all_pairs_shortest_paths(graph, graph.nodes)
+    distances = defaultdict(lambda: defaultdict(lambda: INFINITY))
+    for a, i in index.items():
+        for b, j in index.items():
+            distance = matrix[i, j]
+            distances[a][b] = int(distance) if distance != INFINITY else INFINITY
     return distances
 
 
+@cached_parse
 def parse(input_data):
     """Transform the data"""
     # Should I convert the graph to remove loops?
     valves = {}
-    for line in input_data.splitlines():
-        name, flow_rate, neighbors = parse_line(line)
+    for name, flow_rate, neighbors in VALVE.parse(input_data):
         valve = Valve(name, flow_rate, neighbors)
         valves[name] = valve
     # Update valve neighbors
@@ -486,24 +463,6 @@ def solve_part_two(input_data, raw_data):
 
     """
 
-    def floyd_warshall(g):
-        distance = defaultdict(lambda: defaultdict(lambda: INFINITY))
-
-        for a, bs in g.items():
-            distance[a][a] = 0
-
-            for b in bs:
-                distance[a][b] = 1
-                distance[b][b] = 0
-
-        for a, b, c in product(g, g, g):
-            bc, ba, ac = distance[b][c], distance[b][a], distance[a][c]
-
-            if ba + ac < bc:
-                distance[b][c] = ba + ac
-
-        return distance
-
     graph = defaultdict(list)
     rates = {}
 
@@ -516,7 +475,7 @@ def solve_part_two(input_data, raw_data):
 
         for dst in dsts:
             graph[src].append(dst)
-    distance = floyd_warshall(graph)
+    distance = calculate_distances(input_data)
     good = frozenset(filter(rates.get, graph))
     max_scores = defaultdict(int)
 
@@ -562,8 +521,11 @@ def solve_part_two(input_data, raw_data):
 
 
 def main():
+    from aocd.models import Puzzle, default_user
+
     puzzle = Puzzle(year=2022, day=16)
-    parsed_data = parse(puzzle.input_data)
+    input_data = get_input(2022, 16, allow_fetch=True)
+    parsed_data = parse(input_data)
     u = default_user()
     stats = u.get_stats(2022).get((2022, 16), {})
     if stats.get("a", None) is None:
@@ -571,8 +533,8 @@ def main():
         if answer_a:
             puzzle.answer_a = answer_a
     if stats.get("b", None) is None:
-        parsed_data = parse(puzzle.input_data)
-        answer_b = solve_part_two(parsed_data, puzzle.input_data)
+        parsed_data = parse(input_data)
+        answer_b = solve_part_two(parsed_data, input_data)
         if answer_b:
             puzzle.answer_b = answer_b
 
@@ -4,7 +4,8 @@ from functools import partial
 from itertools import combinations, product
 from math import inf as INFINITY
 
-from aocd.models import Puzzle, default_user
+from aoc.utils.inputs import get_input
+from aoc.utils.parsers import RecordParser
 
 
 def floyd_warshall(g):
@@ -48,8 +49,8 @@ def solutions(distance, rates, valves, time=30, cur="AA", chosen={}):
 graph = defaultdict(list)
 rates = {}
 
-puzzle = Puzzle(year=2022, day=16)
-fin = puzzle.input_data.splitlines()
+input_data = get_input(2022, 16, allow_fetch=True)
+fin = input_data.splitlines()
 for fields in map(str.split, fin):
     src = fields[1]
     dsts = list(map(lambda x: x.rstrip(","), fields[9:]))
@@ -83,10 +84,9 @@ best = max(
 print(f"Part 2: {best}")
 
 
-import re
 from copy import copy
 from dataclasses import dataclass
-from itertools import combinations, permutations
+from itertools import combinations
 
 import numpy as np
 
@@ -98,14 +98,17 @@ class Cave:
     flow: int
 
 
+CAVE = RecordParser(
+    r"Valve ([A-Z]{2}) has flow rate=(\d+); tunnels? leads? to valves? (.+)",
+    str,
+    int,
+    lambda labels: tuple(labels.split(", ")),
+)
+
+
 def load_data(input_data):
-    lines = map(str.strip, input_data)
-    caves = []
-    for l in lines:
-        labels = re.findall("[A-Z]{2}", l)
-        flow = int(re.search("\d+", l)[0])
-        caves.append(Cave(labels[0], labels[1:], flow))
-    return caves
+    text = "\n".join(map(str.strip, input_data))
+    return [Cave(label, tunnels, flow) for label, flow, tunnels in CAVE.parse(text)]
 
 
 def adjacency_matrix(nodes: list[Cave]) -> np.ndarray:
@@ -132,12 +135,9 @@ def distance_matrix(A: np.ndarray) -> np.ndarray:
     D = np.where(A, A, 10000)
     d = np.diag([1] * l, 0)
     D = np.where(d, 0, D)
-    for i, row in enumerate(D):
-        neighbours = np.where(row != 10000)[0]
-        for n1, n2 in permutations(neighbours, 2):
-            d = min(row[n1] + row[n2], D[n1, n2])
-            D[n1, n2] = d
-            D[n2, n1] = d
+    # Relax every pair through each intermediate cave k in turn
+    for k in range(l):
+        D = np.minimum(D, D[:, k, None] + D[None, k, :])
     return D.astype(int)
 
 
@@ -2,9 +2,8 @@
 """Solutions for AoC 17, 2022."""
 # Created: 2022-12-18 16:19:11.371754
 
-# Standard library imports
-from aocd.models import Puzzle, default_user
-from rich import inspect, print
+from aoc.utils.console import print
+from aoc.utils.inputs import get_input
 
 
 def parse(input_data):
@@ -462,8 +461,11 @@ def solve_part_two(input_data):
 
 
 def main():
+    from aocd.models import Puzzle, default_user
+
     puzzle = Puzzle(year=2022, day=17)
-    parsed_data = parse(puzzle.input_data)
+    input_data = get_input(2022, 17, allow_fetch=True)
+    parsed_data = parse(input_data)
     u = default_user()
     stats = u.get_stats(2022).get((2022, 17), {})
     if stats.get("a", None) is None:
@@ -471,7 +473,7 @@ def main():
         if answer_a:
             puzzle.answer_a = answer_a
     if stats.get("b", None) is None:
-        parsed_data = parse(puzzle.input_data)
+        parsed_data = parse(input_data)
         answer_b = solve_part_two(parsed_data)
         if answer_b:
             puzzle.answer_b = answer_b
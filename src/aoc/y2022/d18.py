@@ -5,10 +5,8 @@
 from collections import deque
 from itertools import product
 
-# Standard library imports
-from aocd.models import Puzzle, default_user
-from rich import print
-from rich.progress import track
+from aoc.utils.console import print, track
+from aoc.utils.inputs import get_input
 
 
 def parse(input_data):
@@ -188,8 +186,11 @@ def solve_part_two(input_data):
 
 
 def main():
+    from aocd.models import Puzzle, default_user
+
     puzzle = Puzzle(year=2022, day=18)
-    parsed_data = parse(puzzle.input_data)
+    input_data = get_input(2022, 18, allow_fetch=True)
+    parsed_data = parse(input_data)
     u = default_user()
     stats = u.get_stats(2022).get((2022, 18), {})
     if stats.get("a", None) is None:
@@ -199,7 +200,7 @@ def main():
             puzzle.answer_a = answer_a
     if stats.get("b", None) is None:
         print("Solving part 2")
-        parsed_data = parse(puzzle.input_data)
+        parsed_data = parse(input_data)
         answer_b = solve_part_two(parsed_data)
         if answer_b:
             puzzle.answer_b = answer_b
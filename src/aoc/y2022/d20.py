@@ -2,66 +2,37 @@
 """Solutions for AoC 20, 2022."""
 # Created: 2022-12-20 09:42:55.797270
 
-from typing import Tuple
+from typing import Optional, Tuple
 
-# Standard library imports
-from aocd.models import Puzzle, default_user
-from rich import inspect
-from rich import print as rprint
-from rich.progress import track
+from aoc.utils import IndexedRing
+from aoc.utils.console import track
+from aoc.utils.inputs import get_input
 
-from aoc.utils import CircularLinkedList
-from aoc.utils import MyNode as Node
 
+class Msg(IndexedRing):
+    """The encrypted file as a ring of the original positions of its numbers.
+
+    Numbers can repeat, their original positions can't.
+    """
 
-class Msg(CircularLinkedList):
     def __init__(self, instructions: list):
-        self.head: Node = None
-        # Mapping of instruction to node
-        self.indexes: dict[int, Node] = {}
-
-        prev = None
-        for idx, instruction in enumerate(instructions):
-            node = Node(instruction)
-            node.previous = prev
-            self.indexes[(idx, instruction)] = node
-            if prev:
-                prev.next = node
-            else:
-                self.head = node
-            prev = node
-        if prev.next is None:
-            prev.next = self.head
-            self.head.previous = prev
-
-    def __getitem__(self, key):
-        return self.indexes[key]
-
-    def __len__(self):
-        return len(self.indexes)
-
-
-def rearrange(linked_list: Msg, instruction: int, idx: int, modifier: int = 1):
+        super().__init__(range(len(instructions)))
+        self.instructions = instructions
+
+    def value_at(self, position: int) -> int:
+        return self.instructions[self.at(position)]
+
+    def __str__(self):
+        return f"[{', '.join(str(self.instructions[idx]) for idx in self)}]"
+
+
+def rearrange(
+    linked_list: Msg, instruction: int, idx: Optional[int] = None, modifier: int = 1
+):
     """Given instruction, rearrange a linked list"""
-    node = linked_list.indexes[(idx, instruction)]
-    offset = (instruction * modifier) % (len(linked_list) - 1)
-    insertion_node = node + offset
-    if node == insertion_node:
-        return linked_list
-    # Remove the current node from the list
-    next_node = node.next
-    previous_node = node.previous
-    previous_node.next = node.next
-    next_node.previous = node.previous
-
-    # Move through the linked list
-    # Put the current node between the insertion node and its next
-    node.next = insertion_node.next
-    node.previous = insertion_node
-    # Update the A -> N -> C node
-    insertion_node.next.previous = node
-    # Update the A node
-    insertion_node.next = node
+    if idx is None:
+        idx = linked_list.instructions.index(instruction)
+    linked_list.move(idx, instruction * modifier)
     return linked_list
 
 
@@ -141,22 +112,15 @@ def solve_part_one(input_data):
     """
     instructions, linked_list = input_data
 
-    start = None
     for idx, instruction in track(
         enumerate(instructions), description="Processing instructions"
     ):
-        if instruction == 0:
-            start = (idx, instruction)
         linked_list = rearrange(linked_list, instruction, idx)
 
-    node = linked_list[start]
+    start = linked_list.index_of(instructions.index(0))
     total = 0
-    print(len(linked_list))
     for v in [1000, 2000, 3000]:
-        addend = v % len(linked_list)
-        num = node + addend
-        total += (num).data
-        print(num)
+        total += linked_list.value_at(start + v)
 
     answer = total
     return answer
@@ -213,32 +177,29 @@ def solve_part_two(input_data):
     instructions, linked_list = input_data
     decryption_key = 811589153
 
-    start = None
     for i in range(10):
         for idx, instruction in track(
             enumerate(instructions), description="Processing instructions"
         ):
-            if not start and instruction == 0:
-                start = (idx, instruction)
             linked_list = rearrange(
                 linked_list, instruction, idx, modifier=decryption_key
             )
 
-    node = linked_list[start]
+    start = linked_list.index_of(instructions.index(0))
     total = 0
-    print(len(linked_list))
     for v in [1000, 2000, 3000]:
-        addend = v % len(linked_list)
-        num = node + addend
-        total += (num).data * decryption_key
+        total += linked_list.value_at(start + v) * decryption_key
 
     answer = total
     return answer
 
 
 def main():
+    from aocd.models import Puzzle, default_user
+
     puzzle = Puzzle(year=2022, day=20)
-    parsed_data = parse(puzzle.input_data)
+    input_data = get_input(2022, 20, allow_fetch=True)
+    parsed_data = parse(input_data)
     u = default_user()
     stats = u.get_stats(2022).get((2022, 20), {})
     if stats.get("a", None) is None:
@@ -246,7 +207,7 @@ def main():
         if answer_a:
             puzzle.answer_a = answer_a
     if stats.get("b", None) is None:
-        parsed_data = parse(puzzle.input_data)
+        parsed_data = parse(input_data)
         answer_b = solve_part_two(parsed_data)
         if answer_b:
             puzzle.answer_b = answer_b
@@ -2,10 +2,8 @@
 """Solutions for AoC 21, 2022."""
 # Created: 2022-12-25 20:25:51.388619
 
-# Standard library imports
-from aocd.models import Puzzle, default_user
-from rich import inspect, print
-from rich.progress import track
+from aoc.utils.console import print, track
+from aoc.utils.inputs import get_input
 
 
 def parse(input_data):
@@ -249,8 +247,11 @@ def solve_part_two(input_data):
 
 
 def main():
+    from aocd.models import Puzzle, default_user
+
     puzzle = Puzzle(year=2022, day=21)
-    parsed_data = parse(puzzle.input_data)
+    input_data = get_input(2022, 21, allow_fetch=True)
+    parsed_data = parse(input_data)
     u = default_user()
     stats = u.get_stats(2022).get((2022, 21), {})
     if stats.get("a", None) is None:
@@ -258,7 +259,7 @@ def main():
         if answer_a:
             puzzle.answer_a = answer_a
     if stats.get("b", None) is None:
-        parsed_data = parse(puzzle.input_data)
+        parsed_data = parse(input_data)
         answer_b = solve_part_two(parsed_data)
         if answer_b:
             puzzle.answer_b = answer_b
@@ -2,9 +2,7 @@
 """Solutions for AoC 24, 2022."""
 # Created: 2022-12-24 15:37:27.268525
 
-# Standard library imports
-from aocd.models import Puzzle, default_user
-from rich import print
+from aoc.utils.inputs import get_input
 
 
 def parse(input_data):
@@ -275,8 +273,11 @@ def solve_part_two(input_data):
 
 
 def main():
+    from aocd.models import Puzzle, default_user
+
     puzzle = Puzzle(year=2022, day=24)
-    parsed_data = parse(puzzle.input_data)
+    input_data = get_input(2022, 24, allow_fetch=True)
+    parsed_data = parse(input_data)
     u = default_user()
     stats = u.get_stats(2022).get((2022, 24), {})
     if stats.get("a", None) is None:
@@ -284,7 +285,7 @@ def main():
         if answer_a:
             puzzle.answer_a = answer_a
     if stats.get("b", None) is None:
-        parsed_data = parse(puzzle.input_data)
+        parsed_data = parse(input_data)
         answer_b = solve_part_two(parsed_data)
         if answer_b:
             puzzle.answer_b = answer_b
@@ -3,10 +3,10 @@
 # Created: 2023-12-02 08:29:51.109945
 
 # Standard library imports
-from aocd.models import Puzzle, default_user
-from rich import print
 from collections import defaultdict
 
+from aoc.utils.inputs import get_input
+
 
 def parse_game(game):
     id = game.split(":")[0].split(" ")[1]
@@ -110,8 +110,11 @@ def solve_part_two(input_data):
 
 
 def main():
+    from aocd.models import Puzzle, default_user
+
     puzzle = Puzzle(year=2023, day=2)
-    parsed_data = parse(puzzle.input_data)
+    input_data = get_input(2023, 2, allow_fetch=True)
+    parsed_data = parse(input_data)
     u = default_user()
     stats = u.get_stats(2023).get((2023, 2), {})
     if stats.get("a", None) is None:
@@ -119,7 +122,7 @@ def main():
         if answer_a:
             puzzle.answer_a = answer_a
     if stats.get("b", None) is None:
-        parsed_data = parse(puzzle.input_data)
+        parsed_data = parse(input_data)
         answer_b = solve_part_two(parsed_data)
         if answer_b:
             puzzle.answer_b = answer_b
@@ -3,13 +3,13 @@
 # Created: 2023-12-05 08:51:39.495463
 
 # Standard library imports
-from aocd.models import Puzzle, default_user
-from rich import print
-from rich.progress import track
 from collections import defaultdict, deque
 import math
 from typing import List, Tuple
 
+from aoc.utils.console import print
+from aoc.utils.inputs import get_input
+
 
 categories = {}
 
@@ -334,8 +334,11 @@ def solve_part_two(input_data):
 
 
 def main():
+    from aocd.models import Puzzle, default_user
+
     puzzle = Puzzle(year=2023, day=5)
-    parsed_data = parse(puzzle.input_data)
+    input_data = get_input(2023, 5, allow_fetch=True)
+    parsed_data = parse(input_data)
     u = default_user()
     stats = u.get_stats(2023).get((2023, 5), {})
     if stats.get("a", None) is None:
@@ -343,7 +346,7 @@ def main():
         if answer_a:
             puzzle.answer_a = answer_a
     if stats.get("b", None) is None:
-        parsed_data = parse(puzzle.input_data)
+        parsed_data = parse(input_data)
         answer_b = solve_part_two(parsed_data)
         if answer_b:
             puzzle.answer_b = answer_b
@@ -3,11 +3,11 @@
 # Created: 2023-12-06 08:19:38.580188
 
 # Standard library imports
-from aocd.models import Puzzle, default_user
-from rich import print
-from rich.progress import track
 import functools
 
+from aoc.utils.console import track
+from aoc.utils.inputs import get_input
+
 
 def parse(input_data):
     """Transform the data
@@ -72,8 +72,11 @@ def solve_part_two(input_data):
 
 
 def main():
+    from aocd.models import Puzzle, default_user
+
     puzzle = Puzzle(year=2023, day=6)
-    parsed_data = parse(puzzle.input_data)
+    input_data = get_input(2023, 6, allow_fetch=True)
+    parsed_data = parse(input_data)
     u = default_user()
     stats = u.get_stats(2023).get((2023, 6), {})
     if stats.get("a", None) is None:
@@ -81,7 +84,7 @@ def main():
         if answer_a:
             puzzle.answer_a = answer_a
     if stats.get("b", None) is None:
-        parsed_data = parse(puzzle.input_data)
+        parsed_data = parse(input_data)
         answer_b = solve_part_two(parsed_data)
         if answer_b:
             puzzle.answer_b = answer_b
@@ -3,11 +3,12 @@
 # Created: 2023-12-07 09:32:38.755179
 
 # Standard library imports
-from aocd.models import Puzzle, default_user
-from rich import print
 from collections import Counter, defaultdict
 from functools import cmp_to_key, cache
 
+from aoc.utils.console import print
+from aoc.utils.inputs import get_input
+
 
 def parse(input_data):
     """Transform the data"""
@@ -214,8 +215,11 @@ def solve_part_two(input_data):
 
 
 def main():
+    from aocd.models import Puzzle, default_user
+
     puzzle = Puzzle(year=2023, day=7)
-    parsed_data = parse(puzzle.input_data)
+    input_data = get_input(2023, 7, allow_fetch=True)
+    parsed_data = parse(input_data)
     u = default_user()
     stats = u.get_stats(2023).get((2023, 7), {})
     if stats.get("a", None) is None:
@@ -223,7 +227,7 @@ def main():
         if answer_a:
             puzzle.answer_a = answer_a
     if stats.get("b", None) is None:
-        parsed_data = parse(puzzle.input_data)
+        parsed_data = parse(input_data)
         answer_b = solve_part_two(parsed_data)
         if answer_b:
             puzzle.answer_b = answer_b
@@ -3,10 +3,11 @@
 # Created: 2023-12-08 08:41:12.821648
 
 # Standard library imports
-from aocd.models import Puzzle, default_user
-from rich import print
 from math import gcd
 
+from aoc.utils.console import print
+from aoc.utils.inputs import get_input
+
 
 def parse(input_data):
     """Transform the data"""
@@ -179,8 +180,11 @@ def solve_part_two(input_data):
 
 
 def main():
+    from aocd.models import Puzzle, default_user
+
     puzzle = Puzzle(year=2023, day=8)
-    parsed_data = parse(puzzle.input_data)
+    input_data = get_input(2023, 8, allow_fetch=True)
+    parsed_data = parse(input_data)
     u = default_user()
     stats = u.get_stats(2023).get((2023, 8), {})
     if stats.get("a", None) is None:
@@ -188,7 +192,7 @@ def main():
         if answer_a:
             puzzle.answer_a = answer_a
     if stats.get("b", None) is None:
-        parsed_data = parse(puzzle.input_data)
+        parsed_data = parse(input_data)
         answer_b = solve_part_two(parsed_data)
         if answer_b:
             puzzle.answer_b = answer_b
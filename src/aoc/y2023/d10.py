@@ -3,10 +3,12 @@
 # Created: 2023-12-10 12:12:30.481738
 
 # Standard library imports
-from aocd.models import Puzzle, default_user
-from rich import print
 from collections import namedtuple, defaultdict
 
+from aoc.utils.cache import cached_parse
+from aoc.utils.console import print
+from aoc.utils.inputs import get_input
+
 
 CardinalDirection = namedtuple("CardinalDirection", ["delta_x", "delta_y"])
 
@@ -28,6 +30,12 @@ Pipes = {
 }
 
 
+def ground():
+    """Default for coordinates outside the map"""
+    return "."
+
+
+@cached_parse
 def parse(input_data):
     """Transform the data
 
@@ -43,7 +51,7 @@ def parse(input_data):
 
     Returns a default dictionary with each value being the character of the coordinate
     """
-    parsed_data = defaultdict(lambda: ".")
+    parsed_data = defaultdict(ground)
     for y, row in enumerate(input_data.splitlines()):
         for x, value in enumerate(row):
             parsed_data[(x, y)] = value
@@ -400,8 +408,11 @@ def solve_part_two(input_data, start_coordinate=None):
 
 
 def main():
+    from aocd.models import Puzzle, default_user
+
     puzzle = Puzzle(year=2023, day=10)
-    parsed_data = parse(puzzle.input_data)
+    input_data = get_input(2023, 10, allow_fetch=True)
+    parsed_data = parse(input_data)
     u = default_user()
     stats = u.get_stats(2023).get((2023, 10), {})
     if stats.get("a", None) is None:
@@ -409,7 +420,7 @@ def main():
         if answer_a:
             puzzle.answer_a = answer_a
     if stats.get("b", None) is None:
-        parsed_data = parse(puzzle.input_data)
+        parsed_data = parse(input_data)
         answer_b = solve_part_two(parsed_data)
         if answer_b:
             puzzle.answer_b = answer_b
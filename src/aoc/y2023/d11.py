@@ -3,12 +3,13 @@
 # Created: 2023-12-11 21:14:18.713063
 
 # Standard library imports
-from aocd.models import Puzzle, default_user
-from rich import print
-from rich.progress import track
 from collections import defaultdict
 from itertools import combinations
 
+from aoc.utils import trace
+from aoc.utils.console import print, track
+from aoc.utils.inputs import get_input
+
 
 def print_galaxy(galaxy_map):
     rows = max(galaxy_map.keys())
@@ -72,11 +73,11 @@ def expand_graph(input_data, expansion_rate=1):
             # offset += (delta - 1) * rate
             # 1 -> 4 becomes 1 -> 24 if 2,3 are empty, offset = 20
             column_offset += (delta - 1) * expansion_rate
-            print(f"{next_column} missing, column_offset: {column_offset}")
+            trace.trace("%s missing, column_offset: %s", next_column, column_offset)
 
         next_column_value = next_column + column_offset
-        print(f"next_column_value: {next_column_value}")
-    print(f"Column offsets: {column_mapping}")
+        trace.trace("next_column_value: %s", next_column_value)
+    trace.debug("Column offsets: %s", column_mapping)
 
     row_mapping = {}
     populated_rows = sorted(populated_rows)
@@ -90,7 +91,7 @@ def expand_graph(input_data, expansion_rate=1):
         delta = next_row - row
         if delta != 1:
             row_offset += (delta - 1) * expansion_rate
-    print(f"Row offsets: {row_mapping}")
+    trace.debug("Row offsets: %s", row_mapping)
 
     expanded_graph = {}
 
@@ -109,7 +110,7 @@ def solve_part_one(input_data):
     """Solve part one."""
     answer = 0
     coordinates = []
-    print(input_data)
+    trace.trace("%s", input_data)
     expanded_graph = expand_graph(input_data)
     for row_index, row in expanded_graph.items():
         for column_index in row.keys():
@@ -143,8 +144,11 @@ def solve_part_two(input_data, expansion_rate=1000000):
 
 
 def main():
+    from aocd.models import Puzzle, default_user
+
     puzzle = Puzzle(year=2023, day=11)
-    parsed_data = parse(puzzle.input_data)
+    input_data = get_input(2023, 11, allow_fetch=True)
+    parsed_data = parse(input_data)
     u = default_user()
     stats = u.get_stats(2023).get((2023, 11), {})
     if stats.get("a", None) is None:
@@ -152,7 +156,7 @@ def main():
         if answer_a:
             puzzle.answer_a = answer_a
     if stats.get("b", None) is None:
-        parsed_data = parse(puzzle.input_data)
+        parsed_data = parse(input_data)
         answer_b = solve_part_two(parsed_data)
         if answer_b:
             puzzle.answer_b = answer_b
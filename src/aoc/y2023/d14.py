@@ -3,10 +3,11 @@
 # Created: 2023-12-15 08:03:09.032874
 
 # Standard library imports
-from aocd.models import Puzzle, default_user
-from rich import print
 from collections import defaultdict
 
+from aoc.utils.console import print
+from aoc.utils.inputs import get_input
+
 
 class Graph:
     def __init__(self, graph, rock_spots):
@@ -298,8 +299,11 @@ def solve_part_two(input_data, cycles=1000000000):
 
 
 def main():
+    from aocd.models import Puzzle, default_user
+
     puzzle = Puzzle(year=2023, day=14)
-    parsed_data = parse(puzzle.input_data)
+    input_data = get_input(2023, 14, allow_fetch=True)
+    parsed_data = parse(input_data)
     u = default_user()
     stats = u.get_stats(2023).get((2023, 14), {})
     if stats.get("a", None) is None:
@@ -307,7 +311,7 @@ def main():
         if answer_a:
             puzzle.answer_a = answer_a
     if stats.get("b", None) is None:
-        parsed_data = parse(puzzle.input_data)
+        parsed_data = parse(input_data)
         answer_b = solve_part_two(parsed_data)
         if answer_b:
             puzzle.answer_b = answer_b
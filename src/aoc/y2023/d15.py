@@ -3,14 +3,14 @@
 # Created: 2023-12-15 08:02:57.534817
 
 # Standard library imports
-from aocd.models import Puzzle, default_user
-from rich import print
 from collections import defaultdict, deque
 
+from aoc.utils.stream import Records, open_input
+
 
 def parse(input_data):
     """Transform the data"""
-    return input_data.split(",")
+    return Records(input_data, sep=b",")
 
 
 def hash_string(input_string):
@@ -22,8 +22,10 @@ def hash_string(input_string):
     Set the current value to the remainder of dividing itself by 256.
     """
     ret = 0
+    if isinstance(input_string, str):
+        input_string = input_string.encode()
     for current_character in input_string:
-        ret = ((ret + ord(current_character)) * 17) % 256
+        ret = ((ret + current_character) * 17) % 256
     return ret
 
 
@@ -86,14 +88,15 @@ def solve_part_two(input_data):
     # keep track of focal lengths
     focal_lengths = {}
     for input_string in input_data:
-        if "=" in input_string:
-            label, focal_length = input_string.split("=")
+        input_string = bytes(input_string)
+        if b"=" in input_string:
+            label, focal_length = input_string.split(b"=")
             label_hash = hash_string(label)
             focal_lengths[label] = int(focal_length)
             if label not in light_boxes[label_hash]:
                 light_boxes[label_hash].append(label)
-        if "-" in input_string:
-            label, focal_length = input_string.split("-")
+        if b"-" in input_string:
+            label, focal_length = input_string.split(b"-")
             label_hash = hash_string(label)
             if label in light_boxes[label_hash]:
                 light_boxes[label_hash].remove(label)
@@ -107,8 +110,11 @@ def solve_part_two(input_data):
 
 
 def main():
+    from aocd.models import Puzzle, default_user
+
     puzzle = Puzzle(year=2023, day=15)
-    parsed_data = parse(puzzle.input_data)
+    input_data = open_input(2023, 15, allow_fetch=True)
+    parsed_data = parse(input_data)
     u = default_user()
     stats = u.get_stats(2023).get((2023, 15), {})
     if stats.get("a", None) is None:
@@ -116,7 +122,7 @@ def main():
         if answer_a:
             puzzle.answer_a = answer_a
     if stats.get("b", None) is None:
-        parsed_data = parse(puzzle.input_data)
+        parsed_data = parse(input_data)
         answer_b = solve_part_two(parsed_data)
         if answer_b:
             puzzle.answer_b = answer_b
@@ -3,16 +3,32 @@
 # Created: 2023-12-18 22:00:08.851960
 
 # Standard library imports
-from aocd.models import Puzzle, default_user
-from rich import print
 from collections import deque
 
+from aoc.utils.console import print
+from aoc.utils.inputs import get_input
+
+SPLIT_VERTICAL = ord("|")
+SPLIT_HORIZONTAL = ord("-")
+MIRROR_SLASH = ord("/")
+MIRROR_BACKSLASH = ord("\\")
+
 
 class Graph:
-    def __init__(self, graph, height, width):
-        self.graph = graph
-        self.height = height
+    def __init__(self, tiles: bytes, width: int, height: int):
+        # Row-major bytes, indexing them is much faster than a dict or an array
+        self.tiles = tiles
         self.width = width
+        self.height = height
+
+    @classmethod
+    def from_text(cls, text: str) -> "Graph":
+        """Parse lines of equal length straight into row-major bytes."""
+        rows = text.rstrip().encode().splitlines()
+        width = len(rows[0])
+        if any(len(row) != width for row in rows):
+            raise ValueError("Lines have different lengths")
+        return cls(b"".join(rows), width, len(rows))
 
     def print_visited(self, visited_coords):
         """Print the graph with visited coordinates displayed"""
@@ -22,19 +38,13 @@ class Graph:
                 if (x, y) in visited_coords:
                     line.append("#")
                 else:
-                    line.append(self.graph[(x, y)])
+                    line.append(chr(self.tiles[y * self.width + x]))
             print("".join(line))
 
 
 def parse(input_data):
     """Transform the data"""
-    parsed_data = {}
-    height = len(input_data.splitlines())
-    width = len(input_data.splitlines()[0])
-    for y, row in enumerate(input_data.splitlines()):
-        for x, value in enumerate(row):
-            parsed_data[(x, y)] = value
-    return Graph(parsed_data, height, width)
+    return Graph.from_text(input_data)
 
 
 def shoot_laser(graph, start_coordinate, direction):
@@ -53,7 +63,7 @@ def shoot_laser(graph, start_coordinate, direction):
     visited_coords = {}
     delta_x, delta_y = direction
     height, width = graph.height, graph.width
-    graph = graph.graph
+    tiles = graph.tiles
     for _ in range(max_path_length):
         next_x = x + delta_x
         next_y = y + delta_y
@@ -62,13 +72,14 @@ def shoot_laser(graph, start_coordinate, direction):
             # We reached the edge of the graph
             return visited_coords, []
         visited_coords[(next_coord)] = True
-        if graph[(next_coord)] == "|" and delta_x != 0:
+        tile = tiles[next_y * width + next_x]
+        if tile == SPLIT_VERTICAL and delta_x != 0:
             # this ray is splitting
             return visited_coords, [(next_coord, (0, 1)), (next_coord, (0, -1))]
-        if graph[(next_coord)] == "-" and delta_y != 0:
+        if tile == SPLIT_HORIZONTAL and delta_y != 0:
             # this ray is splitting
             return visited_coords, [(next_coord, (-1, 0)), (next_coord, (1, 0))]
-        if graph[(next_coord)] == "/":
+        if tile == MIRROR_SLASH:
             # the ray turns
             if delta_y == 0:
                 delta_y = -delta_x
@@ -84,7 +95,7 @@ def shoot_laser(graph, start_coordinate, direction):
             #     # turn down
             #     delta_x = 0
             #     delta_y = -1
-        if graph[(next_coord)] == "\\":
+        if tile == MIRROR_BACKSLASH:
             # the ray turns
             if delta_y == 0:
                 delta_y = delta_x
@@ -154,8 +165,11 @@ def solve_part_two(input_data):
 
 
 def main():
+    from aocd.models import Puzzle, default_user
+
     puzzle = Puzzle(year=2023, day=16)
-    parsed_data = parse(puzzle.input_data)
+    input_data = get_input(2023, 16, allow_fetch=True)
+    parsed_data = parse(input_data)
     u = default_user()
     stats = u.get_stats(2023).get((2023, 16), {})
     if stats.get("a", None) is None:
@@ -163,7 +177,7 @@ def main():
         if answer_a:
             puzzle.answer_a = answer_a
     if stats.get("b", None) is None:
-        parsed_data = parse(puzzle.input_data)
+        parsed_data = parse(input_data)
         answer_b = solve_part_two(parsed_data)
         if answer_b:
             puzzle.answer_b = answer_b
@@ -2,9 +2,8 @@
 """Solutions for AoC 18, 2023."""
 # Created: 2023-12-21 22:54:39.484694
 
-# Standard library imports
-from aocd.models import Puzzle, default_user
-from rich import print
+from aoc.utils.console import print
+from aoc.utils.inputs import get_input
 
 
 def parse(input_data):
@@ -139,8 +138,11 @@ def solve_part_two(input_data):
 
 
 def main():
+    from aocd.models import Puzzle, default_user
+
     puzzle = Puzzle(year=2023, day=18)
-    parsed_data = parse(puzzle.input_data)
+    input_data = get_input(2023, 18, allow_fetch=True)
+    parsed_data = parse(input_data)
     u = default_user()
     stats = u.get_stats(2023).get((2023, 18), {})
     if stats.get("a", None) is None:
@@ -148,7 +150,7 @@ def main():
         if answer_a:
             puzzle.answer_a = answer_a
     if stats.get("b", None) is None:
-        parsed_data = parse(puzzle.input_data)
+        parsed_data = parse(input_data)
         answer_b = solve_part_two(parsed_data)
         if answer_b:
             puzzle.answer_b = answer_b
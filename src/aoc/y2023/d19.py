@@ -3,12 +3,12 @@
 # Created: 2023-12-20 22:45:04.845774
 
 # Standard library imports
-from aocd.models import Puzzle, default_user
-from rich import print
-import ast
-import re
 from collections import deque, defaultdict
 
+from aoc.utils.console import print
+from aoc.utils.inputs import get_input
+from aoc.utils.parsers import ints
+
 
 def parse(input_data):
     """Transform the data
@@ -47,11 +47,8 @@ def parse(input_data):
             parsed_rules.append((condition, target))
         workflows[name] = parsed_rules
 
-    for rating_line in ratings_in.splitlines():
-        # Replace '=' with ':' and add double quotes around keys
-        fixed_string = re.sub(r"(\w+)=", r'"\1":', rating_line)
-        part = ast.literal_eval(fixed_string.replace("=", ":"))
-        parts.append(part)
+    for ratings in ints(ratings_in, columns=4):
+        parts.append(dict(zip("xmas", ratings)))
 
     return workflows, parts
 
@@ -137,8 +134,11 @@ def solve_part_two(input_data):
 
 
 def main():
+    from aocd.models import Puzzle, default_user
+
     puzzle = Puzzle(year=2023, day=19)
-    parsed_data = parse(puzzle.input_data)
+    input_data = get_input(2023, 19, allow_fetch=True)
+    parsed_data = parse(input_data)
     u = default_user()
     stats = u.get_stats(2023).get((2023, 19), {})
     if stats.get("a", None) is None:
@@ -146,7 +146,7 @@ def main():
         if answer_a:
             puzzle.answer_a = answer_a
     if stats.get("b", None) is None:
-        parsed_data = parse(puzzle.input_data)
+        parsed_data = parse(input_data)
         answer_b = solve_part_two(parsed_data)
         if answer_b:
             puzzle.answer_b = answer_b
@@ -3,21 +3,16 @@
 # Created: 2024-12-01 11:06:52.879085
 
 # Standard library imports
-from aocd.models import Puzzle, default_user
 from collections import Counter
-from rich import print
+
+from aoc.utils.inputs import get_input
+from aoc.utils.parsers import ints
 
 
 def parse(input_data):
     """Transform the data"""
-    left_vals, right_vals = [], []
-    for line in input_data.splitlines():
-        left, right = line.split(" ")[0], line.split(" ")[-1]
-        left_vals.append(int(left))
-        right_vals.append(int(right))
-    left_vals = sorted(left_vals)
-    right_vals = sorted(right_vals)
-    return left_vals, right_vals
+    values = ints(input_data)
+    return sorted(values[::2]), sorted(values[1::2])
 
 
 def solve_part_one(input_data):
@@ -41,8 +36,11 @@ def solve_part_two(input_data):
 
 
 def main():
+    from aocd.models import Puzzle, default_user
+
     puzzle = Puzzle(year=2024, day=1)
-    parsed_data = parse(puzzle.input_data)
+    input_data = get_input(2024, 1, allow_fetch=True)
+    parsed_data = parse(input_data)
     u = default_user()
     stats = u.get_stats(2024).get((2024, 1), {})
     if stats.get("a", None) is None:
@@ -50,7 +48,7 @@ def main():
         if answer_a:
             puzzle.answer_a = answer_a
     if stats.get("b", None) is None:
-        parsed_data = parse(puzzle.input_data)
+        parsed_data = parse(input_data)
         answer_b = solve_part_two(parsed_data)
         if answer_b:
             puzzle.answer_b = answer_b
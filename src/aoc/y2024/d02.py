@@ -2,13 +2,13 @@
 """Solutions for AoC 2, 2024."""
 # Created: 2024-12-02 10:27:16.376558
 
-# Standard library imports
-from aocd.models import Puzzle, default_user
-from rich import print
+from aoc.utils.inputs import get_input
+from aoc.utils.stream import restartable
 
 
+@restartable
 def parse(input_data):
-    """Transform the data"""
+    """Transform the data, every iteration starts from the first report"""
     for line in input_data.splitlines():
         yield line.split(" ")
 
@@ -67,8 +67,11 @@ def solve_part_two(input_data):
 
 
 def main():
+    from aocd.models import Puzzle, default_user
+
     puzzle = Puzzle(year=2024, day=2)
-    parsed_data = parse(puzzle.input_data)
+    input_data = get_input(2024, 2, allow_fetch=True)
+    parsed_data = parse(input_data)
     u = default_user()
     stats = u.get_stats(2024).get((2024, 2), {})
     if stats.get("a", None) is None:
@@ -76,7 +79,6 @@ def main():
         if answer_a:
             puzzle.answer_a = answer_a
     if stats.get("b", None) is None:
-        parsed_data = parse(puzzle.input_data)
         answer_b = solve_part_two(parsed_data)
         if answer_b:
             puzzle.answer_b = answer_b
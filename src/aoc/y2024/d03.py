@@ -3,9 +3,12 @@
 # Created: 2024-12-03 05:23:39.300292
 
 # Standard library imports
-from aocd.models import Puzzle, default_user
 import re
-from rich import print
+
+from aoc.utils.stream import as_bytes, open_input
+
+MUL = re.compile(rb"mul\((\d{1,3}),(\d{1,3})\)")
+INSTRUCTION = re.compile(rb"mul\((\d{1,3}),(\d{1,3})\)|don't\(\)|do\(\)")
 
 
 def parse(input_data):
@@ -16,9 +19,7 @@ def parse(input_data):
 def solve_part_one(input_data):
     """Solve part one."""
     answer = 0
-    valid_instruction_regex = r"mul\((\d{1,3}),(\d{1,3})\)"
-    matched_instructions = re.finditer(valid_instruction_regex, input_data)
-    for match in matched_instructions:
+    for match in MUL.finditer(as_bytes(input_data)):
         left, right = int(match.group(1)), int(match.group(2))
         answer += left * right
     return answer
@@ -27,13 +28,11 @@ def solve_part_one(input_data):
 def solve_part_two(input_data):
     """Solve part two."""
     answer = 0
-    instructions_regex = r"mul\((\d{1,3}),(\d{1,3})\)|don't\(\)|do\(\)"
-    matched_instructions = re.finditer(instructions_regex, input_data)
     instructions_enabled = True
-    for match in matched_instructions:
-        if match.group() == "don't()":
+    for match in INSTRUCTION.finditer(as_bytes(input_data)):
+        if match.group() == b"don't()":
             instructions_enabled = False
-        elif match.group() == "do()":
+        elif match.group() == b"do()":
             instructions_enabled = True
         elif instructions_enabled:
             left, right = int(match.group(1)), int(match.group(2))
@@ -42,8 +41,11 @@ def solve_part_two(input_data):
 
 
 def main():
+    from aocd.models import Puzzle, default_user
+
     puzzle = Puzzle(year=2024, day=3)
-    parsed_data = parse(puzzle.input_data)
+    input_data = open_input(2024, 3, allow_fetch=True)
+    parsed_data = parse(input_data)
     u = default_user()
     stats = u.get_stats(2024).get((2024, 3), {})
     if stats.get("a", None) is None:
@@ -51,7 +53,7 @@ def main():
         if answer_a:
             puzzle.answer_a = answer_a
     if stats.get("b", None) is None:
-        parsed_data = parse(puzzle.input_data)
+        parsed_data = parse(input_data)
         answer_b = solve_part_two(parsed_data)
         if answer_b:
             puzzle.answer_b = answer_b